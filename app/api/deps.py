@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import AsyncIterator
+import math
+from typing import AsyncIterator, Awaitable, Callable
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
+from app.core.rate_limit import RateLimiter
 from app.services.auth import AuthService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/token")
@@ -29,3 +31,24 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(exc),
         ) from exc
+
+
+def rate_limit(bucket: str) -> Callable[..., Awaitable[None]]:
+    """Charge one token from the caller's ``bucket`` (see ``app.core.rate_limit``)."""
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        current_user=Depends(get_current_user),
+    ) -> None:
+        limiter: RateLimiter = request.app.state.user_limiter
+        decision = await limiter.hit(bucket, str(current_user.id))
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+                headers={"Retry-After": str(math.ceil(decision.retry_after))},
+            )
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+
+    return dependency
@@ -0,0 +1,79 @@
+"""Sparse fieldsets: ``?fields=id,amount,date`` narrows both the SELECT list and the JSON body.
+
+Routes validate the requested names against their response schema with ``parse_fields``, select
+only the matching ORM columns with ``columns_for`` and serialise the resulting rows with
+``partial_response``, which dumps them through a subset of the schema so every field keeps exactly
+the JSON form it has in the full response.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from app.core.cache import LRUCache
+
+FieldNames = Tuple[str, ...]
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated fields to return, e.g. `id,name`; only those columns are read and returned"
+)
+
+_adapters: LRUCache[Tuple[Type[BaseModel], FieldNames], TypeAdapter] = LRUCache(maxsize=256)
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[FieldNames]:
+    """Requested field names in order, or None for the full schema; unknown names are a 400."""
+    if fields is None:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field(s) {', '.join(unknown) or '(none given)'}; "
+            f"choose from {', '.join(schema.model_fields)}",
+        )
+    return names
+
+
+def columns_for(entity: Any, names: Sequence[str]) -> List[Any]:
+    """The mapped columns of ``entity`` for ``names``, skipping names that are not columns."""
+    mapped = entity.__mapper__.columns
+    return [getattr(entity, name) for name in names if name in mapped]
+
+
+def _adapter(schema: Type[BaseModel], names: FieldNames) -> TypeAdapter:
+    key = (schema, names)
+    adapter = _adapters.get(key)
+    if adapter is None:
+        partial = create_model(
+            f"{schema.__name__}Fields",
+            __base__=None,
+            __config__=schema.model_config,
+            **{name: (schema.model_fields[name].rebuild_annotation(), None) for name in names},
+        )
+        adapter = TypeAdapter(List[partial])  # type: ignore[valid-type]
+        _adapters.put(key, adapter)
+    return adapter
+
+
+def partial_response(
+    schema: Type[BaseModel],
+    names: FieldNames,
+    rows: Iterable[Any],
+    response: Optional[Response] = None,
+) -> Response:
+    """A JSON list of ``rows`` holding only ``names``, serialised as ``schema`` would.
+
+    Rows are dicts or objects with the names as attributes (SQLAlchemy ``Row`` objects).
+    Headers set on the route's injected ``response`` (``X-RateLimit-Remaining``) are kept.
+    """
+    adapter = _adapter(schema, names)
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(list(rows))),
+        media_type="application/json",
+        headers=dict(response.headers) if response is not None else None,
+    )
@@ -5,11 +5,16 @@ from fastapi import APIRouter
 from app.api.routes import (
     accounts,
     auth,
+    budgets,
     cashflow,
+    dashboard,
+    forecast,
     health,
     holdings,
+    merchant_rules,
     net_worth,
     plaid,
+    recurring,
     sync,
     transactions,
 )
@@ -19,8 +24,13 @@ api_router.include_router(health.router)
 api_router.include_router(auth.router)
 api_router.include_router(accounts.router)
 api_router.include_router(transactions.router)
+api_router.include_router(merchant_rules.router)
 api_router.include_router(holdings.router)
+api_router.include_router(dashboard.router)
 api_router.include_router(net_worth.router)
 api_router.include_router(cashflow.router)
+api_router.include_router(budgets.router)
+api_router.include_router(forecast.router)
+api_router.include_router(recurring.router)
 api_router.include_router(sync.router)
 api_router.include_router(plaid.router)
@@ -1,8 +1,13 @@
 __all__ = [
     "accounts",
     "auth",
+    "budgets",
     "cashflow",
+    "dashboard",
+    "forecast",
+    "recurring",
     "holdings",
+    "merchant_rules",
     "net_worth",
     "transactions",
     "sync",
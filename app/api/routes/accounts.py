@@ -1,35 +1,43 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.api.fields import FIELDS_DESCRIPTION, columns_for, parse_fields, partial_response
 from app.models.account import Account
 from app.models.item import Item
 from app.models.transaction import Transaction
 from app.schemas.account import AccountBase, AccountDetail
+from app.schemas.balance import AccountBalancePoint
 from app.schemas.transaction import TransactionSummary
+from app.services.analytics import AnalyticsService
+from app.services.repositories import AccountRepository
 
-router = APIRouter(prefix="/v1/accounts", tags=["accounts"])
+router = APIRouter(
+    prefix="/v1/accounts",
+    tags=["accounts"],
+    dependencies=[Depends(rate_limit("read"))],
+)
 
 
 @router.get("/", response_model=List[AccountBase])
 async def list_accounts(
+    response: Response,
+    fields: str | None = Query(default=None, description=FIELDS_DESCRIPTION),
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    stmt = (
-        select(Account)
-        .join(Item, Account.item_id == Item.id)
-        .where(Item.user_id == current_user.id)
-        .order_by(Account.name)
-    )
-    result = await session.execute(stmt)
-    accounts = result.scalars().all()
-    return accounts
+    accounts = AccountRepository(session)
+    names = parse_fields(fields, AccountBase)
+    if names:
+        rows = await accounts.list_columns_for_user(str(current_user.id), columns_for(Account, names))
+        return partial_response(AccountBase, names, rows, response)
+    return await accounts.list_for_user(str(current_user.id))
 
 
 @router.get("/{account_id}", response_model=AccountDetail)
@@ -52,7 +60,7 @@ async def get_account_detail(
 
     txn_stmt = (
         select(Transaction)
-        .where(Transaction.account_id == account_id)
+        .where(Transaction.account_id == account_id, Transaction.removed_at.is_(None))
         .order_by(Transaction.date.desc())
         .limit(limit)
     )
@@ -67,3 +75,28 @@ async def get_account_detail(
             ]
         }
     )
+
+
+@router.get("/{account_id}/balances", response_model=List[AccountBalancePoint])
+async def account_balance_history(
+    account_id: str,
+    *,
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    owned = await session.execute(
+        select(Account.id)
+        .join(Item, Account.item_id == Item.id)
+        .where(Account.id == account_id, Item.user_id == current_user.id)
+    )
+    if owned.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+
+    analytics = AnalyticsService(session)
+    return await analytics.account_balance_history(
+        account_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
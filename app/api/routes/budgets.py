@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.schemas.budget import BudgetCreate, BudgetProgress
+from app.services.repositories import BudgetRepository
+
+router = APIRouter(
+    prefix="/v1/budgets",
+    tags=["analytics"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+def _progress(row, month: date) -> BudgetProgress:
+    spent = row.spent
+    return BudgetProgress(
+        id=row.id,
+        category=row.category,
+        month=month,
+        monthly_limit=row.monthly_limit,
+        spent=spent,
+        remaining=row.monthly_limit - spent,
+        percent_used=round(float(spent / row.monthly_limit) * 100, 1),
+        transaction_count=row.transaction_count,
+    )
+
+
+@router.get("/", response_model=List[BudgetProgress])
+async def list_budgets(
+    *,
+    month: date | None = Query(default=None, description="Any day in the month; defaults to this month"),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    month = (month or date.today()).replace(day=1)
+    rows = await BudgetRepository(session).progress(str(current_user.id), month)
+    return [_progress(row, month) for row in rows]
+
+
+@router.put("/", response_model=BudgetProgress)
+async def upsert_budget(
+    payload: BudgetCreate,
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Create or replace the monthly limit for ``category``; returns this month's progress."""
+    repo = BudgetRepository(session)
+    budget = await repo.upsert(
+        str(current_user.id),
+        category=payload.category,
+        monthly_limit=payload.monthly_limit,
+    )
+    month = date.today().replace(day=1)
+    rows = await repo.progress(str(current_user.id), month)
+    return next(_progress(row, month) for row in rows if row.id == budget.id)
+
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_budget(
+    budget_id: str,
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    if not await BudgetRepository(session).delete(str(current_user.id), budget_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -5,11 +5,16 @@ from datetime import date
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
 from app.schemas.analytics import CashflowResponse
 from app.services.analytics import AnalyticsService
+from app.services.fx import base_currency_of
 
-router = APIRouter(prefix="/v1/cashflow", tags=["analytics"])
+router = APIRouter(
+    prefix="/v1/cashflow",
+    tags=["analytics"],
+    dependencies=[Depends(rate_limit("read"))],
+)
 
 
 @router.get("/summary", response_model=CashflowResponse)
@@ -25,6 +30,7 @@ async def cashflow_summary(
         str(current_user.id),
         start_date=start_date,
         end_date=end_date,
+        base_currency=base_currency_of(current_user.profile),
     )
 
     net = summary.inflow - summary.outflow
@@ -34,4 +40,6 @@ async def cashflow_summary(
         inflow=summary.inflow,
         outflow=summary.outflow,
         net=net,
+        currency=summary.currency,
+        unconverted_currencies=summary.unconverted_currencies,
     )
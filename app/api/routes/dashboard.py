@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.api.routes.holdings import summary_response
+from app.schemas.account import AccountBase
+from app.schemas.analytics import CashflowResponse, NetWorthResponse
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard import DashboardService
+from app.services.fx import base_currency_of
+
+router = APIRouter(
+    prefix="/v1/dashboard",
+    tags=["analytics"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+@router.get("/", response_model=DashboardResponse)
+async def get_dashboard(
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Accounts, net worth, 30-day cashflow and holdings summary in one round trip."""
+    dashboard = await DashboardService(session).dashboard(
+        str(current_user.id),
+        base_currency=base_currency_of(current_user.profile),
+    )
+    net_worth, cashflow = dashboard.net_worth, dashboard.cashflow
+    return DashboardResponse(
+        accounts=[AccountBase.model_validate(account) for account in dashboard.accounts],
+        net_worth=NetWorthResponse(
+            net_worth=net_worth.net_worth,
+            assets=net_worth.assets,
+            liabilities=net_worth.liabilities,
+            currency=net_worth.currency,
+            unconverted_currencies=net_worth.unconverted_currencies,
+        ),
+        cashflow=CashflowResponse(
+            start_date=cashflow.start_date,
+            end_date=cashflow.end_date,
+            inflow=cashflow.inflow,
+            outflow=cashflow.outflow,
+            net=cashflow.inflow - cashflow.outflow,
+            currency=cashflow.currency,
+            unconverted_currencies=cashflow.unconverted_currencies,
+        ),
+        holdings=summary_response(dashboard.holdings),
+    )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.core.compression import precompressed_json
+from app.schemas.analytics import ForecastPoint, ForecastResponse
+from app.services.forecast import ForecastService
+
+router = APIRouter(
+    prefix="/v1/forecast",
+    tags=["analytics"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+@router.get("/", response_model=ForecastResponse)
+async def cash_forecast(
+    request: Request,
+    response: Response,
+    *,
+    days: int = Query(default=60, ge=1, le=365),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Projected daily liquid balance; recomputed only after the user's next sync."""
+    user_id = str(current_user.id)
+    forecasts = ForecastService(session)
+
+    async def render() -> ForecastResponse:
+        forecast = await forecasts.forecast(user_id, days=days)
+        lowest = min(forecast.points, key=lambda point: point.balance, default=None)
+        return ForecastResponse(
+            start_date=forecast.start_date,
+            days=days,
+            starting_balance=forecast.starting_balance,
+            daily_discretionary_spend=forecast.daily_discretionary_spend,
+            lowest_balance=lowest.balance if lowest else None,
+            lowest_balance_date=lowest.date if lowest else None,
+            points=[ForecastPoint.model_validate(point) for point in forecast.points],
+        )
+
+    version = await forecasts.analytics.data_version(user_id)
+    return await precompressed_json(request, response, (user_id, version, date.today()), render)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_user
+from app.services.plaid import plaid_service
 
 router = APIRouter(tags=["health"])
 
@@ -8,3 +11,9 @@ router = APIRouter(tags=["health"])
 @router.get("/health", include_in_schema=False)
 async def healthcheck():
     return {"status": "ok"}
+
+
+@router.get("/health/plaid", include_in_schema=False, dependencies=[Depends(get_current_user)])
+async def plaid_governor_metrics():
+    """Current Plaid concurrency limit, pacing rates and per-endpoint retry counters."""
+    return plaid_service.governor.metrics()
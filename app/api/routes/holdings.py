@@ -1,29 +1,69 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import asdict
+from datetime import date
+from decimal import Decimal
+from typing import List, Sequence
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.api.fields import FIELDS_DESCRIPTION, columns_for, parse_fields, partial_response
+from app.core.compression import precompressed_json
 from app.models.account import Account
 from app.models.holding import Holding
 from app.models.item import Item
 from app.models.security import Security
-from app.schemas.holding import HoldingSummary
+from app.schemas.holding import (
+    HoldingsGroupSummary,
+    HoldingsSummaryResponse,
+    HoldingSummary,
+    PortfolioValuePoint,
+)
 from app.schemas.security import SecuritySummary
+from app.services.analytics import AnalyticsService, HoldingsGroup, HoldingsSummary
 
-router = APIRouter(prefix="/v1/holdings", tags=["holdings"])
+router = APIRouter(
+    prefix="/v1/holdings",
+    tags=["holdings"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+_SECURITY_COLUMNS = columns_for(Security, list(SecuritySummary.model_fields))
+
+
+def _partial_holding(row: Row, names: Sequence[str]) -> dict:
+    values = row._asdict()
+    if "security" in names:
+        values["security"] = {
+            column.key: values.pop(f"security__{column.key}") for column in _SECURITY_COLUMNS
+        }
+    return values
 
 
 @router.get("/", response_model=List[HoldingSummary])
 async def list_holdings(
+    response: Response,
+    fields: str | None = Query(
+        default=None,
+        description=f"{FIELDS_DESCRIPTION}. `security` returns the whole nested security",
+    ),
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
+    names = parse_fields(fields, HoldingSummary)
+    if names:
+        entities = columns_for(Holding, names)
+        if "security" in names:
+            entities += [column.label(f"security__{column.key}") for column in _SECURITY_COLUMNS]
+    else:
+        entities = [Holding, Security]
     stmt = (
-        select(Holding, Security)
+        select(*entities)
+        .select_from(Holding)
         .join(Account, Holding.account_id == Account.id)
         .join(Item, Account.item_id == Item.id)
         .join(Security, Holding.security_id == Security.id)
@@ -31,6 +71,9 @@ async def list_holdings(
         .order_by(Security.ticker_symbol)
     )
     result = await session.execute(stmt)
+    if names:
+        rows = (_partial_holding(row, names) for row in result)
+        return partial_response(HoldingSummary, names, rows, response)
 
     holdings: list[HoldingSummary] = []
     for holding, security in result:
@@ -40,3 +83,58 @@ async def list_holdings(
             holding_model.model_copy(update={"security": security_model})
         )
     return holdings
+
+
+@router.get("/history", response_model=List[PortfolioValuePoint])
+async def portfolio_history(
+    *,
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    analytics = AnalyticsService(session)
+    history = await analytics.portfolio_history(
+        str(current_user.id),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return [PortfolioValuePoint(as_of_date=as_of, value=value) for as_of, value in history]
+
+
+def _group_summary(group: HoldingsGroup, total: Decimal) -> HoldingsGroupSummary:
+    return HoldingsGroupSummary(
+        **asdict(group),
+        unrealized_gain_percent=(
+            round(float(group.unrealized_gain / group.cost_basis) * 100, 2) if group.cost_basis else None
+        ),
+        allocation_percent=round(float(group.market_value / total) * 100, 2) if total else 0.0,
+    )
+
+
+def summary_response(summary: HoldingsSummary) -> HoldingsSummaryResponse:
+    total = summary.total.market_value
+    return HoldingsSummaryResponse(
+        total=_group_summary(summary.total, total),
+        by_type=[_group_summary(group, total) for group in summary.by_type],
+        by_security=[_group_summary(group, total) for group in summary.by_security],
+        by_account=[_group_summary(group, total) for group in summary.by_account],
+    )
+
+
+@router.get("/summary", response_model=HoldingsSummaryResponse)
+async def holdings_summary(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Market value, cost basis and unrealized gain by security type, security and account."""
+    user_id = str(current_user.id)
+    analytics = AnalyticsService(session)
+
+    async def render() -> HoldingsSummaryResponse:
+        return summary_response(await analytics.holdings_summary(user_id))
+
+    version = await analytics.data_version(user_id)
+    return await precompressed_json(request, response, (user_id, version), render)
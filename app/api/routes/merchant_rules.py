@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.schemas.merchant_rule import MerchantRuleCreate, MerchantRuleRead
+from app.services.repositories import MerchantRuleRepository
+
+router = APIRouter(
+    prefix="/v1/merchant-rules",
+    tags=["transactions"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+@router.get("/", response_model=List[MerchantRuleRead])
+async def list_merchant_rules(
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    return await MerchantRuleRepository(session).list(str(current_user.id))
+
+
+@router.put("/", response_model=MerchantRuleRead)
+async def upsert_merchant_rule(
+    payload: MerchantRuleCreate,
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Create or replace the rule for ``pattern``; it applies to transactions ingested from now on."""
+    return await MerchantRuleRepository(session).upsert(
+        str(current_user.id),
+        pattern=payload.pattern,
+        merchant=payload.merchant,
+        category=payload.category,
+    )
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_merchant_rule(
+    rule_id: str,
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    if not await MerchantRuleRepository(session).delete(str(current_user.id), rule_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Merchant rule not found")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
 from app.schemas.analytics import NetWorthHistoryPoint, NetWorthResponse
+from app.schemas.balance import BalanceBreakdownPoint
 from app.services.analytics import AnalyticsService
+from app.services.fx import base_currency_of
 
-router = APIRouter(prefix="/v1/net-worth", tags=["analytics"])
+router = APIRouter(
+    prefix="/v1/net-worth",
+    tags=["analytics"],
+    dependencies=[Depends(rate_limit("read"))],
+)
 
 
 @router.get("/", response_model=NetWorthResponse)
@@ -16,7 +25,10 @@ async def get_net_worth(
     current_user=Depends(get_current_user),
 ):
     analytics = AnalyticsService(session)
-    summary = await analytics.net_worth(str(current_user.id))
+    summary = await analytics.net_worth(
+        str(current_user.id),
+        base_currency=base_currency_of(current_user.profile),
+    )
     history = await analytics.recent_net_worth(str(current_user.id))
 
     history_points = [
@@ -31,5 +43,55 @@ async def get_net_worth(
         net_worth=summary.net_worth,
         assets=summary.assets,
         liabilities=summary.liabilities,
+        currency=summary.currency,
+        unconverted_currencies=summary.unconverted_currencies,
         history=history_points,
     )
+
+
+@router.get("/history", response_model=List[NetWorthHistoryPoint])
+async def net_worth_history(
+    *,
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    points: int = Query(default=200, ge=2, le=1_000),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Net worth downsampled to at most ``points`` dates, carrying values across days without a sync."""
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+    analytics = AnalyticsService(session)
+    history = await analytics.net_worth_history(
+        str(current_user.id),
+        start_date=start_date,
+        end_date=end_date,
+        points=points,
+    )
+    return [NetWorthHistoryPoint(as_of_date=day, net_worth=value) for day, value in history]
+
+
+@router.get("/breakdown", response_model=List[BalanceBreakdownPoint])
+async def net_worth_breakdown(
+    *,
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    analytics = AnalyticsService(session)
+    history = await analytics.balance_breakdown_history(
+        str(current_user.id),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return [
+        BalanceBreakdownPoint(
+            as_of_date=point.as_of_date,
+            liquid_assets=point.liquid_assets,
+            investments=point.investments,
+            liabilities=point.liabilities,
+            net_worth=point.liquid_assets + point.investments - point.liabilities,
+        )
+        for point in history
+    ]
@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
 from app.core.security import encrypt_string
 from app.core.settings import settings
 from app.models.item import Item
@@ -39,7 +39,10 @@ class SandboxPublicTokenResponse(BaseModel):
     public_token: str
 
 
-@router.post("/link-token", response_model=LinkTokenResponse)
+@router.post(
+    "/link-token", response_model=LinkTokenResponse,
+    dependencies=[Depends(rate_limit("expensive"))],
+)
 async def create_link_token(
     payload: LinkTokenRequest,
     session: AsyncSession = Depends(get_db_session),
@@ -56,7 +59,10 @@ class PublicTokenExchangeRequest(BaseModel):
     institution_name: str | None = None
 
 
-@router.post("/item/public-token/exchange")
+@router.post(
+    "/item/public-token/exchange",
+    dependencies=[Depends(rate_limit("expensive"))],
+)
 async def exchange_public_token(
     payload: PublicTokenExchangeRequest,
     session: AsyncSession = Depends(get_db_session),
@@ -78,7 +84,10 @@ async def exchange_public_token(
     return {"status": "linked"}
 
 
-@router.post("/sandbox/public-token", response_model=SandboxPublicTokenResponse)
+@router.post(
+    "/sandbox/public-token", response_model=SandboxPublicTokenResponse,
+    dependencies=[Depends(rate_limit("expensive"))],
+)
 async def create_sandbox_public_token(
     payload: SandboxPublicTokenRequest,
     current_user=Depends(get_current_user),
@@ -93,7 +102,11 @@ async def create_sandbox_public_token(
     return SandboxPublicTokenResponse(public_token=token)
 
 
-@router.get("/items", response_model=list[ItemRead])
+@router.get(
+    "/items",
+    response_model=list[ItemRead],
+    dependencies=[Depends(rate_limit("read"))],
+)
 async def list_items(
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
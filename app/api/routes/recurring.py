@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.models.recurring_series import RecurringSeries
+from app.schemas.recurring import RecurringSeriesRead
+
+router = APIRouter(
+    prefix="/v1/recurring",
+    tags=["analytics"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+@router.get("/", response_model=List[RecurringSeriesRead])
+async def list_recurring(
+    *,
+    direction: Literal["inflow", "outflow"] | None = Query(default=None),
+    include_inactive: bool = Query(default=False),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """Subscriptions, bills and regular deposits detected at the last sync."""
+    stmt = select(RecurringSeries).where(RecurringSeries.user_id == current_user.id)
+    if direction:
+        stmt = stmt.where(RecurringSeries.direction == direction)
+    if not include_inactive:
+        stmt = stmt.where(RecurringSeries.is_active.is_(True))
+    stmt = stmt.order_by(RecurringSeries.next_expected_date, RecurringSeries.merchant)
+    result = await session.execute(stmt)
+    return result.scalars().all()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import asdict
+
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
 from app.models.item import Item
 from app.services.sync import SyncOrchestrator
 
@@ -16,7 +18,7 @@ class SyncTriggerRequest(BaseModel):
     item_id: str
 
 
-@router.post("/trigger")
+@router.post("/trigger", dependencies=[Depends(rate_limit("expensive"))])
 async def trigger_sync(
     payload: SyncTriggerRequest,
     background: BackgroundTasks,
@@ -30,7 +32,11 @@ async def trigger_sync(
     orchestrator = SyncOrchestrator(session)
     # Run synchronously for now; background tasks require independent session handling.
     result = await orchestrator.run_item_sync(item)
-    return {"status": "ok", "synced_transactions": result.transactions_synced}
+    return {
+        "status": "ok",
+        "synced_transactions": result.transactions_synced,
+        "holdings": asdict(result.holdings_diff) if result.holdings_diff else None,
+    }
 
 
 class PlaidWebhook(BaseModel):
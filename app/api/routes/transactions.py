@@ -1,23 +1,64 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import List, Optional
+import base64
+import re
+import uuid
+from datetime import date, timedelta
+from typing import Any, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Float, and_, any_, bindparam, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db_session
+from app.api.deps import get_current_user, get_db_session, rate_limit
+from app.api.fields import FIELDS_DESCRIPTION, columns_for, parse_fields, partial_response
 from app.models.account import Account
 from app.models.item import Item
 from app.models.transaction import Transaction
-from app.schemas.transaction import TransactionSummary
+from app.schemas.transaction import (
+    TransactionSearchHit,
+    TransactionSearchResponse,
+    TransactionSummary,
+)
 
-router = APIRouter(prefix="/v1/transactions", tags=["transactions"])
+router = APIRouter(
+    prefix="/v1/transactions",
+    tags=["transactions"],
+    dependencies=[Depends(rate_limit("read"))],
+)
+
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+# Date-sorted search looks this far back from the newest candidate before widening (None: all).
+_SEARCH_WINDOWS = (timedelta(days=31), timedelta(days=184), timedelta(days=731), None)
+
+
+def _prefix_query(q: str) -> str:
+    """``whole fo`` -> ``whole:* & fo:*``; tokens are word characters only, so always valid."""
+    return " & ".join(f"{token}:*" for token in _SEARCH_TOKEN.findall(q.lower()))
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: str) -> List[Any]:
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if sort == "relevance":
+            rank, as_of, txn_id = values
+            return [float(rank), date.fromisoformat(as_of), uuid.UUID(txn_id)]
+        as_of, txn_id = values
+        return [date.fromisoformat(as_of), uuid.UUID(txn_id)]
+    except (ValueError, TypeError, orjson.JSONDecodeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
 
 
 @router.get("/", response_model=List[TransactionSummary])
 async def list_transactions(
+    response: Response,
     *,
     start_date: Optional[date] = Query(default=None),
     end_date: Optional[date] = Query(default=None),
@@ -25,14 +66,16 @@ async def list_transactions(
     include_pending: bool = Query(default=True),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
+    names = parse_fields(fields, TransactionSummary)
     stmt = (
-        select(Transaction)
+        select(*(columns_for(Transaction, names) if names else [Transaction]))
         .join(Account, Transaction.account_id == Account.id)
         .join(Item, Account.item_id == Item.id)
-        .where(Item.user_id == current_user.id)
+        .where(Item.user_id == current_user.id, Transaction.removed_at.is_(None))
         .order_by(Transaction.date.desc(), Transaction.created_at.desc())
         .limit(limit)
         .offset(offset)
@@ -52,5 +95,100 @@ async def list_transactions(
         stmt = stmt.where(and_(*conditions))
 
     result = await session.execute(stmt)
+    if names:
+        return partial_response(TransactionSummary, names, result, response)
     transactions = result.scalars().all()
     return [TransactionSummary.model_validate(txn, from_attributes=True) for txn in transactions]
+
+
+@router.get("/search", response_model=TransactionSearchResponse)
+async def search_transactions(
+    *,
+    q: str = Query(min_length=1, max_length=200, description="Words to match in merchant or name"),
+    start_date: Optional[date] = Query(default=None),
+    end_date: Optional[date] = Query(default=None),
+    account_id: Optional[str] = Query(default=None),
+    sort: Literal["date", "relevance"] = Query(default="date"),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    terms = _prefix_query(q)
+    if not terms:
+        return TransactionSearchResponse()
+
+    # Resolving the user's accounts up front keeps the search a single-table query.
+    accounts_stmt = (
+        select(Account.id).join(Item, Account.item_id == Item.id).where(Item.user_id == current_user.id)
+    )
+    if account_id:
+        accounts_stmt = accounts_stmt.where(Account.id == account_id)
+    account_ids = list((await session.execute(accounts_stmt)).scalars())
+    if not account_ids:
+        return TransactionSearchResponse()
+
+    query = func.to_tsquery(literal_column("'simple'"), terms)
+    rank = func.ts_rank(Transaction.search_vector, query)
+    conditions = [
+        Transaction.search_vector.op("@@")(query),
+        Transaction.account_id == any_(bindparam("account_ids", account_ids, type_=ARRAY(UUID))),
+        Transaction.removed_at.is_(None),
+    ]
+    if end_date:
+        conditions.append(Transaction.date <= end_date)
+
+    keyset = [Transaction.date, Transaction.id]
+    if sort == "relevance":
+        keyset.insert(0, rank)
+    anchor = end_date or date.today()
+    if cursor:
+        after = _decode_cursor(cursor, sort)
+        if sort == "relevance":
+            after[0] = bindparam("cursor_rank", after[0], type_=Float)
+        else:
+            anchor = min(anchor, after[0])
+        conditions.append(tuple_(*keyset) < tuple_(*after))
+
+    # Matches are collected through the GIN index and only then sorted; left to itself the planner
+    # walks the date index newest-first, which is fast for common words and a full scan for rare
+    # ones. Date order probes growing windows back from the anchor so a common word sorts only a
+    # month of matches; relevance has to rank every match.
+    windows = _SEARCH_WINDOWS if sort == "date" else (None,)
+    for window in windows:
+        lower = start_date
+        if window is not None:
+            lower = max(start_date or date.min, anchor - window)
+        window_conditions = conditions + ([Transaction.date >= lower] if lower else [])
+        matches = (
+            select(*(column.label(f"k{index}") for index, column in enumerate(keyset)))
+            .where(*window_conditions)
+            .cte("matches")
+            .prefix_with("MATERIALIZED")
+        )
+        page = (
+            select(matches)
+            .order_by(*(column.desc() for column in matches.c))
+            .limit(limit + 1)
+            .subquery("page")
+        )
+        *_, page_date, page_id = page.c
+        stmt = (
+            select(Transaction, rank.label("rank"))
+            .join(page, and_(Transaction.date == page_date, Transaction.id == page_id))
+            .order_by(*(column.desc() for column in page.c))
+        )
+        rows = (await session.execute(stmt)).all()
+        if len(rows) > limit or window is None or lower == start_date:
+            break
+
+    hits = [
+        TransactionSearchHit.model_validate(txn, from_attributes=True).model_copy(update={"rank": score})
+        for txn, score in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last, score = rows[limit - 1]
+        values: List[Any] = [last.date.isoformat(), str(last.id)]
+        next_cursor = _encode_cursor([score, *values] if sort == "relevance" else values)
+    return TransactionSearchResponse(results=hits, next_cursor=next_cursor)
@@ -0,0 +1,178 @@
+"""Response compression: ``Accept-Encoding`` negotiation, a buffering ASGI middleware and stored
+precompressed bodies for responses that only change when the user's data version does.
+
+Brotli is offered when the optional ``brotli`` package is installed (the ``brotli`` extra) and
+wins over gzip at equal ``q``; gzip otherwise. Bodies under ``COMPRESSION_MIN_SIZE`` bytes go out
+as they are: below about a kilobyte the bytes saved do not pay for the CPU. On this API's JSON,
+brotli quality 4 compresses about as fast as gzip level 6 and 10-30% smaller.
+
+Per-request compression uses those fast settings. Bodies stored with ``precompressed_json`` are
+compressed once per data version and encoding, so they use the slowest, smallest settings and
+every repeat request skips serialisation and compression entirely. Compression always runs in
+the threadpool (zlib and brotli release the GIL): brotli 11 takes ~200 ms on a large body, and
+other requests must not wait on the event loop meanwhile.
+"""
+
+from __future__ import annotations
+
+import gzip
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import LRUCache
+from app.core.settings import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional extra
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Levels for stored bodies, whose one-off cost is shared by every request until the next sync.
+STORED_GZIP_LEVEL = 9
+STORED_BROTLI_QUALITY = 11
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Supported encodings in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """The encoding to use for a request's ``Accept-Encoding``, or None for identity."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        if token.strip():
+            weights[token.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for encoding in available_encodings():
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str, *, stored: bool = False) -> bytes:
+    if encoding == "br":
+        quality = STORED_BROTLI_QUALITY if stored else settings.api.compression_brotli_quality
+        return brotli.compress(body, quality=quality)
+    level = STORED_GZIP_LEVEL if stored else settings.api.compression_gzip_level
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _compressible(headers: Headers) -> bool:
+    return "content-encoding" not in headers and headers.get("content-type", "").startswith(
+        COMPRESSIBLE_TYPES
+    )
+
+
+class CompressionMiddleware:
+    """Compresses JSON/text responses of at least ``minimum_size`` bytes.
+
+    The body is buffered until its last chunk (``BaseHTTPMiddleware`` always delivers it in
+    several), which suits this API's bounded JSON responses. Responses that already carry
+    ``Content-Encoding``, such as ``precompressed_json``, pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1_024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = None
+        if scope["type"] == "http":
+            encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+        chunks: List[bytes] = []
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                passthrough = not _compressible(Headers(raw=message["headers"]))
+                if passthrough:
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            headers = MutableHeaders(raw=start["headers"])
+            if len(body) >= self.minimum_size:
+                body = await run_in_threadpool(compress, body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+@dataclass(slots=True)
+class _StoredBody:
+    identity: bytes
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    async def encode(self, encoding: str) -> bytes:
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = await run_in_threadpool(compress, self.identity, encoding, stored=True)
+            self.encoded[encoding] = body
+        return body
+
+
+_stored_bodies: LRUCache[Hashable, _StoredBody] = LRUCache(
+    maxsize=settings.api.compression_cache_size
+)
+
+
+async def precompressed_json(
+    request: Request,
+    response: Response,
+    key: Hashable,
+    render: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """``render()`` as JSON, stored with its compressed forms until ``key`` changes.
+
+    ``key`` must identify everything the body depends on besides the request path and query,
+    typically (user id, data version). ``response`` is the route's injected response; headers
+    dependencies set on it (``X-RateLimit-Remaining``) are carried over.
+    """
+    cache_key = (request.url.path, request.url.query, key)
+    stored = _stored_bodies.get(cache_key)
+    if stored is None:
+        stored = _StoredBody((await render()).model_dump_json().encode())
+        _stored_bodies.put(cache_key, stored)
+    headers = {**response.headers, "Vary": "Accept-Encoding"}
+    body = stored.identity
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding is not None and len(body) >= settings.api.compression_min_size:
+        body = await stored.encode(encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,154 @@
+"""Monthly range partitions for tables declared ``postgresql_partition_by="RANGE (date)"``.
+
+Each month lives in ``<table>_pYYYY_MM`` covering ``[first of month, first of next month)``. A
+``<table>_default`` partition catches dates outside the managed window (very old history, or a
+month the maintenance job has not reached yet) so inserts never fail for lack of a partition.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, List
+
+from loguru import logger
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.settings import settings
+
+
+def month_floor(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def partition_window(today: date, *, months_back: int, months_ahead: int) -> List[date]:
+    """First-of-month dates from ``months_back`` before ``today``'s month to ``months_ahead`` on."""
+    current = month_floor(today)
+    return [add_months(current, offset) for offset in range(-months_back, months_ahead + 1)]
+
+
+def default_window(today: date | None = None) -> List[date]:
+    """The managed window: the initial sync backfill through ``PARTITION_MONTHS_AHEAD``."""
+    return partition_window(
+        today or date.today(),
+        months_back=settings.scheduler.initial_backfill_days // 30 + 1,
+        months_ahead=settings.scheduler.partition_months_ahead,
+    )
+
+
+def _bounds(month: date) -> str:
+    return f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def create_initial_partitions(target: Table, connection: Connection, **_: Any) -> None:
+    """``after_create`` hook: the table is empty, so every partition can be created directly."""
+    table = target.name
+    statements = [f'CREATE TABLE "{default_partition_name(table)}" PARTITION OF "{table}" DEFAULT']
+    statements += [
+        f'CREATE TABLE "{partition_name(table, month)}" PARTITION OF "{table}" '
+        f"FOR VALUES {_bounds(month)}"
+        for month in default_window()
+    ]
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def spilled_partition_statements(
+    table: str,
+    name: str,
+    month: date,
+    in_range: str,
+    columns: List[str],
+) -> List[str]:
+    """Statements that move ``month``'s rows out of the default partition into ``name``.
+
+    ``INCLUDING GENERATED`` keeps generated columns (``transactions.search_vector``) generated,
+    which ``ATTACH PARTITION`` requires; ``columns`` must leave them out because they cannot be
+    written, and the new table computes them again as the rows arrive.
+    """
+    default = default_partition_name(table)
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    return [
+        f'CREATE TABLE "{name}" '
+        f'(LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)',
+        f'WITH moved AS (DELETE FROM "{default}" WHERE {in_range} RETURNING {column_list}) '
+        f'INSERT INTO "{name}" ({column_list}) SELECT {column_list} FROM moved',
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" FOR VALUES {_bounds(month)}',
+    ]
+
+
+async def _writable_columns(conn: AsyncConnection, table: str) -> List[str]:
+    result = await conn.execute(
+        text(
+            "SELECT attname FROM pg_attribute "
+            "WHERE attrelid = CAST(:table AS regclass) AND attnum > 0 "
+            "AND NOT attisdropped AND attgenerated = '' ORDER BY attnum"
+        ),
+        {"table": table},
+    )
+    return list(result.scalars())
+
+
+async def ensure_monthly_partitions(
+    conn: AsyncConnection,
+    table: str,
+    months: List[date],
+    *,
+    column: str = "date",
+) -> List[str]:
+    """Create any missing partitions for ``months``; returns the names created.
+
+    A month whose rows already landed in the default partition cannot be created with
+    ``PARTITION OF`` (Postgres rejects it), so those rows are moved into a fresh table that is
+    then attached. Run it inside one transaction so a failure leaves the default intact.
+    """
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    )
+    existing = set(result.scalars())
+    default = default_partition_name(table)
+    created: List[str] = []
+    for month in months:
+        name = partition_name(table, month)
+        if name in existing:
+            continue
+        upper = add_months(month, 1)
+        in_range = f"\"{column}\" >= '{month.isoformat()}' AND \"{column}\" < '{upper.isoformat()}'"
+        spilled = False
+        if default in existing:
+            probe = text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {in_range})')
+            spilled = (await conn.execute(probe)).scalar_one()
+        if spilled:
+            columns = await _writable_columns(conn, table)
+            for statement in spilled_partition_statements(table, name, month, in_range, columns):
+                await conn.execute(text(statement))
+        else:
+            await conn.execute(
+                text(f'CREATE TABLE "{name}" PARTITION OF "{table}" FOR VALUES {_bounds(month)}')
+            )
+        logger.info(
+            "Created partition {name}{moved}",
+            name=name,
+            moved=" (moved rows out of the default partition)" if spilled else "",
+        )
+        created.append(name)
+    return created
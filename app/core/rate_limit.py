@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Protocol, Tuple
+
+from app.core.settings import settings
+
+_PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+
+@dataclass(frozen=True, slots=True)
+class BucketConfig:
+    """``capacity`` tokens that refill continuously at ``refill_per_sec``."""
+
+    capacity: float
+    refill_per_sec: float
+
+    @classmethod
+    def parse(cls, value: str) -> "BucketConfig":
+        """Parse ``"120/minute"`` (burst of 120) or ``"10/hour;burst=3"``."""
+        rate, _, options = value.partition(";")
+        amount, _, period = rate.strip().partition("/")
+        period = period.strip().rstrip("s")
+        if period not in _PERIODS:
+            raise ValueError(f"Unsupported rate limit period in {value!r}")
+        tokens = float(amount)
+        capacity = tokens
+        for option in filter(None, (part.strip() for part in options.split(";"))):
+            key, _, raw = option.partition("=")
+            if key.strip() != "burst":
+                raise ValueError(f"Unsupported rate limit option {option!r}")
+            capacity = float(raw)
+        if tokens <= 0 or capacity <= 0:
+            raise ValueError(f"Rate limit must be positive: {value!r}")
+        return cls(capacity=capacity, refill_per_sec=tokens / _PERIODS[period])
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimitStorage(Protocol):
+    async def acquire(self, key: str, bucket: BucketConfig, cost: float = 1.0) -> RateLimitDecision:
+        ...
+
+
+class InMemoryRateLimitStorage:
+    """Per-process buckets. Check-and-update never awaits, so it is atomic on the event loop.
+
+    Past ``max_keys`` only buckets that have refilled completely are evicted: they hold exactly
+    the state a new bucket starts with, so dropping one never hands a throttled user a fresh
+    allowance. When none have refilled the map grows (keys are per user, so it stays bounded)
+    and the next sweep waits until another tenth of ``max_keys`` has been added.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        # key -> (tokens, updated, monotonic time the bucket is full again)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._sweep_at = max_keys
+
+    async def acquire(self, key: str, bucket: BucketConfig, cost: float = 1.0) -> RateLimitDecision:
+        return self.acquire_nowait(key, bucket, cost)
+
+    def acquire_nowait(self, key: str, bucket: BucketConfig, cost: float = 1.0) -> RateLimitDecision:
+        now = time.monotonic()
+        state = self._buckets.get(key)
+        if state is None:
+            if len(self._buckets) >= self._sweep_at:
+                self._evict_full(now)
+            tokens = bucket.capacity
+        else:
+            tokens = min(bucket.capacity, state[0] + (now - state[1]) * bucket.refill_per_sec)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        full_at = now + (bucket.capacity - tokens) / bucket.refill_per_sec
+        self._buckets[key] = (tokens, now, full_at)
+        if allowed:
+            return RateLimitDecision(True, int(tokens), 0.0)
+        return RateLimitDecision(False, int(tokens), (cost - tokens) / bucket.refill_per_sec)
+
+    def _evict_full(self, now: float) -> None:
+        full = [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]
+        for key in full:
+            del self._buckets[key]
+        self._sweep_at = max(self.max_keys, len(self._buckets) + self.max_keys // 10)
+
+
+# KEYS[1] bucket key; ARGV: capacity, refill_per_sec, cost. Uses the Redis clock so every
+# worker agrees on "now", and runs as one script so check-and-update is atomic.
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local refill = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1])
+if tokens == nil then
+  tokens = capacity
+else
+  tokens = math.min(capacity, tokens + (now - tonumber(state[2])) * refill)
+end
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitStorage:
+    """Buckets shared by every worker and replica; requires the optional ``redis`` package."""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:") -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' extra") from exc
+        self.prefix = prefix
+        self._client = Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def acquire(self, key: str, bucket: BucketConfig, cost: float = 1.0) -> RateLimitDecision:
+        allowed, tokens = await self._script(
+            keys=[self.prefix + key],
+            args=[bucket.capacity, bucket.refill_per_sec, cost],
+        )
+        remaining = float(tokens)
+        if allowed:
+            return RateLimitDecision(True, int(remaining), 0.0)
+        return RateLimitDecision(False, int(remaining), (cost - remaining) / bucket.refill_per_sec)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        buckets: Dict[str, BucketConfig],
+        storage: RateLimitStorage,
+        *,
+        enabled: bool = True,
+    ) -> None:
+        self.buckets = buckets
+        self.storage = storage
+        self.enabled = enabled
+
+    async def hit(self, bucket: str, subject: str, cost: float = 1.0) -> RateLimitDecision:
+        config = self.buckets[bucket]
+        if not self.enabled:
+            return RateLimitDecision(True, int(config.capacity), 0.0)
+        return await self.storage.acquire(f"{bucket}:{subject}", config, cost)
+
+
+def build_rate_limiter() -> RateLimiter:
+    api = settings.api
+    buckets = {
+        "read": BucketConfig.parse(api.user_rate_limit_read),
+        "expensive": BucketConfig.parse(api.user_rate_limit_expensive),
+    }
+    storage: RateLimitStorage
+    if api.rate_limit_backend == "redis":
+        if not api.rate_limit_redis_url:
+            raise RuntimeError("RATE_LIMIT_REDIS_URL is required when RATE_LIMIT_BACKEND=redis")
+        storage = RedisRateLimitStorage(api.rate_limit_redis_url)
+    else:
+        storage = InMemoryRateLimitStorage()
+    return RateLimiter(buckets, storage, enabled=api.user_rate_limit_enabled)
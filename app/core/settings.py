@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import List
+from typing import Annotated, Dict, List, Literal
 
-from pydantic import AnyUrl, BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AnyUrl, Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
-class PlaidSettings(BaseModel):
-    model_config = SettingsConfigDict(extra="ignore")
+class PlaidSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     client_id: str = Field(default="PLAID_CLIENT_ID_PLACEHOLDER", validation_alias="PLAID_CLIENT_ID")
     secret: str = Field(default="PLAID_SECRET_PLACEHOLDER", validation_alias="PLAID_SECRET")
     environment: str = Field(default="sandbox", validation_alias="PLAID_ENV")
-    products: List[str] = Field(default_factory=lambda: ["transactions", "investments"], validation_alias="PLAID_PRODUCTS")
-    country_codes: List[str] = Field(default_factory=lambda: ["US"], validation_alias="PLAID_COUNTRY_CODES")
+    products: Annotated[List[str], NoDecode] = Field(default_factory=lambda: ["transactions", "investments"], validation_alias="PLAID_PRODUCTS")
+    country_codes: Annotated[List[str], NoDecode] = Field(default_factory=lambda: ["US"], validation_alias="PLAID_COUNTRY_CODES")
     redirect_uri: str | None = Field(default=None, validation_alias="PLAID_REDIRECT_URI")
+    # Overrides the environment host, e.g. to point at the fake server in app.testing.fake_plaid.
+    host: str | None = Field(default=None, validation_alias="PLAID_HOST")
+    # Governor (app.services.plaid_governor): global in-flight budget, retries and per-endpoint
+    # client-wide pacing, e.g. "transactions_sync=2500/minute,accounts_balance_get=1200/minute".
+    max_concurrency: int = Field(default=8, ge=1, validation_alias="PLAID_MAX_CONCURRENCY")
+    max_retries: int = Field(default=5, ge=0, validation_alias="PLAID_MAX_RETRIES")
+    retry_base_seconds: float = Field(default=0.5, gt=0, validation_alias="PLAID_RETRY_BASE_SECONDS")
+    retry_max_seconds: float = Field(default=30.0, gt=0, validation_alias="PLAID_RETRY_MAX_SECONDS")
+    endpoint_rate_limits: Annotated[Dict[str, str], NoDecode] = Field(
+        default_factory=lambda: {
+            "transactions_sync": "2500/minute",
+            "accounts_balance_get": "1200/minute",
+            "investments_holdings_get": "1000/minute",
+        },
+        validation_alias="PLAID_ENDPOINT_RATE_LIMITS",
+    )
 
     @field_validator("products", "country_codes", mode="before")
     @classmethod
@@ -24,12 +40,40 @@ class PlaidSettings(BaseModel):
             return [part.strip() for part in value.split(",") if part.strip()]
         return value
 
+    @field_validator("endpoint_rate_limits", mode="before")
+    @classmethod
+    def split_endpoint_limits(cls, value: Dict[str, str] | str) -> Dict[str, str]:
+        if isinstance(value, str):
+            pairs = (part.split("=", 1) for part in value.split(",") if "=" in part)
+            return {name.strip(): rate.strip() for name, rate in pairs}
+        return value
+
 
-class SchedulerSettings(BaseModel):
-    model_config = SettingsConfigDict(extra="ignore")
+class SchedulerSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     timezone: str = Field(default="UTC", validation_alias="SCHEDULER_TIMEZONE")
     initial_backfill_days: int = Field(default=730, validation_alias="SYNC_INITIAL_BACKFILL_DAYS")
+    # A chunk is committed (with its cursor) after whichever limit is reached first.
+    sync_commit_every_pages: int = Field(default=5, ge=1, validation_alias="SYNC_COMMIT_EVERY_PAGES")
+    sync_commit_every_rows: int = Field(default=2_500, ge=1, validation_alias="SYNC_COMMIT_EVERY_ROWS")
+    security_cache_size: int = Field(default=50_000, ge=0, validation_alias="SYNC_SECURITY_CACHE_SIZE")
+    sync_max_pagination_restarts: int = Field(
+        default=5,
+        ge=0,
+        validation_alias="SYNC_MAX_PAGINATION_RESTARTS",
+    )
+    # History scanned by the post-sync recurring-series detector (app.services.recurring).
+    recurring_lookback_days: int = Field(default=730, ge=60, validation_alias="RECURRING_LOOKBACK_DAYS")
+    # CSV of FX rates (date,currency,rate) reloaded into fx_rates by app.workers.fx_rates.
+    fx_rates_path: str | None = Field(default=None, validation_alias="FX_RATES_PATH")
+    fx_rates_cron: str = Field(default="15 4 * * *", validation_alias="SCHED_FX_RATES_CRON")
+    # Monthly transaction partitions are created this many months ahead (app.core.partitions).
+    partition_months_ahead: int = Field(default=3, ge=1, validation_alias="PARTITION_MONTHS_AHEAD")
+    partition_maintenance_cron: str = Field(
+        default="0 4 * * *",
+        validation_alias="SCHED_PARTITION_MAINTENANCE_CRON",
+    )
     balance_refresh_cron: str = Field(
         default="0 5 * * *",
         validation_alias="SCHED_BALANCE_REFRESH_CRON",
@@ -40,8 +84,8 @@ class SchedulerSettings(BaseModel):
     )
 
 
-class SecuritySettings(BaseModel):
-    model_config = SettingsConfigDict(extra="ignore")
+class SecuritySettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     encryption_key_base64: str = Field(
         default="XumNsZM3Rp3XIanFkFJxuxMxDPZWS9Vyhi3F7S-Mw7A=",
@@ -55,11 +99,26 @@ class SecuritySettings(BaseModel):
     )
 
 
-class APISettings(BaseModel):
-    model_config = SettingsConfigDict(extra="ignore")
-
-    allowed_origins: List[str] = Field(default_factory=list, validation_alias="ALLOWED_ORIGINS")
-    rate_limit: str = Field(default="60/minute", validation_alias="API_RATE_LIMIT")
+class APISettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+
+    allowed_origins: Annotated[List[str], NoDecode] = Field(default_factory=list, validation_alias="ALLOWED_ORIGINS")
+    # Coarse per-IP backstop (slowapi); per-user budgets are the buckets below.
+    rate_limit: str = Field(default="600/minute", validation_alias="API_RATE_LIMIT")
+    # Per-user token buckets, e.g. "120/minute" or "10/hour;burst=3".
+    user_rate_limit_enabled: bool = Field(default=True, validation_alias="USER_RATE_LIMIT_ENABLED")
+    user_rate_limit_read: str = Field(default="300/minute", validation_alias="USER_RATE_LIMIT_READ")
+    user_rate_limit_expensive: str = Field(default="12/hour;burst=3", validation_alias="USER_RATE_LIMIT_EXPENSIVE")
+    rate_limit_backend: Literal["memory", "redis"] = Field(default="memory", validation_alias="RATE_LIMIT_BACKEND")
+    rate_limit_redis_url: str | None = Field(default=None, validation_alias="RATE_LIMIT_REDIS_URL")
+    # Currency totals are reported in when a user's profile has no "base_currency".
+    fx_base_currency: str = Field(default="USD", min_length=3, max_length=3, validation_alias="FX_BASE_CURRENCY")
+    # Response compression (app.core.compression); brotli needs the optional ``brotli`` extra.
+    compression_min_size: int = Field(default=1_024, ge=0, validation_alias="COMPRESSION_MIN_SIZE")
+    compression_gzip_level: int = Field(default=6, ge=1, le=9, validation_alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(default=4, ge=0, le=11, validation_alias="COMPRESSION_BROTLI_QUALITY")
+    # Responses stored precompressed per data version (forecast, holdings summary).
+    compression_cache_size: int = Field(default=256, ge=1, validation_alias="COMPRESSION_CACHE_SIZE")
 
     @field_validator("allowed_origins", mode="before")
     @classmethod
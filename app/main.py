@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
 import sentry_sdk
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -15,8 +16,12 @@ from slowapi.util import get_remote_address
 from fastapi.responses import JSONResponse
 
 from app.api.router import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.logging import configure_logging
+from app.core.rate_limit import build_rate_limiter
 from app.core.settings import settings
+from app.workers.fx_rates import run_fx_rates_load
+from app.workers.partition_maintenance import run_partition_maintenance
 from app.workers.sync_worker import run_full_sync
 
 limiter = Limiter(key_func=get_remote_address)  # type: ignore[arg-type]
@@ -42,6 +47,30 @@ async def lifespan(app: FastAPI):
         replace_existing=True,
         misfire_grace_time=300,
     )
+    # Also runs once at startup so a deployment that was down for a while catches up.
+    scheduler.add_job(
+        run_partition_maintenance,
+        trigger=CronTrigger.from_crontab(
+            settings.scheduler.partition_maintenance_cron,
+            timezone=settings.scheduler.timezone,
+        ),
+        id="partition_maintenance",
+        replace_existing=True,
+        misfire_grace_time=3600,
+        next_run_time=datetime.now(timezone.utc),
+    )
+    if settings.scheduler.fx_rates_path:
+        scheduler.add_job(
+            run_fx_rates_load,
+            trigger=CronTrigger.from_crontab(
+                settings.scheduler.fx_rates_cron,
+                timezone=settings.scheduler.timezone,
+            ),
+            id="fx_rates_load",
+            replace_existing=True,
+            misfire_grace_time=3600,
+            next_run_time=datetime.now(timezone.utc),
+        )
     scheduler.start()
 
     logger.info("Finance API started")
@@ -60,6 +89,8 @@ app = FastAPI(
 )
 
 app.state.limiter = limiter
+# Per-user token buckets enforced by app.api.deps.rate_limit; slowapi stays as a per-IP backstop.
+app.state.user_limiter = build_rate_limiter()
 
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
@@ -83,6 +114,8 @@ if default_rate_limit:
     limiter.default_limits = [default_rate_limit]
 
 app.add_middleware(SlowAPIMiddleware)
+# Wraps CORS, slowapi and the routes, so it compresses their final body and headers.
+app.add_middleware(CompressionMiddleware, minimum_size=settings.api.compression_min_size)
 
 app.include_router(api_router)
 
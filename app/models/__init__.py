@@ -1,8 +1,15 @@
 from app.core.database import Base
 from app.models.account import Account
+from app.models.account_balance_snapshot import AccountBalanceSnapshot
 from app.models.balance_snapshot import BalanceSnapshot
+from app.models.budget import Budget
+from app.models.category_spend import CategorySpend
+from app.models.fx_rate import FxRate
 from app.models.holding import Holding
+from app.models.holding_snapshot import HoldingSnapshot
 from app.models.item import Item
+from app.models.merchant_rule import MerchantRule
+from app.models.recurring_series import RecurringSeries
 from app.models.security import Security
 from app.models.transaction import Transaction
 from app.models.user import User
@@ -15,5 +22,12 @@ __all__ = [
     "Transaction",
     "Security",
     "Holding",
+    "HoldingSnapshot",
     "BalanceSnapshot",
+    "Budget",
+    "CategorySpend",
+    "FxRate",
+    "MerchantRule",
+    "RecurringSeries",
+    "AccountBalanceSnapshot",
 ]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+import uuid
+
+from sqlalchemy import Date, ForeignKey, Index, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AccountBalanceSnapshot(Base):
+    """An account's balances as of the last sync on a given day."""
+
+    __tablename__ = "account_balance_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_account_balance_snapshots_account_date_unique",
+            "account_id",
+            "as_of_date",
+            unique=True,
+        ),
+    )
+
+    account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("accounts.id"), nullable=False)
+    as_of_date: Mapped[date] = mapped_column(Date, nullable=False)
+    type: Mapped[str | None] = mapped_column(String(32))
+    iso_currency_code: Mapped[str | None] = mapped_column(String(3))
+    current_balance: Mapped[Decimal | None] = mapped_column(Numeric(18, 2))
+    available_balance: Mapped[Decimal | None] = mapped_column(Numeric(18, 2))
+
+    def __repr__(self) -> str:
+        return f"AccountBalanceSnapshot(account_id={self.account_id}, date={self.as_of_date})"
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from decimal import Decimal
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class Budget(Base):
+    """A user's monthly spending limit for one canonical category."""
+
+    __tablename__ = "budgets"
+    __table_args__ = (Index("ix_budgets_user_category_unique", "user_id", "category", unique=True),)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
+    category: Mapped[str] = mapped_column(String(64), nullable=False)
+    monthly_limit: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"Budget(category={self.category!r}, monthly_limit={self.monthly_limit})"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+import uuid
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class CategorySpend(Base):
+    """Running spend for a (user, canonical category, month), kept current by ingest deltas.
+
+    ``spent`` is the net of live transactions (refunds subtract), so budgets read it directly
+    instead of re-aggregating ``transactions``.
+    """
+
+    __tablename__ = "category_spend"
+    __table_args__ = (
+        Index("ix_category_spend_user_category_month_unique", "user_id", "category", "month", unique=True),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
+    category: Mapped[str] = mapped_column(String(64), nullable=False)
+    # First day of the month.
+    month: Mapped[date] = mapped_column(Date, nullable=False)
+    spent: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"CategorySpend(category={self.category!r}, month={self.month}, spent={self.spent})"
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, Index, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class FxRate(Base):
+    """Value of one unit of ``currency`` in ``app.services.fx.QUOTE_CURRENCY`` from ``as_of_date`` on."""
+
+    __tablename__ = "fx_rates"
+    __table_args__ = (
+        # Serves "latest rate on or before a date" lookups as a backward index scan.
+        Index("ix_fx_rates_currency_date_unique", "currency", "as_of_date", unique=True),
+    )
+
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
+    as_of_date: Mapped[date] = mapped_column(Date, nullable=False)
+    rate: Mapped[Decimal] = mapped_column(Numeric(20, 10), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"FxRate(currency={self.currency}, date={self.as_of_date}, rate={self.rate})"
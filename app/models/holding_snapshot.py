@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+import uuid
+
+from sqlalchemy import Date, ForeignKey, Index, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class HoldingSnapshot(Base):
+    """End-of-sync copy of a position, one row per account, security and day.
+
+    A row without a security records that the account held nothing that day.
+    """
+
+    __tablename__ = "holding_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_holding_snapshots_account_date_security_unique",
+            "account_id",
+            "as_of_date",
+            "security_id",
+            unique=True,
+        ),
+    )
+
+    account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("accounts.id"), nullable=False)
+    security_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("securities.id"))
+    as_of_date: Mapped[date] = mapped_column(Date, nullable=False)
+    quantity: Mapped[Decimal] = mapped_column(Numeric(24, 8), nullable=False)
+    institution_value: Mapped[Decimal | None] = mapped_column(Numeric(24, 4))
+
+    def __repr__(self) -> str:
+        return (
+            f"HoldingSnapshot(account_id={self.account_id}, security_id={self.security_id}, "
+            f"date={self.as_of_date})"
+        )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class MerchantRule(Base):
+    """A user's override: descriptions containing ``pattern`` belong to ``merchant``."""
+
+    __tablename__ = "merchant_rules"
+    __table_args__ = (
+        Index("ix_merchant_rules_user_pattern_unique", "user_id", "pattern", unique=True),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
+    # Stored lowercased; matched as a substring starting on a word boundary.
+    pattern: Mapped[str] = mapped_column(String(128), nullable=False)
+    merchant: Mapped[str] = mapped_column(String(128), nullable=False)
+    category: Mapped[str | None] = mapped_column(String(64))
+
+    def __repr__(self) -> str:
+        return f"MerchantRule(pattern={self.pattern!r}, merchant={self.merchant!r})"
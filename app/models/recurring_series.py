@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+import uuid
+
+from sqlalchemy import Boolean, Date, Float, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class RecurringSeries(Base):
+    """A periodic run of charges or deposits from one canonical merchant, found after each sync."""
+
+    __tablename__ = "recurring_series"
+    __table_args__ = (
+        Index(
+            "ix_recurring_series_user_merchant_direction_unique",
+            "user_id",
+            "merchant",
+            "direction",
+            unique=True,
+        ),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
+    merchant: Mapped[str] = mapped_column(String(256), nullable=False)
+    category: Mapped[str | None] = mapped_column(String(64))
+    # "outflow" (bills, subscriptions) or "inflow" (payroll, transfers in).
+    direction: Mapped[str] = mapped_column(String(8), nullable=False)
+    frequency: Mapped[str] = mapped_column(String(16), nullable=False)
+    interval_days: Mapped[float] = mapped_column(Float, nullable=False)
+    # Positive magnitudes; ``direction`` carries the sign.
+    average_amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    last_amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    occurrences: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_date: Mapped[date] = mapped_column(Date, nullable=False)
+    last_date: Mapped[date] = mapped_column(Date, nullable=False)
+    next_expected_date: Mapped[date] = mapped_column(Date, nullable=False)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    def __repr__(self) -> str:
+        return f"RecurringSeries(merchant={self.merchant!r}, frequency={self.frequency!r})"
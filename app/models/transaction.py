@@ -4,17 +4,52 @@ from datetime import date, datetime
 from decimal import Decimal
 import uuid
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, JSON, Numeric, String
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    JSON,
+    Numeric,
+    String,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.partitions import create_initial_partitions
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # Range-partitioned by month on ``date`` (app.core.partitions). Postgres requires the partition
+    # key in every unique constraint, so the primary key is (id, date) and the Plaid id is unique
+    # per date; TransactionRepository moves a row whose date changed before upserting it.
     __table_args__ = (
-        Index("ix_transactions_plaid_transaction_id_unique", "plaid_transaction_id", unique=True),
-        Index("ix_transactions_account_date", "account_id", "date"),
+        Index(
+            "ix_transactions_plaid_transaction_id_date_unique",
+            "plaid_transaction_id",
+            "date",
+            unique=True,
+        ),
+        # Every read path filters on removed_at IS NULL, so the hot indexes skip soft-deleted rows.
+        Index(
+            "ix_transactions_account_date_active",
+            "account_id",
+            "date",
+            postgresql_where=text("removed_at IS NULL"),
+        ),
+        Index(
+            "ix_transactions_search_active",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("removed_at IS NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
     account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("accounts.id"), nullable=False)
@@ -24,10 +59,13 @@ class Transaction(Base):
     transaction_id: Mapped[str | None] = mapped_column(String(128))
     name: Mapped[str | None] = mapped_column(String(256))
     merchant_name: Mapped[str | None] = mapped_column(String(256))
+    # Set at ingest by app.services.merchants so rollups do not fragment across raw variants.
+    canonical_merchant: Mapped[str | None] = mapped_column(String(256))
+    canonical_category: Mapped[str | None] = mapped_column(String(64))
     transaction_type: Mapped[str | None] = mapped_column(String(32))
     amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
     iso_currency_code: Mapped[str | None] = mapped_column(String(3))
-    date: Mapped[date | None] = mapped_column(Date)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
     authorized_date: Mapped[date | None] = mapped_column(Date)
     pending: Mapped[bool] = mapped_column(Boolean, default=False)
     payment_channel: Mapped[str | None] = mapped_column(String(32))
@@ -35,8 +73,24 @@ class Transaction(Base):
     category: Mapped[list[str] | None] = mapped_column(JSON)
     counterparty: Mapped[dict | None] = mapped_column(JSON)
     last_modified_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Set when Plaid reports the transaction in ``removed``; rows are kept for auditability.
+    removed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Merchant words outrank description words in /v1/transactions/search. The 'simple' config
+    # lowercases without stemming, which suits merchant names. Deferred: only search reads it.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(merchant_name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     account: Mapped["Account"] = relationship("Account", back_populates="transactions")
 
     def __repr__(self) -> str:
         return f"Transaction(plaid_transaction_id={self.plaid_transaction_id})"
+
+
+event.listen(Transaction.__table__, "after_create", create_initial_partitions)
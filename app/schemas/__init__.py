@@ -1,25 +1,60 @@
 from app.schemas.account import AccountBase, AccountDetail
-from app.schemas.analytics import CashflowResponse, NetWorthHistoryPoint, NetWorthResponse
-from app.schemas.balance import NetWorthSnapshot
-from app.schemas.holding import HoldingSummary
+from app.schemas.analytics import (
+    CashflowResponse,
+    ForecastPoint,
+    ForecastResponse,
+    NetWorthHistoryPoint,
+    NetWorthResponse,
+)
+from app.schemas.balance import AccountBalancePoint, BalanceBreakdownPoint, NetWorthSnapshot
+from app.schemas.budget import BudgetCreate, BudgetProgress
+from app.schemas.dashboard import DashboardResponse
+from app.schemas.holding import (
+    HoldingsGroupSummary,
+    HoldingsSummaryResponse,
+    HoldingSummary,
+    PortfolioValuePoint,
+)
 from app.schemas.item import ItemRead
+from app.schemas.merchant_rule import MerchantRuleCreate, MerchantRuleRead
+from app.schemas.recurring import RecurringSeriesRead
 from app.schemas.security import SecuritySummary
 from app.schemas.sync import SyncStatus
-from app.schemas.transaction import TransactionDetail, TransactionSummary
+from app.schemas.transaction import (
+    TransactionDetail,
+    TransactionSearchHit,
+    TransactionSearchResponse,
+    TransactionSummary,
+)
 from app.schemas.user import UserRead
 
 __all__ = [
     "AccountBase",
     "AccountDetail",
     "NetWorthSnapshot",
+    "AccountBalancePoint",
+    "BalanceBreakdownPoint",
+    "BudgetCreate",
+    "BudgetProgress",
+    "DashboardResponse",
     "NetWorthResponse",
     "NetWorthHistoryPoint",
     "CashflowResponse",
+    "ForecastPoint",
+    "ForecastResponse",
     "HoldingSummary",
+    "HoldingsGroupSummary",
+    "HoldingsSummaryResponse",
+    "PortfolioValuePoint",
     "ItemRead",
+    "MerchantRuleCreate",
+    "MerchantRuleRead",
+    "RecurringSeriesRead",
     "SecuritySummary",
     "SyncStatus",
     "TransactionSummary",
     "TransactionDetail",
+    "TransactionSearchHit",
+    "TransactionSearchResponse",
     "UserRead",
 ]
@@ -5,12 +5,12 @@ from typing import List, Optional
 
 from pydantic import Field
 
-from app.schemas.base import TimestampedModel
+from app.schemas.base import TimestampedModel, UUIDStr
 from app.schemas.transaction import TransactionSummary
 
 
 class AccountBase(TimestampedModel):
-    item_id: str
+    item_id: UUIDStr
     plaid_account_id: str
     name: Optional[str] = None
     official_name: Optional[str] = None
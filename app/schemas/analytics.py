@@ -18,6 +18,10 @@ class NetWorthResponse(APIModel):
     net_worth: Decimal | None = None
     assets: Decimal | None = None
     liabilities: Decimal | None = None
+    # The user's base currency every total is converted to.
+    currency: str | None = None
+    # Currencies with no FX rate to ``currency``; those balances are not in the totals.
+    unconverted_currencies: List[str] = Field(default_factory=list)
     history: List[NetWorthHistoryPoint] = Field(default_factory=list)
 
 
@@ -27,3 +31,22 @@ class CashflowResponse(APIModel):
     inflow: Decimal
     outflow: Decimal
     net: Decimal
+    currency: str | None = None
+    unconverted_currencies: List[str] = Field(default_factory=list)
+
+
+class ForecastPoint(APIModel):
+    date: date
+    balance: Decimal
+    inflow: Decimal
+    outflow: Decimal
+
+
+class ForecastResponse(APIModel):
+    start_date: date
+    days: int
+    starting_balance: Decimal
+    daily_discretionary_spend: Decimal
+    lowest_balance: Decimal | None = None
+    lowest_balance_date: date | None = None
+    points: List[ForecastPoint] = Field(default_factory=list)
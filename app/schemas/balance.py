@@ -4,11 +4,11 @@ from datetime import date
 from decimal import Decimal
 from typing import Optional
 
-from app.schemas.base import TimestampedModel
+from app.schemas.base import APIModel, TimestampedModel, UUIDStr
 
 
 class NetWorthSnapshot(TimestampedModel):
-    user_id: str
+    user_id: UUIDStr
     as_of_date: date
     net_worth: Optional[Decimal] = None
     liquid_assets: Optional[Decimal] = None
@@ -16,3 +16,18 @@ class NetWorthSnapshot(TimestampedModel):
     liabilities: Optional[Decimal] = None
     cash_flow_in: Optional[Decimal] = None
     cash_flow_out: Optional[Decimal] = None
+
+
+class AccountBalancePoint(APIModel):
+    as_of_date: date
+    current_balance: Optional[Decimal] = None
+    available_balance: Optional[Decimal] = None
+    iso_currency_code: Optional[str] = None
+
+
+class BalanceBreakdownPoint(APIModel):
+    as_of_date: date
+    liquid_assets: Decimal
+    investments: Decimal
+    liabilities: Decimal
+    net_worth: Decimal
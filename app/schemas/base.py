@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+
+# ORM primary/foreign keys are UUIDs; the API exposes them as plain strings.
+UUIDStr = Annotated[str, BeforeValidator(str)]
 
 
 class APIModel(BaseModel):
@@ -11,6 +14,6 @@ class APIModel(BaseModel):
 
 
 class TimestampedModel(APIModel):
-    id: str
+    id: UUIDStr
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import Field
+
+from app.schemas.base import APIModel, UUIDStr
+
+
+class BudgetCreate(APIModel):
+    # Stored normalised ("Food & drink" -> "FOOD_AND_DRINK") to match transaction categories.
+    category: str = Field(min_length=1, max_length=64, pattern=r"[0-9A-Za-z]")
+    monthly_limit: Decimal = Field(gt=0, max_digits=18, decimal_places=2)
+
+
+class BudgetProgress(APIModel):
+    id: UUIDStr
+    category: str
+    month: date
+    monthly_limit: Decimal
+    spent: Decimal
+    remaining: Decimal
+    percent_used: float
+    transaction_count: int
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.account import AccountBase
+from app.schemas.analytics import CashflowResponse, NetWorthResponse
+from app.schemas.base import APIModel
+from app.schemas.holding import HoldingsSummaryResponse
+
+
+class DashboardResponse(APIModel):
+    accounts: List[AccountBase] = Field(default_factory=list)
+    net_worth: NetWorthResponse
+    cashflow: CashflowResponse
+    holdings: HoldingsSummaryResponse
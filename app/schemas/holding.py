@@ -2,15 +2,15 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
-from app.schemas.base import TimestampedModel
+from app.schemas.base import APIModel, TimestampedModel, UUIDStr
 from app.schemas.security import SecuritySummary
 
 
 class HoldingSummary(TimestampedModel):
-    account_id: str
-    security_id: str
+    account_id: UUIDStr
+    security_id: UUIDStr
     quantity: Decimal
     institution_value: Optional[Decimal] = None
     institution_price: Optional[Decimal] = None
@@ -18,3 +18,29 @@ class HoldingSummary(TimestampedModel):
     cost_basis: Optional[Decimal] = None
     last_updated: Optional[datetime] = None
     security: Optional[SecuritySummary] = None
+
+
+class PortfolioValuePoint(APIModel):
+    as_of_date: date
+    value: Decimal
+
+
+class HoldingsGroupSummary(APIModel):
+    market_value: Decimal
+    cost_basis: Decimal
+    unrealized_gain: Decimal
+    unrealized_gain_percent: Optional[float] = None
+    allocation_percent: float
+    positions: int
+    security_type: Optional[str] = None
+    security_id: Optional[UUIDStr] = None
+    ticker_symbol: Optional[str] = None
+    name: Optional[str] = None
+    account_id: Optional[UUIDStr] = None
+
+
+class HoldingsSummaryResponse(APIModel):
+    total: HoldingsGroupSummary
+    by_type: List[HoldingsGroupSummary]
+    by_security: List[HoldingsGroupSummary]
+    by_account: List[HoldingsGroupSummary]
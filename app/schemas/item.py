@@ -3,11 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from app.schemas.base import APIModel
+from app.schemas.base import APIModel, UUIDStr
 
 
 class ItemRead(APIModel):
-    id: str
+    id: UUIDStr
     plaid_item_id: str
     institution_id: Optional[str] = None
     institution_name: Optional[str] = None
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import Field
+
+from app.schemas.base import APIModel, TimestampedModel
+
+
+class MerchantRuleCreate(APIModel):
+    pattern: str = Field(min_length=2, max_length=128)
+    merchant: str = Field(min_length=1, max_length=128)
+    category: Optional[str] = Field(default=None, max_length=64, pattern=r"[0-9A-Za-z]")
+
+
+class MerchantRuleRead(TimestampedModel):
+    pattern: str
+    merchant: str
+    category: Optional[str] = None
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from app.schemas.base import TimestampedModel
+
+
+class RecurringSeriesRead(TimestampedModel):
+    merchant: str
+    category: Optional[str] = None
+    direction: str
+    frequency: str
+    interval_days: float
+    average_amount: Decimal
+    last_amount: Decimal
+    occurrences: int
+    first_date: date
+    last_date: date
+    next_expected_date: date
+    confidence: float
+    is_active: bool
@@ -5,11 +5,11 @@ from typing import Literal, Optional
 
 from pydantic import Field
 
-from app.schemas.base import APIModel
+from app.schemas.base import APIModel, UUIDStr
 
 
 class SyncStatus(APIModel):
-    item_id: str
+    item_id: UUIDStr
     status: Literal["idle", "running", "error"] = "idle"
     cursor: Optional[str] = None
     last_successful_sync: Optional[datetime] = None
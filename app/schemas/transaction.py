@@ -1,23 +1,25 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+import datetime as dt
 from decimal import Decimal
 from typing import List, Optional
 
 from pydantic import Field
 
-from app.schemas.base import APIModel, TimestampedModel
+from app.schemas.base import APIModel, TimestampedModel, UUIDStr
 
 
 class TransactionBase(TimestampedModel):
-    account_id: str
+    account_id: UUIDStr
     plaid_transaction_id: str
     amount: Decimal
     iso_currency_code: Optional[str] = None
-    date: Optional[date] = None
-    authorized_date: Optional[date] = None
+    date: Optional[dt.date] = None
+    authorized_date: Optional[dt.date] = None
     name: Optional[str] = None
     merchant_name: Optional[str] = None
+    canonical_merchant: Optional[str] = None
+    canonical_category: Optional[str] = None
     transaction_type: Optional[str] = None
     pending: bool = False
     payment_channel: Optional[str] = None
@@ -26,7 +28,7 @@ class TransactionBase(TimestampedModel):
     counterparty: Optional[dict] = None
     transaction_id: Optional[str] = None
     transaction_code: Optional[str] = None
-    last_modified_at: Optional[datetime] = None
+    last_modified_at: Optional[dt.datetime] = None
 
 
 class TransactionSummary(TransactionBase):
@@ -35,3 +37,12 @@ class TransactionSummary(TransactionBase):
 
 class TransactionDetail(TransactionBase):
     notes: Optional[str] = Field(default=None, description="Optional manually added notes")
+
+
+class TransactionSearchHit(TransactionSummary):
+    rank: float = Field(default=0.0, description="Relevance; merchant-name matches outrank name matches")
+
+
+class TransactionSearchResponse(APIModel):
+    results: List[TransactionSearchHit] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(default=None, description="Pass as `cursor` for the next page")
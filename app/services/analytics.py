@@ -1,17 +1,78 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
-from sqlalchemy import case, func, select
+import numpy as np
+from loguru import logger
+from sqlalchemy import CTE, Date, Integer, Subquery, bindparam, case, func, literal, select, tuple_, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.account import Account
+from app.models.account_balance_snapshot import AccountBalanceSnapshot
+from app.core.cache import LRUCache
 from app.models.balance_snapshot import BalanceSnapshot
+from app.models.holding import Holding
+from app.models.holding_snapshot import HoldingSnapshot
 from app.models.item import Item
+from app.models.security import Security
 from app.models.transaction import Transaction
+from app.models.user import User
+from app.services.fx import FxService, base_currency_of, epoch_days
+
+
+LIABILITY_TYPES = ("loan", "credit")
+INVESTMENT_TYPES = ("investment", "brokerage")
+BALANCE_CLASSES = ("liquid_assets", "investments", "liabilities")
+
+_EPOCH = date(1970, 1, 1)
+
+
+_CENT = Decimal("0.01")
+
+
+def _balance_class(account_type: ColumnElement) -> ColumnElement:
+    """Which of ``BALANCE_CLASSES`` an account of ``account_type`` counts towards."""
+    return case(
+        (account_type.in_(LIABILITY_TYPES), "liabilities"),
+        (account_type.in_(INVESTMENT_TYPES), "investments"),
+        else_="liquid_assets",
+    )
+
+
+def _carried_forward(per_account: CTE, columns: Sequence[str]) -> Subquery:
+    """Running per-date totals of ``columns`` where each account's latest value carries forward.
+
+    ``per_account`` has one row per (account_id, as_of_date). Accounts sync on their own
+    schedules, so summing a date's rows would drop every account not synced that day. Instead
+    each row becomes a delta against the account's previous row and the deltas are summed with
+    a running window, which also folds in rows from before the caller's start date.
+    """
+    window = {"partition_by": per_account.c.account_id, "order_by": per_account.c.as_of_date}
+    changes = select(
+        per_account.c.as_of_date,
+        *(
+            (per_account.c[column] - func.lag(per_account.c[column], 1, 0).over(**window)).label(column)
+            for column in columns
+        ),
+    ).cte("changes")
+    return (
+        select(
+            changes.c.as_of_date,
+            *(
+                func.sum(func.sum(changes.c[column]))
+                .over(order_by=changes.c.as_of_date)
+                .label(column)
+                for column in columns
+            ),
+        )
+        .group_by(changes.c.as_of_date)
+        .subquery("series")
+    )
 
 
 @dataclass(slots=True)
@@ -19,6 +80,46 @@ class NetWorthSummary:
     net_worth: Decimal | None
     assets: Decimal | None
     liabilities: Decimal | None
+    investments: Decimal | None = None
+    currency: Optional[str] = None
+    # Currencies with no rate to ``currency``; their balances are left out of the totals.
+    unconverted_currencies: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BalanceBreakdown:
+    as_of_date: date
+    liquid_assets: Decimal
+    investments: Decimal
+    liabilities: Decimal
+
+
+@dataclass(slots=True)
+class HoldingsGroup:
+    market_value: Decimal
+    # Cost basis and gain cover only positions whose cost basis the institution reports.
+    cost_basis: Decimal
+    unrealized_gain: Decimal
+    positions: int
+    security_type: Optional[str] = None
+    security_id: Optional[str] = None
+    ticker_symbol: Optional[str] = None
+    name: Optional[str] = None
+    account_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class HoldingsSummary:
+    total: HoldingsGroup
+    by_type: List[HoldingsGroup]
+    by_security: List[HoldingsGroup]
+    by_account: List[HoldingsGroup]
+
+
+# GROUPING(security type, security id, account id) bitmask of each grouping set.
+_BY_TYPE, _BY_SECURITY, _BY_ACCOUNT, _TOTAL = 0b011, 0b001, 0b110, 0b111
+
+_holdings_summaries: LRUCache[Tuple[str, str], HoldingsSummary] = LRUCache(maxsize=1_024)
 
 
 @dataclass(slots=True)
@@ -27,39 +128,110 @@ class CashflowSummary:
     end_date: date
     inflow: Decimal
     outflow: Decimal
+    currency: Optional[str] = None
+    unconverted_currencies: List[str] = field(default_factory=list)
 
 
 class AnalyticsService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def net_worth(self, user_id: str) -> NetWorthSummary:
+    async def data_version(self, user_id: str) -> str:
+        """Changes whenever a sync commits data for one of the user's items, or an item is added
+        or removed.
+
+        Each item's ``data_version`` is bumped by every committed sync chunk, so a sync that
+        fails part-way still invalidates results cached under the previous version.
+        """
+        stmt = select(
+            func.count(Item.id),
+            func.coalesce(func.sum(Item.data_version), 0),
+            func.max(Item.updated_at),
+        ).where(Item.user_id == user_id)
+        items, versions, latest = (await self.session.execute(stmt)).one()
+        return f"{items}:{versions}:{latest.isoformat() if latest else '-'}"
+
+    async def base_currency(self, user_id: str) -> str:
+        profile = (await self.session.execute(select(User.profile).where(User.id == user_id))).scalar()
+        return base_currency_of(profile)
+
+    async def _convert(
+        self,
+        currencies: Sequence[Optional[str]],
+        days: np.ndarray,
+        columns: Sequence[Sequence[Decimal]],
+        base: str,
+    ) -> Tuple[List[Decimal], List[str]]:
+        """Sum each of ``columns`` (aligned with ``currencies``/``days``) after conversion to ``base``.
+
+        Rows already in ``base`` keep exact Decimal sums. Otherwise the rates come from one
+        vectorised lookup and each amount is multiplied in Decimal, with totals rounded to cents.
+        Rows whose currency has no rate are left out; their currencies are returned alongside.
+        """
+        if all(code in (None, base) for code in currencies):
+            return [sum(column, Decimal(0)) for column in columns], []
+        factors = (await FxService(self.session).rate_table()).factors(currencies, days, base)
+        rates = [None if np.isnan(factor) else Decimal(str(factor)) for factor in factors.tolist()]
+        unconverted = sorted({code for code, rate in zip(currencies, rates) if rate is None})
+        if unconverted:
+            logger.warning(
+                "No FX rate to {base} for {currencies}; left out of totals",
+                base=base,
+                currencies=unconverted,
+            )
+        totals = [
+            sum((value * rate for value, rate in zip(column, rates) if rate is not None), Decimal(0))
+            .quantize(_CENT)
+            for column in columns
+        ]
+        return totals, unconverted
+
+    async def net_worth(self, user_id: str, *, base_currency: Optional[str] = None) -> NetWorthSummary:
+        """Balances summed per currency in SQL, then converted to the user's base currency."""
+        base = base_currency or await self.base_currency(user_id)
         asset_case = case(
-            (Account.type.in_(["loan", "credit"]), 0),
+            (Account.type.in_(LIABILITY_TYPES), 0),
             else_=Account.current_balance,
         )
         liability_case = case(
-            (Account.type.in_(["loan", "credit"]), Account.current_balance),
+            (Account.type.in_(LIABILITY_TYPES), Account.current_balance),
+            else_=0,
+        )
+        investment_case = case(
+            (Account.type.in_(INVESTMENT_TYPES), Account.current_balance),
             else_=0,
         )
         stmt = (
             select(
+                Account.iso_currency_code,
                 func.sum(asset_case),
                 func.sum(liability_case),
+                func.sum(investment_case),
             )
             .select_from(Account)
             .join(Item, Account.item_id == Item.id)
             .where(Item.user_id == user_id)
+            .group_by(Account.iso_currency_code)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        balanced = [row for row in rows if row[1] is not None or row[2] is not None]
+        if not balanced:
+            return NetWorthSummary(net_worth=None, assets=None, liabilities=None, currency=base)
+        currencies, assets, liabilities, investments = zip(*balanced)
+        today = np.full(len(balanced), epoch_days(date.today()))
+        (assets, liabilities, investments), unconverted = await self._convert(
+            currencies,
+            today,
+            [[value or Decimal(0) for value in column] for column in (assets, liabilities, investments)],
+            base,
         )
-        result = await self.session.execute(stmt)
-        assets, liabilities = result.one()
-        if assets is None and liabilities is None:
-            return NetWorthSummary(net_worth=None, assets=None, liabilities=None)
-        net_worth = (assets or Decimal("0")) - (liabilities or Decimal("0"))
         return NetWorthSummary(
-            net_worth=net_worth,
+            net_worth=assets - liabilities,
             assets=assets,
             liabilities=liabilities,
+            investments=investments,
+            currency=base,
+            unconverted_currencies=unconverted,
         )
 
     async def cashflow_summary(
@@ -68,9 +240,12 @@ class AnalyticsService:
         *,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        base_currency: Optional[str] = None,
     ) -> CashflowSummary:
+        """Flows summed per (currency, day) in SQL, each day converted at that day's rate."""
         end = end_date or date.today()
         start = start_date or (end - timedelta(days=30))
+        base = base_currency or await self.base_currency(user_id)
 
         inflow_case = case(
             (Transaction.amount < 0, -Transaction.amount),
@@ -82,7 +257,12 @@ class AnalyticsService:
         )
 
         stmt = (
-            select(func.sum(inflow_case), func.sum(outflow_case))
+            select(
+                Transaction.iso_currency_code,
+                type_coerce(Transaction.date - literal(_EPOCH), Integer),
+                func.sum(inflow_case),
+                func.sum(outflow_case),
+            )
             .select_from(Transaction)
             .join(Account, Transaction.account_id == Account.id)
             .join(Item, Account.item_id == Item.id)
@@ -90,17 +270,28 @@ class AnalyticsService:
                 Item.user_id == user_id,
                 Transaction.date >= start,
                 Transaction.date <= end,
+                Transaction.removed_at.is_(None),
             )
+            .group_by(Transaction.iso_currency_code, Transaction.date)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            currencies, days, inflows, outflows = zip(*rows)
+        else:
+            currencies, days, inflows, outflows = (), (), (), ()
+        (inflow, outflow), unconverted = await self._convert(
+            currencies,
+            np.fromiter(days, dtype=np.int64, count=len(rows)),
+            [inflows, outflows],
+            base,
         )
-        result = await self.session.execute(stmt)
-        inflow, outflow = result.one()
-        inflow = inflow or Decimal("0")
-        outflow = outflow or Decimal("0")
         return CashflowSummary(
             start_date=start,
             end_date=end,
             inflow=inflow,
             outflow=abs(outflow),
+            currency=base,
+            unconverted_currencies=unconverted,
         )
 
     async def recent_net_worth(self, user_id: str, *, limit: int = 90) -> list[tuple[date, Decimal]]:
@@ -112,3 +303,224 @@ class AnalyticsService:
         )
         result = await self.session.execute(stmt)
         return [(row.as_of_date, row.net_worth) for row in result]
+
+    async def net_worth_history(
+        self,
+        user_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        points: int = 200,
+    ) -> list[tuple[date, Decimal]]:
+        """Net worth on at most ``points`` evenly spaced dates from ``start_date`` to ``end_date``.
+
+        Each sample is the latest snapshot on or before its date, so days without a sync carry
+        the previous value forward. Postgres buckets the range with ``width_bucket`` and returns
+        only the last snapshot per bucket, so a decade of daily snapshots leaves the database as
+        ``points`` rows. The range scan starts at the last snapshot on or before ``start_date`` so
+        the first sample has a value without reading older history.
+        """
+        end = end_date or date.today()
+        start = start_date or (end - timedelta(days=365))
+        span = (end - start).days
+        count = max(min(points, span + 1), 1)
+        samples = [start + timedelta(days=round(index * span / max(count - 1, 1))) for index in range(count)]
+
+        # Bucket i holds snapshots after sample i-1 up to and including sample i.
+        thresholds = [sample + timedelta(days=1) for sample in samples[:-1]]
+        bucket = func.width_bucket(
+            BalanceSnapshot.as_of_date, bindparam("thresholds", thresholds, type_=ARRAY(Date))
+        )
+        first = (
+            select(func.max(BalanceSnapshot.as_of_date))
+            .where(BalanceSnapshot.user_id == user_id, BalanceSnapshot.as_of_date <= start)
+            .scalar_subquery()
+        )
+        last_value = type_coerce(
+            func.array_agg(aggregate_order_by(BalanceSnapshot.net_worth, BalanceSnapshot.as_of_date.desc())),
+            ARRAY(BalanceSnapshot.net_worth.type),
+        )[1]
+        stmt = (
+            select(bucket.label("bucket"), last_value)
+            .where(
+                BalanceSnapshot.user_id == user_id,
+                BalanceSnapshot.as_of_date >= func.coalesce(first, start),
+                BalanceSnapshot.as_of_date <= end,
+                BalanceSnapshot.net_worth.is_not(None),
+            )
+            .group_by(bucket)
+        )
+        latest = dict((await self.session.execute(stmt)).tuples().all())
+
+        history: list[tuple[date, Decimal]] = []
+        value: Optional[Decimal] = None
+        for index, sample in enumerate(samples):
+            value = latest.get(index, value)
+            if value is not None:
+                history.append((sample, value))
+        return history
+
+    async def portfolio_history(
+        self,
+        user_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> list[tuple[date, Decimal]]:
+        """Total holdings value on every snapshot date in the range, in one query."""
+        end = end_date or date.today()
+        start = start_date or (end - timedelta(days=365))
+
+        per_account = (
+            select(
+                HoldingSnapshot.account_id,
+                HoldingSnapshot.as_of_date,
+                func.coalesce(func.sum(HoldingSnapshot.institution_value), 0).label("value"),
+            )
+            .join(Account, HoldingSnapshot.account_id == Account.id)
+            .join(Item, Account.item_id == Item.id)
+            .where(Item.user_id == user_id, HoldingSnapshot.as_of_date <= end)
+            .group_by(HoldingSnapshot.account_id, HoldingSnapshot.as_of_date)
+            .cte("per_account")
+        )
+        series = _carried_forward(per_account, ["value"])
+        stmt = select(series).where(series.c.as_of_date >= start).order_by(series.c.as_of_date)
+        result = await self.session.execute(stmt)
+        return [(row.as_of_date, row.value) for row in result]
+
+    async def account_balance_history(
+        self,
+        account_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> list[AccountBalanceSnapshot]:
+        end = end_date or date.today()
+        start = start_date or (end - timedelta(days=365))
+        stmt = (
+            select(AccountBalanceSnapshot)
+            .where(
+                AccountBalanceSnapshot.account_id == account_id,
+                AccountBalanceSnapshot.as_of_date >= start,
+                AccountBalanceSnapshot.as_of_date <= end,
+            )
+            .order_by(AccountBalanceSnapshot.as_of_date)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
+    async def balance_breakdown_history(
+        self,
+        user_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> list[BalanceBreakdown]:
+        """Liquid, investment and liability totals per snapshot date from account snapshots."""
+        end = end_date or date.today()
+        start = start_date or (end - timedelta(days=365))
+
+        balance = func.coalesce(AccountBalanceSnapshot.current_balance, 0)
+        account_class = _balance_class(AccountBalanceSnapshot.type)
+        per_account = (
+            select(
+                AccountBalanceSnapshot.account_id,
+                AccountBalanceSnapshot.as_of_date,
+                *(
+                    case((account_class == name, balance), else_=0).label(name)
+                    for name in BALANCE_CLASSES
+                ),
+            )
+            .join(Account, AccountBalanceSnapshot.account_id == Account.id)
+            .join(Item, Account.item_id == Item.id)
+            .where(Item.user_id == user_id, AccountBalanceSnapshot.as_of_date <= end)
+            .cte("per_account")
+        )
+        series = _carried_forward(per_account, BALANCE_CLASSES)
+        stmt = select(series).where(series.c.as_of_date >= start).order_by(series.c.as_of_date)
+        result = await self.session.execute(stmt)
+        return [
+            BalanceBreakdown(
+                as_of_date=row.as_of_date,
+                liquid_assets=row.liquid_assets,
+                investments=row.investments,
+                liabilities=row.liabilities,
+            )
+            for row in result
+        ]
+
+    async def holdings_summary(self, user_id: str) -> HoldingsSummary:
+        """Allocation, cost basis and unrealized gain by type, security and account.
+
+        One ``GROUPING SETS`` aggregation produces every breakdown; the result is cached until
+        the user's next sync (which is when holdings change).
+        """
+        key = (user_id, await self.data_version(user_id))
+        cached = _holdings_summaries.get(key)
+        if cached is not None:
+            return cached
+
+        market_value = func.coalesce(
+            Holding.institution_value,
+            Holding.quantity * func.coalesce(Holding.institution_price, Security.close_price),
+            0,
+        )
+        known_basis = Holding.cost_basis.is_not(None)
+        grouping = func.grouping(Security.type, Security.id, Account.id)
+        stmt = (
+            select(
+                grouping.label("grouping"),
+                Security.type,
+                Security.id,
+                Security.ticker_symbol,
+                Security.name,
+                Account.id.label("account_id"),
+                func.coalesce(func.sum(market_value), 0).label("market_value"),
+                func.coalesce(func.sum(Holding.cost_basis), 0).label("cost_basis"),
+                func.coalesce(
+                    func.sum(case((known_basis, market_value - Holding.cost_basis))), 0
+                ).label("unrealized_gain"),
+                func.count().label("positions"),
+            )
+            .select_from(Holding)
+            .join(Security, Holding.security_id == Security.id)
+            .join(Account, Holding.account_id == Account.id)
+            .join(Item, Account.item_id == Item.id)
+            .where(Item.user_id == user_id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(Security.type),
+                    tuple_(Security.id, Security.type, Security.ticker_symbol, Security.name),
+                    tuple_(Account.id),
+                    tuple_(),
+                )
+            )
+            .order_by(grouping, func.sum(market_value).desc())
+        )
+        groups: dict[int, List[HoldingsGroup]] = {
+            grouping_set: [] for grouping_set in (_BY_TYPE, _BY_SECURITY, _BY_ACCOUNT, _TOTAL)
+        }
+        for row in await self.session.execute(stmt):
+            by_security = row.grouping == _BY_SECURITY
+            groups[row.grouping].append(
+                HoldingsGroup(
+                    market_value=row.market_value,
+                    cost_basis=row.cost_basis,
+                    unrealized_gain=row.unrealized_gain,
+                    positions=row.positions,
+                    security_type=row.type if row.grouping in (_BY_TYPE, _BY_SECURITY) else None,
+                    security_id=str(row.id) if by_security else None,
+                    ticker_symbol=row.ticker_symbol if by_security else None,
+                    name=row.name if by_security else None,
+                    account_id=str(row.account_id) if row.grouping == _BY_ACCOUNT else None,
+                )
+            )
+        # The empty grouping set always yields the total row, even without holdings.
+        summary = HoldingsSummary(
+            total=groups[_TOTAL][0],
+            by_type=groups[_BY_TYPE],
+            by_security=groups[_BY_SECURITY],
+            by_account=groups[_BY_ACCOUNT],
+        )
+        _holdings_summaries.put(key, summary)
+        return summary
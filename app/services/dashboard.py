@@ -0,0 +1,73 @@
+"""Everything the landing screen needs, read concurrently.
+
+The four reads are independent, so each runs on its own pooled connection and the request waits
+for the slowest one rather than the sum. The caller's session (already used to authenticate)
+serves one of them; the others check out short-lived sessions from the pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import async_session_factory
+from app.models.account import Account
+from app.services.analytics import (
+    AnalyticsService,
+    CashflowSummary,
+    HoldingsSummary,
+    NetWorthSummary,
+)
+from app.services.repositories import AccountRepository
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Dashboard:
+    accounts: List[Account]
+    net_worth: NetWorthSummary
+    cashflow: CashflowSummary
+    holdings: HoldingsSummary
+
+
+class DashboardService:
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ) -> None:
+        self.session = session
+        self.session_factory = session_factory
+
+    async def _pooled(self, read: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        async with self.session_factory() as session:
+            return await read(session)
+
+    async def dashboard(self, user_id: str, *, base_currency: Optional[str] = None) -> Dashboard:
+        results = await asyncio.gather(
+            AccountRepository(self.session).list_for_user(user_id),
+            self._pooled(
+                lambda session: AnalyticsService(session).net_worth(
+                    user_id, base_currency=base_currency
+                )
+            ),
+            self._pooled(
+                lambda session: AnalyticsService(session).cashflow_summary(
+                    user_id, base_currency=base_currency
+                )
+            ),
+            self._pooled(lambda session: AnalyticsService(session).holdings_summary(user_id)),
+            # Let every read finish before raising so none outlives the request's session.
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        accounts, net_worth, cashflow, holdings = results
+        return Dashboard(
+            accounts=accounts, net_worth=net_worth, cashflow=cashflow, holdings=holdings
+        )
@@ -0,0 +1,166 @@
+"""Daily liquid-balance projection from current balances, recurring series and average spend.
+
+The projection is built as NumPy arrays over the horizon: every active recurring series is
+expanded to its expected dates with one broadcast, scattered into per-day inflow/outflow arrays,
+average discretionary spend is added as a flat daily outflow, and the balance is a cumulative
+sum. Results are cached per (user, data version, horizon), so repeat calls between syncs skip the
+database work entirely.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.models.account import Account
+from app.models.item import Item
+from app.models.recurring_series import RecurringSeries
+from app.models.transaction import Transaction
+from app.services.analytics import AnalyticsService, _balance_class
+
+# Trailing window used to average spend that is not part of a recurring series.
+DISCRETIONARY_WINDOW_DAYS = 90
+
+
+@dataclass(slots=True)
+class ForecastPoint:
+    date: date
+    balance: Decimal
+    inflow: Decimal
+    outflow: Decimal
+
+
+@dataclass(slots=True)
+class Forecast:
+    start_date: date
+    starting_balance: Decimal
+    daily_discretionary_spend: Decimal
+    points: List[ForecastPoint]
+
+
+_forecasts: LRUCache[Tuple[str, str, int, date], Forecast] = LRUCache(maxsize=1_024)
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(f"{value:.2f}")
+
+
+def project(
+    *,
+    days: int,
+    starting_balance: float,
+    next_offsets: np.ndarray,
+    intervals: np.ndarray,
+    amounts: np.ndarray,
+    daily_discretionary: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-day (balance, inflow, outflow) for days 1..``days`` after today.
+
+    ``next_offsets`` are each series' next expected date as days after today, ``intervals``
+    their period in days and ``amounts`` signed flows (positive = money in).
+    """
+    inflow = np.zeros(days + 1)
+    outflow = np.zeros(days + 1)
+    if len(amounts):
+        # Late series are assumed to land tomorrow rather than dropped.
+        first = np.maximum(next_offsets, 1)
+        steps = np.arange(int(days // max(intervals.min(), 1)) + 1)
+        offsets = first[:, None] + np.rint(steps[None, :] * intervals[:, None]).astype(np.int64)
+        flows = np.broadcast_to(amounts[:, None], offsets.shape)
+        incoming = (offsets <= days) & (flows > 0)
+        outgoing = (offsets <= days) & (flows < 0)
+        np.add.at(inflow, offsets[incoming], flows[incoming])
+        np.add.at(outflow, offsets[outgoing], -flows[outgoing])
+    outflow[1:] += daily_discretionary
+    balance = starting_balance + np.cumsum(inflow - outflow)
+    return balance[1:], inflow[1:], outflow[1:]
+
+
+class ForecastService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.analytics = AnalyticsService(session)
+
+    async def forecast(self, user_id: str, *, days: int, today: Optional[date] = None) -> Forecast:
+        today = today or date.today()
+        key = (user_id, await self.analytics.data_version(user_id), days, today)
+        cached = _forecasts.get(key)
+        if cached is not None:
+            return cached
+        forecast = await self._build(user_id, days=days, today=today)
+        _forecasts.put(key, forecast)
+        return forecast
+
+    async def _build(self, user_id: str, *, days: int, today: date) -> Forecast:
+        balance_stmt = (
+            select(func.coalesce(func.sum(Account.current_balance), 0))
+            .join(Item, Account.item_id == Item.id)
+            .where(Item.user_id == user_id, _balance_class(Account.type) == "liquid_assets")
+        )
+        starting_balance = (await self.session.execute(balance_stmt)).scalar_one()
+
+        series_stmt = select(
+            RecurringSeries.merchant,
+            RecurringSeries.direction,
+            RecurringSeries.next_expected_date,
+            RecurringSeries.interval_days,
+            cast(RecurringSeries.average_amount, Float).label("amount"),
+        ).where(RecurringSeries.user_id == user_id, RecurringSeries.is_active.is_(True))
+        series = (await self.session.execute(series_stmt)).all()
+        recurring_outflows = [row.merchant for row in series if row.direction == "outflow"]
+
+        # Spend the recurring series do not already account for, averaged per day.
+        merchant = func.coalesce(Transaction.canonical_merchant, Transaction.merchant_name)
+        window_start = today - timedelta(days=DISCRETIONARY_WINDOW_DAYS)
+        discretionary_stmt = (
+            select(func.coalesce(func.sum(Transaction.amount), 0))
+            .join(Account, Transaction.account_id == Account.id)
+            .join(Item, Account.item_id == Item.id)
+            .where(
+                Item.user_id == user_id,
+                _balance_class(Account.type) == "liquid_assets",
+                Transaction.date > window_start,
+                Transaction.date <= today,
+                Transaction.removed_at.is_(None),
+                Transaction.amount > 0,
+            )
+        )
+        if recurring_outflows:
+            discretionary_stmt = discretionary_stmt.where(
+                func.coalesce(merchant, "").not_in(recurring_outflows)
+            )
+        discretionary = float((await self.session.execute(discretionary_stmt)).scalar_one())
+        daily_discretionary = discretionary / DISCRETIONARY_WINDOW_DAYS
+
+        balance, inflow, outflow = project(
+            days=days,
+            starting_balance=float(starting_balance),
+            next_offsets=np.array([(row.next_expected_date - today).days for row in series], dtype=np.int64),
+            intervals=np.array([row.interval_days for row in series], dtype=np.float64),
+            amounts=np.array(
+                [row.amount if row.direction == "inflow" else -row.amount for row in series],
+                dtype=np.float64,
+            ),
+            daily_discretionary=daily_discretionary,
+        )
+        return Forecast(
+            start_date=today,
+            starting_balance=_money(float(starting_balance)),
+            daily_discretionary_spend=_money(daily_discretionary),
+            points=[
+                ForecastPoint(
+                    date=today + timedelta(days=offset + 1),
+                    balance=_money(balance[offset]),
+                    inflow=_money(inflow[offset]),
+                    outflow=_money(outflow[offset]),
+                )
+                for offset in range(days)
+            ],
+        )
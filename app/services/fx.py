@@ -0,0 +1,140 @@
+"""FX rates: CSV loading, an in-memory as-of lookup table and bulk conversion.
+
+Rates are stored as the value of one unit of a currency in ``QUOTE_CURRENCY`` on the day it was
+published; any pair converts through it (``rate(from) / rate(to)``). A rate applies from its date
+until the next one, so weekends and holidays use the last published rate.
+
+``fx_rates`` is small (one row per currency per publishing day), so it is read once into one
+pair of sorted NumPy arrays per currency and every lookup is a ``searchsorted``. Conversion works
+on whole arrays of amounts: callers aggregate per currency (and per date where rates vary) in SQL
+and convert the handful of resulting rows in one pass, never per transaction.
+"""
+
+from __future__ import annotations
+
+import csv
+import time
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import settings
+from app.services.repositories import FxRateRepository
+
+QUOTE_CURRENCY = "USD"
+# Rates change daily at most; other processes pick up a reload within this long.
+RATE_TABLE_TTL_SECONDS = 300.0
+
+_EPOCH = date(1970, 1, 1)
+
+
+def epoch_days(day: date) -> int:
+    return (day - _EPOCH).days
+
+
+def base_currency_of(profile: Optional[dict]) -> str:
+    """The currency a user's totals are reported in."""
+    return ((profile or {}).get("base_currency") or settings.api.fx_base_currency).upper()
+
+
+def read_rates_csv(path: str | Path) -> List[Dict[str, Any]]:
+    """Rows of a ``date,currency,rate`` CSV (header required) ready for ``FxRateRepository``."""
+    rows: List[Dict[str, Any]] = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        for line, record in enumerate(csv.DictReader(handle), start=2):
+            try:
+                rate = Decimal(record["rate"])
+                row = {
+                    "currency": record["currency"].strip().upper(),
+                    "as_of_date": date.fromisoformat(record["date"].strip()),
+                    "rate": rate,
+                }
+            except (KeyError, TypeError, ValueError, InvalidOperation) as exc:
+                raise ValueError(f"{path}:{line}: invalid FX rate row {record!r}") from exc
+            if len(row["currency"]) != 3 or rate <= 0:
+                raise ValueError(f"{path}:{line}: invalid FX rate row {record!r}")
+            rows.append(row)
+    return rows
+
+
+class RateTable:
+    """Per-currency sorted (day, rate) arrays with vectorised as-of lookups."""
+
+    def __init__(self, rates: Sequence[Tuple[str, date, float]] = ()) -> None:
+        """``rates`` must be ordered by (currency, date), as ``FxRateRepository.all_rates`` returns."""
+        self._series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        if not rates:
+            return
+        currencies = np.array([row[0] for row in rates], dtype=object)
+        days = np.fromiter((epoch_days(row[1]) for row in rates), dtype=np.int64, count=len(rates))
+        values = np.fromiter((row[2] for row in rates), dtype=np.float64, count=len(rates))
+        starts = np.flatnonzero(np.r_[True, currencies[1:] != currencies[:-1]])
+        for start, end in zip(starts, np.r_[starts[1:], len(rates)]):
+            self._series[currencies[start]] = (days[start:end], values[start:end])
+
+    def __contains__(self, currency: str) -> bool:
+        return currency == QUOTE_CURRENCY or currency in self._series
+
+    def rates(self, currency: str, days: np.ndarray) -> np.ndarray:
+        """Value in ``QUOTE_CURRENCY`` of one ``currency`` on each of ``days`` (epoch days).
+
+        Days before the first published rate use the earliest one; unknown currencies are NaN.
+        """
+        if currency == QUOTE_CURRENCY:
+            return np.ones(len(days))
+        series = self._series.get(currency)
+        if series is None:
+            return np.full(len(days), np.nan)
+        known_days, values = series
+        index = np.searchsorted(known_days, days, side="right") - 1
+        return values[np.maximum(index, 0)]
+
+    def factors(self, currencies: Sequence[Optional[str]], days: np.ndarray, base: str) -> np.ndarray:
+        """Multipliers converting amounts in ``currencies`` on ``days`` into ``base``.
+
+        A missing currency code is taken to already be ``base``. Pairs without a known rate are
+        NaN; callers must leave those amounts out rather than count them 1:1.
+        """
+        codes = np.array([code or base for code in currencies], dtype=object)
+        factors = np.ones(len(codes))
+        base_rates: Optional[np.ndarray] = None
+        for code in set(codes.tolist()) - {base}:
+            if base_rates is None:
+                base_rates = self.rates(base, days)
+            mask = codes == code
+            factors[mask] = self.rates(code, days[mask]) / base_rates[mask]
+        return factors
+
+
+_rate_table: Optional[RateTable] = None
+_rate_table_loaded_at = 0.0
+
+
+def invalidate_rate_table() -> None:
+    global _rate_table
+    _rate_table = None
+
+
+class FxService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.rates = FxRateRepository(session)
+
+    async def rate_table(self) -> RateTable:
+        """The process-wide table, reloaded after ``RATE_TABLE_TTL_SECONDS`` or a local load."""
+        global _rate_table, _rate_table_loaded_at
+        now = time.monotonic()
+        if _rate_table is None or now - _rate_table_loaded_at > RATE_TABLE_TTL_SECONDS:
+            _rate_table = RateTable(await self.rates.all_rates())
+            _rate_table_loaded_at = now
+        return _rate_table
+
+    async def load_csv(self, path: str | Path) -> int:
+        """Upsert a rate file into ``fx_rates``; the caller commits."""
+        written = await self.rates.upsert(read_rates_csv(path))
+        invalidate_rate_table()
+        return written
@@ -0,0 +1,198 @@
+"""Ingest-time merchant normalisation and categorisation.
+
+Every rule is a lowercase substring pattern mapped to a canonical merchant and, optionally, a
+category (Plaid ``personal_finance_category.primary`` values). All rules are compiled into one
+Aho-Corasick automaton, expanded to a full transition table, so a transaction costs one pass over
+its ``merchant_name`` and ``name`` however many rules exist.
+
+When several rules match, user rules beat built-in ones, then the longest pattern wins (so "uber
+eats" beats "uber"), then the earlier rule. Matches must start on a word boundary, which keeps
+"uber" out of "tuber". Unmatched transactions fall back to Plaid's ``merchant_name`` and primary
+category. Categories users enter (rules, budgets) go through ``normalize_category`` so they take
+the same ``UPPER_SNAKE`` form as Plaid's and compare equal to ``canonical_category``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.cache import LRUCache
+
+
+@dataclass(frozen=True, slots=True)
+class MatchRule:
+    pattern: str
+    merchant: str
+    category: Optional[str] = None
+
+
+BUILTIN_RULES: Tuple[MatchRule, ...] = tuple(
+    MatchRule(pattern, merchant, category)
+    for merchant, category, patterns in (
+        ("Amazon", "GENERAL_MERCHANDISE", ("amazon", "amzn", "amazon.com")),
+        ("Amazon Prime", "ENTERTAINMENT", ("prime video", "amazon prime", "amzn prime")),
+        ("Apple", "GENERAL_MERCHANDISE", ("apple.com", "apple store")),
+        ("Costco", "GENERAL_MERCHANDISE", ("costco",)),
+        ("Target", "GENERAL_MERCHANDISE", ("target",)),
+        ("Walmart", "GENERAL_MERCHANDISE", ("walmart", "wal-mart", "wm supercenter")),
+        ("Best Buy", "GENERAL_MERCHANDISE", ("best buy", "bestbuy")),
+        ("Home Depot", "HOME_IMPROVEMENT", ("home depot", "the home depot")),
+        ("Whole Foods", "FOOD_AND_DRINK", ("whole foods", "wholefds")),
+        ("Trader Joe's", "FOOD_AND_DRINK", ("trader joe",)),
+        ("Kroger", "FOOD_AND_DRINK", ("kroger",)),
+        ("Safeway", "FOOD_AND_DRINK", ("safeway",)),
+        ("Starbucks", "FOOD_AND_DRINK", ("starbucks", "sbux")),
+        ("McDonald's", "FOOD_AND_DRINK", ("mcdonald",)),
+        ("Chipotle", "FOOD_AND_DRINK", ("chipotle",)),
+        ("DoorDash", "FOOD_AND_DRINK", ("doordash", "dd *doordash")),
+        ("Uber Eats", "FOOD_AND_DRINK", ("uber eats", "ubereats", "uber   *eats")),
+        ("Uber", "TRANSPORTATION", ("uber",)),
+        ("Lyft", "TRANSPORTATION", ("lyft",)),
+        ("Shell", "TRANSPORTATION", ("shell oil", "shell service")),
+        ("Chevron", "TRANSPORTATION", ("chevron",)),
+        ("Exxon", "TRANSPORTATION", ("exxon", "exxonmobil")),
+        ("Delta", "TRAVEL", ("delta air",)),
+        ("United Airlines", "TRAVEL", ("united air", "united.com")),
+        ("Airbnb", "TRAVEL", ("airbnb",)),
+        ("Netflix", "ENTERTAINMENT", ("netflix",)),
+        ("Spotify", "ENTERTAINMENT", ("spotify",)),
+        ("Hulu", "ENTERTAINMENT", ("hulu",)),
+        ("Disney+", "ENTERTAINMENT", ("disney plus", "disneyplus")),
+        ("Comcast", "RENT_AND_UTILITIES", ("comcast", "xfinity")),
+        ("Verizon", "RENT_AND_UTILITIES", ("verizon",)),
+        ("AT&T", "RENT_AND_UTILITIES", ("at&t", "att*bill")),
+        ("T-Mobile", "RENT_AND_UTILITIES", ("t-mobile", "tmobile")),
+        ("PayPal", "TRANSFER_OUT", ("paypal",)),
+        ("Venmo", "TRANSFER_OUT", ("venmo",)),
+        ("Zelle", "TRANSFER_OUT", ("zelle",)),
+    )
+    for pattern in patterns
+)
+
+
+_CATEGORY_SEPARATORS = re.compile(r"[^0-9A-Z]+")
+
+
+def normalize_category(category: str) -> str:
+    """``"Food & drink"`` -> ``"FOOD_AND_DRINK"``, the form of Plaid's primary categories."""
+    return _CATEGORY_SEPARATORS.sub("_", category.upper().replace("&", " AND ")).strip("_")
+
+
+# (canonical merchant, category override)
+Classification = Tuple[Optional[str], Optional[str]]
+
+
+class MerchantMatcher:
+    """Aho-Corasick automaton over rule patterns; ``match`` returns the winning rule or None."""
+
+    def __init__(self, rules: Sequence[MatchRule], *, user_rule_count: int = 0) -> None:
+        self.rules = list(rules)
+        lengths = [len(rule.pattern) for rule in self.rules]
+        # Lower sorts first: user rules, then longer patterns, then declaration order.
+        self._rank = [
+            (0 if index < user_rule_count else 1, -lengths[index], index)
+            for index in range(len(self.rules))
+        ]
+        self._lengths = lengths
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, rule in enumerate(self.rules):
+            state = 0
+            for char in rule.pattern:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    outputs.append([])
+                state = following
+            outputs[state].append(index)
+
+        # Breadth-first, each state's full transition table is its failure state's table
+        # overlaid with its own edges, so matching never follows failure links at runtime.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char, following in goto[state].items():
+                fail[following] = delta[fail[state]].get(char, 0)
+                queue.append(following)
+        self._delta = delta
+        self._outputs: List[Optional[Tuple[int, ...]]] = [
+            tuple(sorted(found, key=self._rank.__getitem__)) or None for found in outputs
+        ]
+
+    def match(self, text: str) -> Optional[MatchRule]:
+        delta, outputs, lengths, rank = self._delta, self._outputs, self._lengths, self._rank
+        state = 0
+        best: Optional[int] = None
+        for end, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            found = outputs[state]
+            if found is None:
+                continue
+            for index in found:
+                start = end - lengths[index] + 1
+                if start == 0 or not text[start - 1].isalnum():
+                    if best is None or rank[index] < rank[best]:
+                        best = index
+                    break
+        return None if best is None else self.rules[best]
+
+
+class MerchantClassifier:
+    """Fills ``canonical_merchant`` / ``canonical_category`` on a batch of transaction rows.
+
+    Results are memoised per distinct (merchant_name, name) pair, so recurring descriptions are
+    matched once per classifier rather than once per row.
+    """
+
+    def __init__(self, user_rules: Sequence[MatchRule] = (), *, memo_size: int = 50_000) -> None:
+        self.matcher = MerchantMatcher(
+            [*user_rules, *BUILTIN_RULES],
+            user_rule_count=len(user_rules),
+        )
+        self.memo_size = memo_size
+        self._memo: Dict[Tuple[Optional[str], Optional[str]], Classification] = {}
+
+    def classify(self, merchant_name: Optional[str], name: Optional[str]) -> Classification:
+        key = (merchant_name, name)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+        rule = self.matcher.match(f"{merchant_name or ''} | {name or ''}".lower())
+        result = (rule.merchant, rule.category) if rule else (merchant_name, None)
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[key] = result
+        return result
+
+    def apply(self, rows: Iterable[dict]) -> None:
+        """Annotate repository rows in place; the fallback category is Plaid's primary category."""
+        classify = self.classify
+        for row in rows:
+            merchant, category = classify(row["merchant_name"], row["name"])
+            row["canonical_merchant"] = merchant
+            if category is None:
+                category = (row["personal_finance_category"] or {}).get("primary")
+            row["canonical_category"] = category
+
+
+# Compiled classifiers keyed by the user's rule set, so unchanged rules are not recompiled per sync.
+_classifiers: LRUCache[Tuple[MatchRule, ...], MerchantClassifier] = LRUCache(maxsize=256)
+
+
+def classifier_for(user_rules: Sequence[MatchRule] = ()) -> MerchantClassifier:
+    key = tuple(user_rules)
+    classifier = _classifiers.get(key)
+    if classifier is None:
+        classifier = MerchantClassifier(key)
+        _classifiers.put(key, classifier)
+    return classifier
@@ -4,6 +4,7 @@ import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional
 
+import orjson
 import plaid
 from plaid.api import plaid_api
 from plaid.model.accounts_balance_get_request import AccountsBalanceGetRequest
@@ -17,8 +18,13 @@ from plaid.model.transactions_sync_request import TransactionsSyncRequest
 from plaid.model.sandbox_public_token_create_request import (
     SandboxPublicTokenCreateRequest,
 )
+from plaid.model.sandbox_public_token_create_request_options import (
+    SandboxPublicTokenCreateRequestOptions,
+)
 
+from app.core.rate_limit import BucketConfig
 from app.core.settings import settings
+from app.services.plaid_governor import PlaidGovernor
 
 
 PLAID_ENVIRONMENTS: dict[str, str] = {
@@ -30,27 +36,70 @@ PLAID_ENVIRONMENTS: dict[str, str] = {
 
 @dataclass
 class SyncResult:
-    transactions: List[Dict[str, Any]]
+    """One decoded ``/transactions/sync`` page; the lists are the response JSON, not copies."""
+
+    added: List[Dict[str, Any]]
+    modified: List[Dict[str, Any]]
+    removed: List[str]
     accounts: List[Dict[str, Any]]
     next_cursor: str
     has_more: bool
 
+    @property
+    def row_count(self) -> int:
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+
+def build_governor() -> PlaidGovernor:
+    return PlaidGovernor(
+        endpoint_limits={
+            endpoint: BucketConfig.parse(rate)
+            for endpoint, rate in settings.plaid.endpoint_rate_limits.items()
+        },
+        max_concurrency=settings.plaid.max_concurrency,
+        max_retries=settings.plaid.max_retries,
+        base_delay=settings.plaid.retry_base_seconds,
+        max_delay=settings.plaid.retry_max_seconds,
+    )
+
 
 class PlaidService:
-    def __init__(self) -> None:
+    def __init__(self, governor: PlaidGovernor | None = None) -> None:
         plaid_env = PLAID_ENVIRONMENTS.get(settings.plaid.environment.lower(), plaid.Environment.Sandbox)
         configuration = plaid.Configuration(
-            host=plaid_env,
+            host=settings.plaid.host or plaid_env,
             api_key={
                 "clientId": settings.plaid.client_id,
                 "secret": settings.plaid.secret,
             },
         )
         self._api_client = plaid_api.PlaidApi(plaid.ApiClient(configuration))
+        self.governor = governor or build_governor()
 
     async def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
         method = getattr(self._api_client, method_name)
-        return await asyncio.to_thread(method, *args, **kwargs)
+        return await self.governor.run(
+            method_name,
+            lambda: asyncio.to_thread(method, *args, **kwargs),
+        )
+
+    async def _call_json(self, method_name: str, request: Any) -> Dict[str, Any]:
+        """Call an endpoint and decode the raw JSON body.
+
+        Skips the SDK's response model tree (and the dict copy we would then make of it): the
+        body is read off the socket in the worker thread and decoded once with orjson.
+        """
+        method = getattr(self._api_client, method_name)
+
+        def fetch() -> bytes:
+            response = method(request, _preload_content=False)
+            try:
+                return response.data
+            finally:
+                response.release_conn()
+
+        body = await self.governor.run(method_name, lambda: asyncio.to_thread(fetch))
+        return orjson.loads(body)
 
     async def create_link_token(self, user_id: str, products: Optional[Iterable[str]] = None) -> str:
         request = LinkTokenCreateRequest(
@@ -78,30 +127,15 @@ class PlaidService:
         cursor: Optional[str] = None,
         count: int = 500,
     ) -> SyncResult:
-        request = TransactionsSyncRequest(
-            access_token=access_token,
-            cursor=cursor,
-            count=count,
-        )
-        response = await self._call("transactions_sync", request)
-        added = response["added"]
-        modified = response["modified"]
-        removed = response["removed"]
-
-        transactions: List[Dict[str, Any]] = []
-        transactions.extend(added)
-        transactions.extend(modified)
-        # Removed transactions only include transaction ids; surface them for soft deletes.
-        for removed_txn in removed:
-            transactions.append(
-                {
-                    "transaction_id": removed_txn["transaction_id"],
-                    "removed": True,
-                }
-            )
-
+        request_kwargs: Dict[str, Any] = {"count": count}
+        if cursor:
+            request_kwargs["cursor"] = cursor
+        request = TransactionsSyncRequest(access_token=access_token, **request_kwargs)
+        response = await self._call_json("transactions_sync", request)
         return SyncResult(
-            transactions=transactions,
+            added=response["added"],
+            modified=response["modified"],
+            removed=[removed["transaction_id"] for removed in response["removed"]],
             accounts=response.get("accounts", []),
             next_cursor=response["next_cursor"],
             has_more=response["has_more"],
@@ -109,13 +143,11 @@ class PlaidService:
 
     async def accounts_balance(self, access_token: str) -> Dict[str, Any]:
         request = AccountsBalanceGetRequest(access_token=access_token)
-        response = await self._call("accounts_balance_get", request)
-        return response.to_dict()
+        return await self._call_json("accounts_balance_get", request)
 
     async def investments_holdings(self, access_token: str) -> Dict[str, Any]:
         request = InvestmentsHoldingsGetRequest(access_token=access_token)
-        response = await self._call("investments_holdings_get", request)
-        return response.to_dict()
+        return await self._call_json("investments_holdings_get", request)
 
     async def sandbox_public_token_create(
         self,
@@ -123,10 +155,13 @@ class PlaidService:
         initial_products: Iterable[str],
         options: Dict[str, Any] | None = None,
     ) -> str:
+        request_kwargs: Dict[str, Any] = {}
+        if options:
+            request_kwargs["options"] = SandboxPublicTokenCreateRequestOptions(**options)
         request = SandboxPublicTokenCreateRequest(
             institution_id=institution_id,
             initial_products=[Products(prod) for prod in initial_products],
-            options=options,
+            **request_kwargs,
         )
         response = await self._call("sandbox_public_token_create", request)
         return response["public_token"]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from loguru import logger
+from plaid.exceptions import ApiException
+from urllib3.exceptions import HTTPError as TransportError
+
+from app.core.rate_limit import BucketConfig, InMemoryRateLimitStorage
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_ERROR_TYPES = frozenset({"RATE_LIMIT_EXCEEDED", "API_ERROR"})
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        "INSTITUTION_DOWN",
+        "INSTITUTION_NOT_RESPONDING",
+        "INTERNAL_SERVER_ERROR",
+        "PLANNED_MAINTENANCE",
+        "PRODUCT_NOT_READY",
+    }
+)
+
+
+def extract_plaid_error(exc: ApiException) -> Dict[str, Any] | None:
+    """Decode the JSON error body Plaid attaches to an ``ApiException``."""
+    body = getattr(exc, "body", None)
+    if not body:
+        return None
+    try:
+        if isinstance(body, (bytes, bytearray)):
+            body = body.decode()
+        return json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    if not isinstance(exc, ApiException):
+        return False
+    error = extract_plaid_error(exc) or {}
+    return exc.status == 429 or error.get("error_type") == "RATE_LIMIT_EXCEEDED"
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, TransportError):
+        return True
+    if not isinstance(exc, ApiException):
+        return False
+    error = extract_plaid_error(exc) or {}
+    return (
+        exc.status in RETRYABLE_STATUS
+        or error.get("error_type") in RETRYABLE_ERROR_TYPES
+        or error.get("error_code") in RETRYABLE_ERROR_CODES
+    )
+
+
+@dataclass
+class EndpointStats:
+    calls: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight calls: +1 per window of successes, halved on a 429.
+
+    Decreases are applied at most once per ``cooldown`` seconds so a burst of concurrent 429s
+    from one overload episode only halves the limit once.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, cooldown: float = 1.0) -> None:
+        self.maximum = maximum
+        self.minimum = minimum
+        self.cooldown = cooldown
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        if self.limit < self.maximum:
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+
+    def on_rate_limited(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit / 2)
+
+
+class PlaidGovernor:
+    """Paces, bounds and retries Plaid API calls made through ``PlaidService._call``."""
+
+    def __init__(
+        self,
+        *,
+        endpoint_limits: Dict[str, BucketConfig],
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ) -> None:
+        self.endpoint_limits = endpoint_limits
+        self.concurrency = AdaptiveConcurrency(max_concurrency, min_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats: Dict[str, EndpointStats] = {}
+        self._buckets = InMemoryRateLimitStorage()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the ``attempt``-th retry (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def _pace(self, endpoint: str) -> None:
+        bucket = self.endpoint_limits.get(endpoint)
+        if bucket is None:
+            return
+        while True:
+            decision = self._buckets.acquire_nowait(endpoint, bucket)
+            if decision.allowed:
+                return
+            await asyncio.sleep(decision.retry_after)
+
+    async def run(self, endpoint: str, call: Callable[[], Awaitable[T]]) -> T:
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+        attempt = 0
+        while True:
+            await self._pace(endpoint)
+            await self.concurrency.acquire()
+            stats.calls += 1
+            try:
+                result = await call()
+            except Exception as exc:
+                if is_rate_limited(exc):
+                    stats.rate_limited += 1
+                    self.concurrency.on_rate_limited()
+                if attempt >= self.max_retries or not is_retryable(exc):
+                    stats.failures += 1
+                    raise
+                delay = self.backoff(attempt)
+                attempt += 1
+                stats.retries += 1
+                logger.warning(
+                    "Plaid {endpoint} failed ({error}); retry {attempt}/{max_retries} in {delay:.2f}s",
+                    endpoint=endpoint,
+                    error=type(exc).__name__ if not isinstance(exc, ApiException) else exc.status,
+                    attempt=attempt,
+                    max_retries=self.max_retries,
+                    delay=delay,
+                )
+            else:
+                self.concurrency.on_success()
+                return result
+            finally:
+                await self.concurrency.release()
+            await asyncio.sleep(delay)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "max_concurrency": self.concurrency.maximum,
+            "in_flight": self.concurrency.in_flight,
+            "endpoints": {
+                endpoint: {
+                    **stats.__dict__,
+                    "rate_per_sec": (
+                        self.endpoint_limits[endpoint].refill_per_sec
+                        if endpoint in self.endpoint_limits
+                        else None
+                    ),
+                }
+                for endpoint, stats in sorted(self.stats.items())
+            },
+        }
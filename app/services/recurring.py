@@ -0,0 +1,217 @@
+"""Recurring-series (subscription and bill) detection, run after each sync.
+
+A user's history is read once as one row per (canonical merchant, direction, day) and analysed
+as flat NumPy arrays: group boundaries, intervals, per-group medians, interval regularity and
+amount spread are all computed for every merchant at once, with no per-merchant Python loop.
+
+A group is recurring when its median interval falls in one of ``FREQUENCIES``, at least
+``MIN_REGULARITY`` of its intervals sit within that frequency's tolerance of the median, and its
+amounts vary by no more than ``MAX_AMOUNT_CV`` (coefficient of variation).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Float, Integer, cast, func, literal, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import settings
+from app.models.account import Account
+from app.models.item import Item
+from app.models.transaction import Transaction
+from app.services.repositories import RecurringSeriesRepository
+
+
+class Frequency(NamedTuple):
+    name: str
+    # Median interval range, in days, that classifies a series as this frequency.
+    low: float
+    high: float
+    tolerance: float
+    min_occurrences: int
+
+
+FREQUENCIES: tuple[Frequency, ...] = (
+    Frequency("weekly", 6, 8, 1, 4),
+    Frequency("biweekly", 13, 16, 2, 4),
+    Frequency("monthly", 27, 33, 4, 3),
+    Frequency("quarterly", 85, 97, 7, 3),
+    Frequency("annual", 350, 380, 14, 2),
+)
+MIN_REGULARITY = 0.75
+MAX_AMOUNT_CV = 0.35
+
+_EPOCH = date(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class DetectedSeries:
+    merchant: str
+    category: Optional[str]
+    direction: str
+    frequency: str
+    interval_days: float
+    average_amount: Decimal
+    last_amount: Decimal
+    occurrences: int
+    first_date: date
+    last_date: date
+    next_expected_date: date
+    confidence: float
+    is_active: bool
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(f"{value:.2f}")
+
+
+def detect_series(
+    merchants: Sequence[str],
+    outflow: np.ndarray,
+    days: np.ndarray,
+    amounts: np.ndarray,
+    categories: Sequence[Optional[str]],
+    *,
+    today: date,
+) -> List[DetectedSeries]:
+    """Find periodic series in rows sorted by (merchant, direction, day).
+
+    ``days`` are days since 1970-01-01, ``amounts`` positive magnitudes and ``outflow`` True for
+    money leaving the account (Plaid's positive amounts). One row per merchant, direction and day.
+    """
+    count = len(days)
+    if count < 2:
+        return []
+    merchant_keys = np.asarray(merchants, dtype=object)
+    starts_group = np.ones(count, dtype=bool)
+    starts_group[1:] = (merchant_keys[1:] != merchant_keys[:-1]) | (outflow[1:] != outflow[:-1])
+    group = np.cumsum(starts_group) - 1
+    groups = int(group[-1]) + 1
+    first = np.flatnonzero(starts_group)
+    last = np.append(first[1:] - 1, count - 1)
+    occurrences = last - first + 1
+
+    # Intervals between consecutive rows of the same group.
+    same = group[1:] == group[:-1]
+    intervals = np.diff(days)[same].astype(np.float64)
+    interval_group = group[1:][same]
+    if not len(intervals):
+        return []
+    interval_count = np.bincount(interval_group, minlength=groups)
+
+    # Per-group median: sort intervals within groups, then pick the middle one or two. Groups
+    # without intervals index a neighbour's slot and are masked out.
+    ordered = intervals[np.lexsort((intervals, interval_group))]
+    offsets = np.concatenate(([0], np.cumsum(interval_count)[:-1]))
+    lower = ordered[np.clip(offsets + (interval_count - 1) // 2, 0, len(ordered) - 1)]
+    upper = ordered[np.clip(offsets + interval_count // 2, 0, len(ordered) - 1)]
+    median = np.where(interval_count > 0, (lower + upper) / 2, 0.0)
+
+    frequency = np.full(groups, -1)
+    tolerance = np.zeros(groups)
+    min_occurrences = np.zeros(groups)
+    for index, band in enumerate(FREQUENCIES):
+        in_band = (median >= band.low) & (median <= band.high)
+        frequency[in_band] = index
+        tolerance[in_band] = band.tolerance
+        min_occurrences[in_band] = band.min_occurrences
+
+    on_schedule = np.abs(intervals - median[interval_group]) <= tolerance[interval_group]
+    regularity = np.bincount(interval_group, weights=on_schedule, minlength=groups) / np.maximum(
+        interval_count, 1
+    )
+
+    totals = np.bincount(group, weights=amounts, minlength=groups)
+    squares = np.bincount(group, weights=amounts * amounts, minlength=groups)
+    mean = totals / occurrences
+    spread = np.sqrt(np.maximum(squares / occurrences - mean * mean, 0.0))
+    variation = np.divide(spread, mean, out=np.full(groups, np.inf), where=mean > 0)
+
+    recurring = (
+        (frequency >= 0)
+        & (occurrences >= min_occurrences)
+        & (regularity >= MIN_REGULARITY)
+        & (variation <= MAX_AMOUNT_CV)
+    )
+    confidence = regularity * (1 - variation)
+    next_expected = days[last] + np.rint(median).astype(np.int64)
+    today_days = (today - _EPOCH).days
+    active = today_days <= next_expected + tolerance
+
+    series: List[DetectedSeries] = []
+    for index in np.flatnonzero(recurring):
+        head, tail = first[index], last[index]
+        series.append(
+            DetectedSeries(
+                merchant=merchants[head],
+                category=categories[tail],
+                direction="outflow" if outflow[head] else "inflow",
+                frequency=FREQUENCIES[frequency[index]].name,
+                interval_days=round(float(median[index]), 1),
+                average_amount=_money(mean[index]),
+                last_amount=_money(amounts[tail]),
+                occurrences=int(occurrences[index]),
+                first_date=_EPOCH + timedelta(days=int(days[head])),
+                last_date=_EPOCH + timedelta(days=int(days[tail])),
+                next_expected_date=_EPOCH + timedelta(days=int(next_expected[index])),
+                confidence=round(float(confidence[index]), 3),
+                is_active=bool(active[index]),
+            )
+        )
+    return series
+
+
+class RecurringService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.series = RecurringSeriesRepository(session)
+
+    async def refresh(self, user_id: str, *, today: Optional[date] = None) -> List[DetectedSeries]:
+        """Re-detect ``user_id``'s recurring series and replace the stored ones."""
+        today = today or date.today()
+        start = today - timedelta(days=settings.scheduler.recurring_lookback_days)
+        # Rows ingested before merchant normalisation existed fall back to Plaid's merchant name.
+        merchant = func.coalesce(Transaction.canonical_merchant, Transaction.merchant_name)
+        outflow = (Transaction.amount > 0).label("outflow")
+        stmt = (
+            select(
+                merchant.label("merchant"),
+                outflow,
+                type_coerce(Transaction.date - literal(_EPOCH), Integer).label("day"),
+                cast(func.sum(func.abs(Transaction.amount)), Float).label("amount"),
+                func.max(Transaction.canonical_category).label("category"),
+            )
+            .join(Account, Transaction.account_id == Account.id)
+            .join(Item, Account.item_id == Item.id)
+            .where(
+                Item.user_id == user_id,
+                Transaction.date >= start,
+                Transaction.date <= today,
+                Transaction.removed_at.is_(None),
+                Transaction.pending.is_(False),
+                merchant.is_not(None),
+                Transaction.amount != 0,
+            )
+            .group_by(merchant, outflow, Transaction.date)
+            .order_by(merchant, outflow, Transaction.date)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            merchants, outflows, days, amounts, categories = zip(*rows)
+        else:
+            merchants, outflows, days, amounts, categories = (), (), (), (), ()
+        detected = detect_series(
+            merchants,
+            np.fromiter(outflows, dtype=bool, count=len(rows)),
+            np.fromiter(days, dtype=np.int64, count=len(rows)),
+            np.fromiter(amounts, dtype=np.float64, count=len(rows)),
+            categories,
+            today=today,
+        )
+        await self.series.replace(user_id, [asdict(series) for series in detected])
+        return detected
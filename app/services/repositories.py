@@ -1,20 +1,70 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Iterable, Sequence
-
-from sqlalchemy import select, update
-from sqlalchemy.dialects.postgresql import insert
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Date,
+    Float,
+    Integer,
+    Numeric,
+    Row,
+    Select,
+    String,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    event,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.cache import LRUCache
+from app.core.settings import settings
 from app.models.account import Account
+from app.models.account_balance_snapshot import AccountBalanceSnapshot
 from app.models.balance_snapshot import BalanceSnapshot
+from app.models.budget import Budget
+from app.models.category_spend import CategorySpend
+from app.models.fx_rate import FxRate
 from app.models.holding import Holding
+from app.models.holding_snapshot import HoldingSnapshot
 from app.models.item import Item
+from app.models.merchant_rule import MerchantRule
+from app.models.recurring_series import RecurringSeries
 from app.models.security import Security
 from app.models.transaction import Transaction
 from app.models.user import User
+from app.services.merchants import MatchRule, MerchantClassifier, classifier_for, normalize_category
+
+
+def _parse_date(value: str | date | None) -> date | None:
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def _parse_datetime(value: str | datetime | None) -> datetime | None:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 
 class UserRepository:
@@ -35,6 +85,105 @@ class UserRepository:
         return user
 
 
+class MerchantRuleRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def list(self, user_id: str) -> list[MerchantRule]:
+        result = await self.session.execute(
+            select(MerchantRule)
+            .where(MerchantRule.user_id == user_id)
+            .order_by(MerchantRule.created_at, MerchantRule.pattern)
+        )
+        return list(result.scalars())
+
+    async def match_rules(self, user_id: str) -> Tuple[MatchRule, ...]:
+        result = await self.session.execute(
+            select(MerchantRule.pattern, MerchantRule.merchant, MerchantRule.category)
+            .where(MerchantRule.user_id == user_id)
+            .order_by(MerchantRule.created_at, MerchantRule.pattern)
+        )
+        return tuple(MatchRule(*row) for row in result)
+
+    async def upsert(
+        self,
+        user_id: str,
+        *,
+        pattern: str,
+        merchant: str,
+        category: str | None = None,
+    ) -> MerchantRule:
+        stmt = insert(MerchantRule).values(
+            user_id=user_id,
+            pattern=pattern.strip().lower(),
+            merchant=merchant,
+            category=normalize_category(category) if category else None,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MerchantRule.user_id, MerchantRule.pattern],
+            set_={
+                "merchant": stmt.excluded.merchant,
+                "category": stmt.excluded.category,
+                "updated_at": func.now(),
+            },
+        ).returning(MerchantRule)
+        result = await self.session.execute(stmt, execution_options={"populate_existing": True})
+        return result.scalar_one()
+
+    async def delete(self, user_id: str, rule_id: str) -> bool:
+        result = await self.session.execute(
+            delete(MerchantRule).where(MerchantRule.id == rule_id, MerchantRule.user_id == user_id)
+        )
+        return result.rowcount > 0
+
+
+class BudgetRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def progress(self, user_id: str, month: date) -> list:
+        """Each budget with its ``month`` spend counter; one indexed join, no transaction scan."""
+        spend = CategorySpend.__table__
+        stmt = (
+            select(
+                Budget.id,
+                Budget.category,
+                Budget.monthly_limit,
+                func.coalesce(spend.c.spent, 0).label("spent"),
+                func.coalesce(spend.c.transaction_count, 0).label("transaction_count"),
+            )
+            .outerjoin(
+                spend,
+                (spend.c.user_id == Budget.user_id)
+                & (spend.c.category == Budget.category)
+                & (spend.c.month == month.replace(day=1)),
+            )
+            .where(Budget.user_id == user_id)
+            .order_by(Budget.category)
+        )
+        result = await self.session.execute(stmt)
+        return list(result)
+
+    async def upsert(self, user_id: str, *, category: str, monthly_limit: Decimal) -> Budget:
+        stmt = insert(Budget).values(
+            user_id=user_id,
+            category=normalize_category(category),
+            monthly_limit=monthly_limit,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Budget.user_id, Budget.category],
+            set_={"monthly_limit": stmt.excluded.monthly_limit, "updated_at": func.now()},
+        ).returning(Budget)
+        result = await self.session.execute(stmt, execution_options={"populate_existing": True})
+        return result.scalar_one()
+
+    async def delete(self, user_id: str, budget_id: str) -> bool:
+        result = await self.session.execute(
+            delete(Budget).where(Budget.id == budget_id, Budget.user_id == user_id)
+        )
+        return result.rowcount > 0
+
+
 class ItemRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -88,10 +237,24 @@ class ItemRepository:
         stmt = (
             update(Item)
             .where(Item.id == item_id)
-            .values(cursor=cursor, last_successful_sync=last_successful_sync)
+            .values(
+                cursor=cursor,
+                last_successful_sync=last_successful_sync,
+                data_version=Item.data_version + 1,
+            )
         )
         await self.session.execute(stmt)
 
+    async def bump_data_version(self, item_id: str) -> None:
+        """Mark the item's data as changed in the transaction about to commit."""
+        await self.session.execute(
+            update(Item).where(Item.id == item_id).values(data_version=Item.data_version + 1)
+        )
+
+    async def save_cursor(self, *, item_id: str, cursor: str | None) -> None:
+        """Checkpoint pagination progress without marking the sync as successful."""
+        await self.session.execute(update(Item).where(Item.id == item_id).values(cursor=cursor))
+
     async def get_by_id(self, item_id: str) -> Item | None:
         result = await self.session.execute(select(Item).where(Item.id == item_id))
         return result.scalar_one_or_none()
@@ -101,6 +264,24 @@ class AccountRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    @staticmethod
+    def _for_user(user_id: str, *entities: Any) -> Select:
+        return (
+            select(*entities)
+            .join(Item, Account.item_id == Item.id)
+            .where(Item.user_id == user_id)
+            .order_by(Account.name)
+        )
+
+    async def list_for_user(self, user_id: str) -> list[Account]:
+        result = await self.session.execute(self._for_user(user_id, Account))
+        return list(result.scalars())
+
+    async def list_columns_for_user(self, user_id: str, columns: Sequence[Any]) -> list[Row]:
+        """Only ``columns`` of the user's accounts, as rows, in ``list_for_user`` order."""
+        result = await self.session.execute(self._for_user(user_id, *columns))
+        return list(result)
+
     async def bulk_upsert(self, accounts: Sequence[dict], item_id: str) -> None:
         for account_data in accounts:
             stmt = (
@@ -148,87 +329,288 @@ class AccountRepository:
         return Decimal(str(value))
 
 
+# Rows per multi-row INSERT; at <= 17 bind parameters a row this stays well under asyncpg's 32k limit.
+WRITE_BATCH = 1_000
+
+_TRANSACTION_UPDATE_COLUMNS = (
+    "transaction_code",
+    "name",
+    "merchant_name",
+    "canonical_merchant",
+    "canonical_category",
+    "transaction_type",
+    "amount",
+    "iso_currency_code",
+    "date",
+    "authorized_date",
+    "pending",
+    "payment_channel",
+    "personal_finance_category",
+    "category",
+    "counterparty",
+    "last_modified_at",
+)
+
+
+def _batched_by_key(rows: Iterable[dict], key: str, size: int) -> Iterator[list[dict]]:
+    """Group rows into batches of ``size``, keeping the last row for a repeated ``key``.
+
+    A single ``INSERT ... ON CONFLICT DO UPDATE`` cannot touch the same row twice, and Plaid
+    can report a transaction in both ``added`` and ``modified`` on one page.
+    """
+    batch: dict[str, dict] = {}
+    for row in rows:
+        batch[row[key]] = row
+        if len(batch) >= size:
+            yield list(batch.values())
+            batch = {}
+    if batch:
+        yield list(batch.values())
+
+
+# (account_id, canonical category, first of month) -> [net amount, transaction count]
+SpendDeltas = Dict[Tuple[str, str, date], List[Any]]
+
+
+def _add_spend(
+    deltas: SpendDeltas,
+    account_id: Any,
+    category: str | None,
+    day: date,
+    amount: Decimal,
+    count: int,
+) -> None:
+    if category is None:
+        return
+    entry = deltas.setdefault((str(account_id), category, day.replace(day=1)), [Decimal(0), 0])
+    entry[0] += amount
+    entry[1] += count
+
+
+class CategorySpendRepository:
+    """Maintains ``category_spend`` from transaction deltas instead of re-aggregating reads."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def apply(self, deltas: SpendDeltas) -> None:
+        """Add per-account deltas to their users' counters in one statement."""
+        keys = sorted(key for key, (amount, count) in deltas.items() if amount or count)
+        if not keys:
+            return
+        incoming = func.unnest(
+            bindparam("account_ids", [key[0] for key in keys], type_=ARRAY(UUID)),
+            bindparam("categories", [key[1] for key in keys], type_=ARRAY(String)),
+            bindparam("months", [key[2] for key in keys], type_=ARRAY(Date)),
+            bindparam("amounts", [deltas[key][0] for key in keys], type_=ARRAY(Numeric(18, 2))),
+            bindparam("counts", [deltas[key][1] for key in keys], type_=ARRAY(Integer)),
+        ).table_valued("account_id", "category", "month", "amount", "count").render_derived(name="delta")
+        spend = CategorySpend.__table__
+        stmt = insert(spend).from_select(
+            ["id", "user_id", "category", "month", "spent", "transaction_count"],
+            select(
+                func.gen_random_uuid(),
+                Item.user_id,
+                incoming.c.category,
+                incoming.c.month,
+                func.sum(incoming.c.amount),
+                func.sum(incoming.c.count),
+            )
+            .select_from(incoming)
+            .join(Account, Account.id == incoming.c.account_id)
+            .join(Item, Account.item_id == Item.id)
+            .group_by(Item.user_id, incoming.c.category, incoming.c.month)
+            # A stable order keeps concurrent syncs of one user's items from deadlocking.
+            .order_by(Item.user_id, incoming.c.category, incoming.c.month),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[spend.c.user_id, spend.c.category, spend.c.month],
+            set_={
+                "spent": spend.c.spent + stmt.excluded.spent,
+                "transaction_count": spend.c.transaction_count + stmt.excluded.transaction_count,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def rebuild(self, user_id: str | None = None) -> int:
+        """Recompute counters from ``transactions``, for one user or everyone (initial backfill)."""
+        spend = CategorySpend.__table__
+        month = cast(func.date_trunc("month", Transaction.date), Date)
+        totals = (
+            select(
+                func.gen_random_uuid(),
+                Item.user_id,
+                Transaction.canonical_category,
+                month,
+                func.sum(Transaction.amount),
+                func.count(),
+            )
+            .join(Account, Transaction.account_id == Account.id)
+            .join(Item, Account.item_id == Item.id)
+            .where(Transaction.removed_at.is_(None), Transaction.canonical_category.is_not(None))
+            .group_by(Item.user_id, Transaction.canonical_category, month)
+        )
+        clear = delete(spend)
+        if user_id is not None:
+            totals = totals.where(Item.user_id == user_id)
+            clear = clear.where(spend.c.user_id == user_id)
+        await self.session.execute(clear)
+        result = await self.session.execute(
+            insert(spend).from_select(
+                ["id", "user_id", "category", "month", "spent", "transaction_count"], totals
+            )
+        )
+        return result.rowcount
+
+
 class TransactionRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.spend = CategorySpendRepository(session)
 
-    async def bulk_upsert(self, transactions: Sequence[dict], plaid_account_id_map: dict[str, str]) -> None:
-        for txn in transactions:
-            if txn.get("removed"):
-                await self._mark_removed(txn, plaid_account_id_map)
-                continue
-            account_id = plaid_account_id_map.get(txn["account_id"])
-            if not account_id:
-                continue
-            amount = self._signed_amount(txn)
-            stmt = (
-                insert(Transaction)
-                .values(
-                    account_id=account_id,
-                    plaid_transaction_id=txn["transaction_id"],
-                    transaction_id=txn.get("transaction_id"),
-                    transaction_code=txn.get("transaction_code"),
-                    name=txn.get("name"),
-                    merchant_name=txn.get("merchant_name"),
-                    transaction_type=txn.get("transaction_type"),
-                    amount=amount,
-                    iso_currency_code=txn.get("iso_currency_code"),
-                    date=self._parse_date(txn.get("date")),
-                    authorized_date=self._parse_date(txn.get("authorized_date")),
-                    pending=txn.get("pending", False),
-                    payment_channel=txn.get("payment_channel"),
-                    personal_finance_category=txn.get("personal_finance_category"),
-                    category=txn.get("category"),
-                    counterparty=txn.get("counterparty"),
-                    last_modified_at=self._parse_datetime(txn.get("datetime")),
-                )
-                .on_conflict_do_update(
-                    index_elements=[Transaction.plaid_transaction_id],
-                    set_={
-                        "transaction_code": txn.get("transaction_code"),
-                        "name": txn.get("name"),
-                        "merchant_name": txn.get("merchant_name"),
-                        "transaction_type": txn.get("transaction_type"),
-                        "amount": amount,
-                        "iso_currency_code": txn.get("iso_currency_code"),
-                        "date": self._parse_date(txn.get("date")),
-                        "authorized_date": self._parse_date(txn.get("authorized_date")),
-                        "pending": txn.get("pending", False),
-                        "payment_channel": txn.get("payment_channel"),
-                        "personal_finance_category": txn.get("personal_finance_category"),
-                        "category": txn.get("category"),
-                        "counterparty": txn.get("counterparty"),
-                        "last_modified_at": self._parse_datetime(txn.get("datetime")),
-                    },
-                )
+    async def bulk_upsert(
+        self,
+        transactions: Iterable[dict],
+        plaid_account_id_map: dict[str, str],
+        *,
+        classifier: MerchantClassifier | None = None,
+    ) -> int:
+        """Upsert Plaid transaction payloads in multi-row batches; returns rows written.
+
+        Each batch is run through ``classifier`` (built-in merchant rules by default) to fill the
+        canonical merchant and category columns. The batch's previous state is read first so
+        ``category_spend`` moves by exactly what the upsert changed.
+        """
+        classifier = classifier or classifier_for()
+        table = Transaction.__table__
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.plaid_transaction_id, table.c.date],
+            set_={
+                **{column: stmt.excluded[column] for column in _TRANSACTION_UPDATE_COLUMNS},
+                # An upsert means Plaid considers the transaction live again.
+                "removed_at": None,
+                "updated_at": func.now(),
+            },
+        )
+        written = 0
+        rows = self._rows(transactions, plaid_account_id_map)
+        for batch in _batched_by_key(rows, "plaid_transaction_id", WRITE_BATCH):
+            classifier.apply(batch)
+            previous = await self._previous(batch)
+            moved = [
+                row
+                for row in batch
+                if row["plaid_transaction_id"] in previous
+                and previous[row["plaid_transaction_id"]].date != row["date"]
+            ]
+            if moved:
+                await self._relocate(moved)
+            await self.session.execute(stmt, batch)
+            await self.spend.apply(self._spend_deltas(batch, previous))
+            written += len(batch)
+        return written
+
+    async def _previous(self, batch: list[dict]) -> dict[str, Any]:
+        """Stored state of the batch's transactions that already exist, by plaid id."""
+        table = Transaction.__table__
+        incoming = func.unnest(
+            bindparam("plaid_ids", [row["plaid_transaction_id"] for row in batch], type_=ARRAY(String)),
+        ).table_valued("plaid_transaction_id").render_derived(name="incoming")
+        result = await self.session.execute(
+            select(
+                table.c.plaid_transaction_id,
+                table.c.account_id,
+                table.c.date,
+                table.c.amount,
+                table.c.canonical_category,
+                table.c.removed_at,
+            ).join(incoming, table.c.plaid_transaction_id == incoming.c.plaid_transaction_id)
+        )
+        return {row.plaid_transaction_id: row for row in result}
+
+    @staticmethod
+    def _spend_deltas(batch: list[dict], previous: dict[str, Any]) -> SpendDeltas:
+        deltas: SpendDeltas = {}
+        for row in batch:
+            old = previous.get(row["plaid_transaction_id"])
+            account_id = row["account_id"]
+            if old is not None:
+                # The upsert never rewrites ``account_id``, so the stored account keeps the row.
+                account_id = old.account_id
+                if old.removed_at is None:
+                    _add_spend(deltas, account_id, old.canonical_category, old.date, -old.amount, -1)
+            _add_spend(deltas, account_id, row["canonical_category"], row["date"], row["amount"], 1)
+        return deltas
+
+    async def _relocate(self, batch: list[dict]) -> None:
+        """Move already-stored rows whose ``date`` Plaid changed onto their new date.
+
+        The conflict target includes the partition key, so without this a re-dated transaction
+        would be inserted a second time in its new month. Updating the partition key makes
+        Postgres move the row across partitions and keeps its ``id``.
+        """
+        table = Transaction.__table__
+        incoming = func.unnest(
+            bindparam("plaid_ids", [row["plaid_transaction_id"] for row in batch], type_=ARRAY(String)),
+            bindparam("dates", [row["date"] for row in batch], type_=ARRAY(Date)),
+        ).table_valued("plaid_transaction_id", "date").render_derived(name="incoming")
+        await self.session.execute(
+            update(table)
+            .where(
+                table.c.plaid_transaction_id == incoming.c.plaid_transaction_id,
+                table.c.date != incoming.c.date,
             )
-            await self.session.execute(stmt)
+            .values(date=incoming.c.date, updated_at=func.now())
+        )
 
-    async def _mark_removed(self, transaction: dict, plaid_account_id_map: dict[str, str]) -> None:
-        transaction_id = transaction.get("transaction_id")
-        if not transaction_id:
+    async def mark_removed(self, transaction_ids: Sequence[str]) -> None:
+        """Soft-delete a page's removed ids with one statement, whatever the page size."""
+        if not transaction_ids:
             return
+        now = func.now()
+        table = Transaction.__table__
         stmt = (
-            update(Transaction)
-            .where(Transaction.plaid_transaction_id == transaction_id)
-            .values(pending=False)
+            update(table)
+            .where(
+                table.c.plaid_transaction_id
+                == any_(bindparam("ids", list(transaction_ids), type_=ARRAY(String))),
+                table.c.removed_at.is_(None),
+            )
+            .values(removed_at=now, updated_at=now)
+            .returning(table.c.account_id, table.c.canonical_category, table.c.date, table.c.amount)
         )
-        await self.session.execute(stmt)
+        deltas: SpendDeltas = {}
+        for row in await self.session.execute(stmt):
+            _add_spend(deltas, row.account_id, row.canonical_category, row.date, -row.amount, -1)
+        await self.spend.apply(deltas)
 
-    @staticmethod
-    def _parse_date(value: str | None) -> date | None:
-        if not value:
-            return None
-        return date.fromisoformat(value)
-
-    @staticmethod
-    def _parse_datetime(value: str | None) -> datetime | None:
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            return None
+    @classmethod
+    def _rows(cls, transactions: Iterable[dict], plaid_account_id_map: dict[str, str]) -> Iterator[dict]:
+        for txn in transactions:
+            account_id = plaid_account_id_map.get(txn["account_id"])
+            if not account_id:
+                continue
+            yield {
+                "account_id": account_id,
+                "plaid_transaction_id": txn["transaction_id"],
+                "transaction_id": txn.get("transaction_id"),
+                "transaction_code": txn.get("transaction_code"),
+                "name": txn.get("name"),
+                "merchant_name": txn.get("merchant_name"),
+                "transaction_type": txn.get("transaction_type"),
+                "amount": cls._signed_amount(txn),
+                "iso_currency_code": txn.get("iso_currency_code"),
+                "date": _parse_date(txn.get("date")),
+                "authorized_date": _parse_date(txn.get("authorized_date")),
+                "pending": txn.get("pending", False),
+                "payment_channel": txn.get("payment_channel"),
+                "personal_finance_category": txn.get("personal_finance_category"),
+                "category": txn.get("category"),
+                "counterparty": txn.get("counterparty"),
+                "last_modified_at": _parse_datetime(txn.get("datetime")),
+            }
 
     @staticmethod
     def _signed_amount(transaction: dict) -> Decimal:
@@ -239,88 +621,297 @@ class TransactionRepository:
         return raw
 
 
+# plaid_security_id -> (securities.id, close_price, close_price_date). Securities are global, so
+# one process-wide cache lets every item's sync skip rows another item already wrote.
+SecurityCacheEntry = Tuple[str, Optional[Decimal], Optional[date]]
+security_cache: LRUCache[str, SecurityCacheEntry] = LRUCache(settings.scheduler.security_cache_size)
+
+_PENDING_SECURITIES = "pending_security_cache"
+_PRICE_SCALE = Decimal("0.0001")  # securities.close_price is NUMERIC(18, 4)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_security_cache(session: Session) -> None:
+    for key, entry in session.info.pop(_PENDING_SECURITIES, {}).items():
+        security_cache.put(key, entry)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_security_cache(session: Session) -> None:
+    session.info.pop(_PENDING_SECURITIES, None)
+
+
+def _close_price(value: float | Decimal | None) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(_PRICE_SCALE)
+
+
 class SecurityRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: LRUCache[str, SecurityCacheEntry] | None = None) -> None:
         self.session = session
+        self.cache = security_cache if cache is None else cache
 
     async def bulk_upsert(self, securities: Sequence[dict]) -> dict[str, str]:
+        """Return ``plaid_security_id -> id``, writing only securities that are new or repriced."""
+        incoming = {security["security_id"]: security for security in securities}
+        known = {key: self.cache.get(key) for key in incoming}
+        missing = [key for key, entry in known.items() if entry is None]
+        if missing:
+            known.update(await self._load(missing))
+
         security_ids: dict[str, str] = {}
-        for security in securities:
-            stmt = (
-                insert(Security)
-                .values(
-                    plaid_security_id=security["security_id"],
-                    name=security.get("name"),
-                    ticker_symbol=security.get("ticker_symbol"),
-                    isin=security.get("isin"),
-                    cusip=security.get("cusip"),
-                    type=security.get("type"),
-                    close_price=security.get("close_price"),
-                    close_price_date=security.get("close_price_date"),
-                    currency=security.get("iso_currency_code"),
-                )
-                .on_conflict_do_update(
-                    index_elements=[Security.plaid_security_id],
-                    set_={
-                        "name": security.get("name"),
-                        "ticker_symbol": security.get("ticker_symbol"),
-                        "isin": security.get("isin"),
-                        "cusip": security.get("cusip"),
-                        "type": security.get("type"),
-                        "close_price": security.get("close_price"),
-                        "close_price_date": security.get("close_price_date"),
-                        "currency": security.get("iso_currency_code"),
-                    },
-                )
-                .returning(Security.id, Security.plaid_security_id)
-            )
-            result = await self.session.execute(stmt)
-            sec_row = result.one()
-            mapping = sec_row._mapping
-            security_ids[mapping[Security.plaid_security_id]] = str(mapping[Security.id])
+        changed: list[dict] = []
+        for key, security in incoming.items():
+            row = self._row(security)
+            entry = known.get(key)
+            if entry and (entry[1], entry[2]) == (row["close_price"], row["close_price_date"]):
+                security_ids[key] = entry[0]
+            else:
+                changed.append(row)
+
+        if changed:
+            security_ids.update(await self._write(changed))
         return security_ids
 
+    async def _load(self, plaid_security_ids: list[str]) -> dict[str, SecurityCacheEntry]:
+        stmt = select(
+            Security.plaid_security_id,
+            Security.id,
+            Security.close_price,
+            Security.close_price_date,
+        ).where(
+            Security.plaid_security_id == any_(bindparam("ids", plaid_security_ids, type_=ARRAY(String)))
+        )
+        loaded: dict[str, SecurityCacheEntry] = {}
+        for row in await self.session.execute(stmt):
+            entry = (str(row.id), row.close_price, row.close_price_date)
+            loaded[row.plaid_security_id] = entry
+            # Already committed by whoever wrote it, so safe to share immediately.
+            self.cache.put(row.plaid_security_id, entry)
+        return loaded
+
+    async def _write(self, rows: list[dict]) -> dict[str, str]:
+        table = Security.__table__
+        written: dict[str, SecurityCacheEntry] = {}
+        for start in range(0, len(rows), WRITE_BATCH):
+            stmt = insert(table).values(rows[start : start + WRITE_BATCH])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.plaid_security_id],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in rows[0]
+                        if column != "plaid_security_id"
+                    },
+                    "updated_at": func.now(),
+                },
+            ).returning(table.c.plaid_security_id, table.c.id, table.c.close_price, table.c.close_price_date)
+            for row in await self.session.execute(stmt):
+                written[row.plaid_security_id] = (str(row.id), row.close_price, row.close_price_date)
+
+        # Drop stale entries now; the new values are published only once this transaction
+        # commits, so a rollback can never leave the cache pointing at rows that do not exist.
+        self.cache.invalidate(written)
+        self.session.sync_session.info.setdefault(_PENDING_SECURITIES, {}).update(written)
+        return {key: entry[0] for key, entry in written.items()}
+
+    @staticmethod
+    def _row(security: dict) -> dict:
+        return {
+            "plaid_security_id": security["security_id"],
+            "name": security.get("name"),
+            "ticker_symbol": security.get("ticker_symbol"),
+            "isin": security.get("isin"),
+            "cusip": security.get("cusip"),
+            "type": security.get("type"),
+            "close_price": _close_price(security.get("close_price")),
+            "close_price_date": _parse_date(security.get("close_price_as_of")),
+            "currency": security.get("iso_currency_code"),
+        }
+
+
+@dataclass(slots=True)
+class HoldingsDiff:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+
+# Compared at column scale so a float from Plaid equals the NUMERIC value read back.
+_HOLDING_SCALES = {
+    "quantity": Decimal("1e-8"),
+    "institution_value": Decimal("1e-4"),
+    "institution_price": Decimal("1e-8"),
+    "cost_basis": Decimal("1e-4"),
+}
+_HOLDING_VALUE_COLUMNS = (*_HOLDING_SCALES, "institution_price_as_of", "last_updated")
+
 
 class HoldingRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def bulk_upsert(
+    async def sync(
         self,
         holdings: Sequence[dict],
+        *,
+        account_ids: Iterable[str],
         plaid_account_id_map: dict[str, str],
         plaid_security_id_map: dict[str, str],
-    ) -> None:
+    ) -> HoldingsDiff:
+        """Make ``account_ids``' holdings match the payload: upsert changes, delete sold positions.
+
+        Accounts not listed in ``account_ids`` are left untouched, so a partial response never
+        wipes positions it did not report on.
+        """
+        scope = list(dict.fromkeys(str(account_id) for account_id in account_ids))
+        incoming = self._rows(holdings, plaid_account_id_map, plaid_security_id_map, set(scope))
+        diff = HoldingsDiff()
+        if not scope:
+            return diff
+
+        table = Holding.__table__
+        value_columns = [table.c[column] for column in _HOLDING_VALUE_COLUMNS]
+        current = await self.session.execute(
+            select(table.c.id, table.c.account_id, table.c.security_id, *value_columns).where(
+                table.c.account_id == any_(bindparam("account_ids", scope, type_=ARRAY(UUID)))
+            )
+        )
+        stale: list = []
+        for row in current:
+            key = (str(row.account_id), str(row.security_id))
+            wanted = incoming.get(key)
+            if wanted is None:
+                stale.append(row.id)
+            elif all(wanted[column] == row._mapping[column] for column in _HOLDING_VALUE_COLUMNS):
+                del incoming[key]
+                diff.unchanged += 1
+            else:
+                diff.updated += 1
+        diff.inserted = len(incoming) - diff.updated
+
+        changed = list(incoming.values())
+        for start in range(0, len(changed), WRITE_BATCH):
+            stmt = insert(table).values(changed[start : start + WRITE_BATCH])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.account_id, table.c.security_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in _HOLDING_VALUE_COLUMNS},
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        if stale:
+            await self.session.execute(
+                delete(table).where(table.c.id == any_(bindparam("ids", stale, type_=ARRAY(UUID))))
+            )
+            diff.deleted = len(stale)
+        return diff
+
+    @staticmethod
+    def _rows(
+        holdings: Iterable[dict],
+        plaid_account_id_map: dict[str, str],
+        plaid_security_id_map: dict[str, str],
+        scope: set[str],
+    ) -> dict[tuple[str, str], dict]:
+        rows: dict[tuple[str, str], dict] = {}
         for holding in holdings:
             account_id = plaid_account_id_map.get(holding.get("account_id"))
             security_id = plaid_security_id_map.get(holding.get("security_id"))
-            if not account_id or not security_id:
+            if not account_id or not security_id or account_id not in scope:
                 continue
-            stmt = (
-                insert(Holding)
-                .values(
-                    account_id=account_id,
-                    security_id=security_id,
-                    quantity=holding.get("quantity"),
-                    institution_value=holding.get("institution_value"),
-                    institution_price=holding.get("institution_price"),
-                    institution_price_as_of=holding.get("institution_price_as_of"),
-                    cost_basis=holding.get("cost_basis"),
-                    last_updated=holding.get("last_updated"),
-                )
-                .on_conflict_do_update(
-                    index_elements=[Holding.account_id, Holding.security_id],
-                    set_={
-                        "quantity": holding.get("quantity"),
-                        "institution_value": holding.get("institution_value"),
-                        "institution_price": holding.get("institution_price"),
-                        "institution_price_as_of": holding.get("institution_price_as_of"),
-                        "cost_basis": holding.get("cost_basis"),
-                        "last_updated": holding.get("last_updated"),
-                    },
-                )
+            row = {
+                "account_id": account_id,
+                "security_id": security_id,
+                "institution_price_as_of": _parse_date(holding.get("institution_price_as_of")),
+                "last_updated": _parse_datetime(holding.get("last_updated")),
+            }
+            for column, scale in _HOLDING_SCALES.items():
+                value = holding.get(column)
+                row[column] = None if value is None else Decimal(str(value)).quantize(scale)
+            rows[(account_id, security_id)] = row
+        return rows
+
+
+class HoldingSnapshotRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def capture(self, *, account_ids: Iterable[str], as_of_date: date) -> int:
+        """Copy the accounts' current holdings into ``as_of_date``'s snapshot, server-side.
+
+        The day's rows for these accounts are replaced wholesale, so a position sold between two
+        syncs on the same day does not linger in that day's snapshot. An account with no holdings
+        left gets one zero-valued row without a security, so history stops carrying its last
+        value forward once everything is sold.
+        """
+        scope = list(dict.fromkeys(str(account_id) for account_id in account_ids))
+        if not scope:
+            return 0
+        in_scope = bindparam("account_ids", scope, type_=ARRAY(UUID))
+        snapshots = HoldingSnapshot.__table__
+        await self.session.execute(
+            delete(snapshots).where(
+                snapshots.c.account_id == any_(in_scope),
+                snapshots.c.as_of_date == as_of_date,
             )
-            await self.session.execute(stmt)
+        )
+        holdings = Holding.__table__
+        accounts = Account.__table__
+        as_of = bindparam("as_of_date", as_of_date, type_=Date)
+        columns = ["id", "account_id", "security_id", "as_of_date", "quantity", "institution_value"]
+        positions = select(
+            func.gen_random_uuid(),
+            holdings.c.account_id,
+            holdings.c.security_id,
+            as_of,
+            holdings.c.quantity,
+            holdings.c.institution_value,
+        ).where(holdings.c.account_id == any_(in_scope))
+        sold_out = select(
+            func.gen_random_uuid(),
+            accounts.c.id,
+            null(),
+            as_of,
+            literal(0),
+            literal(0),
+        ).where(
+            accounts.c.id == any_(in_scope),
+            ~select(holdings.c.id).where(holdings.c.account_id == accounts.c.id).exists(),
+        )
+        result = await self.session.execute(
+            insert(snapshots).from_select(columns, positions.union_all(sold_out))
+        )
+        return result.rowcount
+
+
+class AccountBalanceSnapshotRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def capture(self, *, item_id: str, as_of_date: date) -> int:
+        """Upsert ``as_of_date``'s balances for every account of the item in one statement."""
+        accounts = Account.__table__
+        snapshots = AccountBalanceSnapshot.__table__
+        values = ["type", "iso_currency_code", "current_balance", "available_balance"]
+        stmt = insert(snapshots).from_select(
+            ["id", "account_id", "as_of_date", *values],
+            select(
+                func.gen_random_uuid(),
+                accounts.c.id,
+                bindparam("as_of_date", as_of_date, type_=Date),
+                *(accounts.c[column] for column in values),
+            ).where(accounts.c.item_id == item_id),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[snapshots.c.account_id, snapshots.c.as_of_date],
+            set_={**{column: stmt.excluded[column] for column in values}, "updated_at": func.now()},
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
 
 
 class BalanceSnapshotRepository:
@@ -364,3 +955,66 @@ class BalanceSnapshotRepository:
             )
         )
         await self.session.execute(stmt)
+
+
+class RecurringSeriesRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def replace(self, user_id: str, series: Sequence[Mapping[str, Any]]) -> None:
+        """Make ``series`` the user's full set, keeping ids stable for series seen before."""
+        stale = delete(RecurringSeries).where(RecurringSeries.user_id == user_id)
+        if series:
+            stmt = insert(RecurringSeries).values([{**row, "user_id": user_id} for row in series])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    RecurringSeries.user_id,
+                    RecurringSeries.merchant,
+                    RecurringSeries.direction,
+                ],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in series[0]
+                        if column not in {"merchant", "direction"}
+                    },
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+            stale = stale.where(
+                tuple_(RecurringSeries.merchant, RecurringSeries.direction).not_in(
+                    [(row["merchant"], row["direction"]) for row in series]
+                )
+            )
+        await self.session.execute(stale)
+
+
+class FxRateRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def upsert(self, rates: Iterable[Mapping[str, Any]]) -> int:
+        """Insert or overwrite ``currency``/``as_of_date``/``rate`` rows; returns rows written."""
+        written = 0
+        keyed = ({**row, "key": (row["currency"], row["as_of_date"])} for row in rates)
+        for batch in _batched_by_key(keyed, "key", WRITE_BATCH):
+            stmt = insert(FxRate).values(
+                [{column: row[column] for column in ("currency", "as_of_date", "rate")} for row in batch]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FxRate.currency, FxRate.as_of_date],
+                set_={"rate": stmt.excluded.rate, "updated_at": func.now()},
+            )
+            await self.session.execute(stmt)
+            written += len(batch)
+        return written
+
+    async def all_rates(self) -> list[tuple[str, date, float]]:
+        """Every stored rate ordered by (currency, as_of_date)."""
+        result = await self.session.execute(
+            select(FxRate.currency, FxRate.as_of_date, cast(FxRate.rate, Float)).order_by(
+                FxRate.currency, FxRate.as_of_date
+            )
+        )
+        return [tuple(row) for row in result]
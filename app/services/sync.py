@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import json
 from typing import Dict
 
 from loguru import logger
@@ -10,15 +10,23 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decrypt_string
+from app.core.settings import settings
 from app.models.account import Account
 from app.models.item import Item
 from app.services.analytics import AnalyticsService
+from app.services.merchants import MerchantClassifier, classifier_for
 from app.services.plaid import PlaidService, SyncResult, plaid_service
+from app.services.plaid_governor import extract_plaid_error
+from app.services.recurring import RecurringService
 from app.services.repositories import (
+    AccountBalanceSnapshotRepository,
     AccountRepository,
     BalanceSnapshotRepository,
     HoldingRepository,
+    HoldingsDiff,
+    HoldingSnapshotRepository,
     ItemRepository,
+    MerchantRuleRepository,
     SecurityRepository,
     TransactionRepository,
 )
@@ -31,6 +39,7 @@ class SyncOutcome:
     transactions_synced: int
     holdings_synced: int
     cursor: str | None
+    holdings_diff: HoldingsDiff | None = None
 
 
 class SyncOrchestrator:
@@ -38,12 +47,16 @@ class SyncOrchestrator:
         self.session = session
         self.plaid = plaid or plaid_service
         self.items = ItemRepository(session)
+        self.merchant_rules = MerchantRuleRepository(session)
         self.accounts = AccountRepository(session)
         self.transactions = TransactionRepository(session)
         self.securities = SecurityRepository(session)
         self.holdings = HoldingRepository(session)
+        self.holding_snapshots = HoldingSnapshotRepository(session)
         self.balance_snapshots = BalanceSnapshotRepository(session)
+        self.account_balances = AccountBalanceSnapshotRepository(session)
         self.analytics = AnalyticsService(session)
+        self.recurring = RecurringService(session)
 
     async def run_item_sync(self, item: Item) -> SyncOutcome:
         access_token = decrypt_string(item.access_token_encrypted)
@@ -52,17 +65,55 @@ class SyncOrchestrator:
         accounts_payload = await self.plaid.accounts_balance(access_token)
         await self.accounts.bulk_upsert(accounts_payload["accounts"], str(item.id))
         account_map = await self._account_map(item.id)
+        classifier = classifier_for(await self.merchant_rules.match_rules(str(item.user_id)))
+        await self._commit_chunk(item)
 
         total_transactions = 0
         has_more = True
         latest_cursor = cursor
+        committed_cursor = cursor
+        pending_pages = pending_rows = 0
+        restarts = 0
 
         while has_more:
-            sync_result = await self._sync_transactions(access_token=access_token, cursor=latest_cursor)
-            await self._persist_transactions(item, sync_result, account_map)
+            try:
+                sync_result = await self._sync_transactions(access_token=access_token, cursor=latest_cursor)
+            except ApiException as exc:
+                plaid_error = self._extract_plaid_error(exc) or {}
+                if plaid_error.get("error_code") != "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION":
+                    raise
+                restarts += 1
+                if restarts > settings.scheduler.sync_max_pagination_restarts:
+                    raise
+                # Drop the uncommitted chunk and resume from the cursor committed with the last one.
+                logger.info(
+                    "Item {item_id} changed during pagination; resuming from checkpoint ({restarts})",
+                    item_id=item.id,
+                    restarts=restarts,
+                )
+                await self.session.rollback()
+                total_transactions -= pending_rows
+                pending_pages = pending_rows = 0
+                latest_cursor = committed_cursor
+                account_map.clear()
+                account_map.update(await self._account_map(item.id))
+                continue
+            await self._persist_transactions(item, sync_result, account_map, classifier)
             latest_cursor = sync_result.next_cursor
             has_more = sync_result.has_more
-            total_transactions += len(sync_result.transactions)
+            total_transactions += sync_result.row_count
+            pending_pages += 1
+            pending_rows += sync_result.row_count
+            # Drop the decoded page before fetching the next so only one is ever alive.
+            del sync_result
+            if (
+                not has_more
+                or pending_pages >= settings.scheduler.sync_commit_every_pages
+                or pending_rows >= settings.scheduler.sync_commit_every_rows
+            ):
+                await self._checkpoint(item, latest_cursor)
+                committed_cursor = latest_cursor
+                pending_pages = pending_rows = 0
 
         holdings_payload = await self._fetch_investments_holdings(str(item.id), access_token)
         securities = holdings_payload.get("securities", [])
@@ -73,12 +124,27 @@ class SyncOrchestrator:
         else:
             security_map = {}
 
-        if holdings and security_map:
-            await self.holdings.bulk_upsert(
-                holdings,
-                plaid_account_id_map=account_map,
-                plaid_security_id_map=security_map,
-            )
+        # Only accounts Plaid reported on are reconciled; their unreported positions were sold.
+        reported_accounts = [
+            account_map[account["account_id"]]
+            for account in holdings_payload.get("accounts", [])
+            if account.get("account_id") in account_map
+        ]
+        holdings_diff = await self.holdings.sync(
+            holdings,
+            account_ids=reported_accounts,
+            plaid_account_id_map=account_map,
+            plaid_security_id_map=security_map,
+        )
+        today = datetime.now(timezone.utc).date()
+        await self.holding_snapshots.capture(account_ids=reported_accounts, as_of_date=today)
+        logger.info(
+            "Item {item_id} holdings: {inserted} inserted, {updated} updated, {deleted} deleted",
+            item_id=item.id,
+            inserted=holdings_diff.inserted,
+            updated=holdings_diff.updated,
+            deleted=holdings_diff.deleted,
+        )
 
         await self.items.update_cursor(
             item_id=str(item.id),
@@ -86,25 +152,45 @@ class SyncOrchestrator:
             last_successful_sync=datetime.now(timezone.utc),
         )
 
+        await self.account_balances.capture(item_id=str(item.id), as_of_date=today)
         net_worth = await self.analytics.net_worth(str(item.user_id))
+        cashflow = await self.analytics.cashflow_summary(str(item.user_id), end_date=today)
+        # ``assets`` includes investment accounts; the snapshot splits them out of liquid assets.
+        liquid = None if net_worth.assets is None else net_worth.assets - (net_worth.investments or 0)
         await self.balance_snapshots.upsert_snapshot(
             user_id=str(item.user_id),
-            as_of_date=datetime.now(timezone.utc).date(),
+            as_of_date=today,
             net_worth=net_worth.net_worth,
-            liquid_assets=net_worth.assets,
-            investments=None,
+            liquid_assets=liquid,
+            investments=net_worth.investments,
             liabilities=net_worth.liabilities,
-            cash_flow_in=None,
-            cash_flow_out=None,
+            cash_flow_in=cashflow.inflow,
+            cash_flow_out=cashflow.outflow,
         )
+        if total_transactions:
+            await self.recurring.refresh(str(item.user_id), today=today)
 
         return SyncOutcome(
             item_id=str(item.id),
             transactions_synced=total_transactions,
             holdings_synced=len(holdings_payload["holdings"]),
+            holdings_diff=holdings_diff,
             cursor=latest_cursor,
         )
 
+    async def _checkpoint(self, item: Item, cursor: str | None) -> None:
+        """Commit the pages persisted since the last checkpoint together with the cursor after them."""
+        await self.items.save_cursor(item_id=str(item.id), cursor=cursor)
+        await self._commit_chunk(item)
+
+    async def _commit_chunk(self, item: Item) -> None:
+        # Every chunk changes what analytics read, so it moves the item's data version even if
+        # the sync later fails. Expunging keeps the identity map from growing across a long
+        # backfill; the item's loaded attributes stay readable once detached.
+        await self.items.bump_data_version(str(item.id))
+        await self.session.commit()
+        self.session.expunge_all()
+
     async def _sync_transactions(self, access_token: str, cursor: str | None) -> SyncResult:
         return await self.plaid.transactions_sync(access_token, cursor)
 
@@ -113,13 +199,19 @@ class SyncOrchestrator:
         item: Item,
         sync_result: SyncResult,
         account_map: Dict[str, str],
+        classifier: MerchantClassifier,
     ) -> None:
         if sync_result.accounts:
             await self.accounts.bulk_upsert(sync_result.accounts, str(item.id))
         if sync_result.accounts:
             account_map.clear()
             account_map.update(await self._account_map(item.id))
-        await self.transactions.bulk_upsert(sync_result.transactions, plaid_account_id_map=account_map)
+        await self.transactions.bulk_upsert(
+            itertools.chain(sync_result.added, sync_result.modified),
+            plaid_account_id_map=account_map,
+            classifier=classifier,
+        )
+        await self.transactions.mark_removed(sync_result.removed)
 
     async def _account_map(self, item_id: str) -> Dict[str, str]:
         stmt = select(Account.plaid_account_id, Account.id).where(Account.item_id == item_id)
@@ -144,12 +236,4 @@ class SyncOrchestrator:
 
     @staticmethod
     def _extract_plaid_error(exc: ApiException) -> Dict[str, str] | None:
-        body = getattr(exc, "body", None)
-        if not body:
-            return None
-        try:
-            if isinstance(body, (bytes, bytearray)):
-                body = body.decode()
-            return json.loads(body)
-        except json.JSONDecodeError:
-            return None
+        return extract_plaid_error(exc)
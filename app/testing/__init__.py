@@ -0,0 +1,3 @@
+from app.testing.synthetic import SyntheticInstitution
+
+__all__ = ["SyntheticInstitution"]
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import random
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from fastapi import Body, FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.testing.synthetic import SyntheticInstitution
+
+MAX_SYNC_COUNT = 500
+
+
+class FakePlaidSettings(BaseSettings):
+    """Runtime knobs for the fake server, read from ``FAKE_PLAID_*`` environment variables."""
+
+    model_config = SettingsConfigDict(env_prefix="FAKE_PLAID_", extra="ignore")
+
+    transactions: int = 1_000
+    accounts: int = 5
+    securities: int = 50
+    holdings_per_account: int = 20
+    history_days: int = 730
+    added_per_generation: int = 25
+    modified_per_generation: int = 10
+    removed_per_generation: int = 5
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = Field(default=0.0, description="Probability of a 500 INTERNAL_SERVER_ERROR")
+    rate_limit_rate: float = Field(default=0.0, description="Probability of a 429 RATE_LIMIT_EXCEEDED")
+    mutation_rate: float = Field(
+        default=0.0,
+        description="Probability of TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION mid-pagination",
+    )
+    seed: int = 0
+
+
+class FakePlaidError(Exception):
+    def __init__(self, status_code: int, error_type: str, error_code: str, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_type = error_type
+        self.error_code = error_code
+        self.message = message
+
+
+@dataclass
+class Generation:
+    added: range
+    modified: List[int]
+    removed: List[int]
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+
+@dataclass
+class FakeInstitution:
+    """A synthetic item whose transaction history is exposed as an append-only change stream.
+
+    The stream starts with every initial transaction as ``added`` and grows by one
+    ``Generation`` of added/modified/removed deltas per :meth:`advance`. A cursor is an offset
+    into that stream, so cursor paging is exact and any issued cursor stays resumable.
+    """
+
+    synthetic: SyntheticInstitution
+    added_per_generation: int
+    modified_per_generation: int
+    removed_per_generation: int
+    generations: List[Generation] = field(default_factory=list)
+    _versions: Dict[int, int] = field(default_factory=dict)
+    _removed: set[int] = field(default_factory=set)
+
+    @property
+    def initial_count(self) -> int:
+        return self.synthetic.transactions
+
+    @property
+    def stream_length(self) -> int:
+        return self.initial_count + sum(len(generation) for generation in self.generations)
+
+    def advance(self, count: int = 1) -> None:
+        for _ in range(count):
+            number = len(self.generations) + 1
+            rng = random.Random(f"{self.synthetic.seed}:generation:{number}")
+            start = self.initial_count + (number - 1) * self.added_per_generation
+            added = range(start, start + self.added_per_generation)
+            candidates = [index for index in range(start) if index not in self._removed]
+            picked = rng.sample(
+                candidates,
+                min(len(candidates), self.modified_per_generation + self.removed_per_generation),
+            )
+            modified = picked[: self.modified_per_generation]
+            removed = picked[self.modified_per_generation :]
+            for index in modified:
+                self._versions[index] = number
+            self._removed.update(removed)
+            self.generations.append(Generation(added=added, modified=modified, removed=removed))
+
+    def entry(self, position: int) -> Tuple[str, int, int]:
+        """Return ``(kind, transaction index, version)`` at a stream position."""
+        if position < self.initial_count:
+            return "added", position, 0
+        offset = position - self.initial_count
+        for number, generation in enumerate(self.generations, start=1):
+            if offset < len(generation.added):
+                return "added", generation.added[offset], 0
+            offset -= len(generation.added)
+            if offset < len(generation.modified):
+                return "modified", generation.modified[offset], number
+            offset -= len(generation.modified)
+            if offset < len(generation.removed):
+                return "removed", generation.removed[offset], number
+            offset -= len(generation.removed)
+        raise IndexError(position)
+
+    def transactions_page(self, start: int, count: int) -> Dict[str, Any]:
+        stop = min(start + count, self.stream_length)
+        added: List[Dict[str, Any]] = []
+        modified: List[Dict[str, Any]] = []
+        removed: List[Dict[str, Any]] = []
+        for position in range(start, stop):
+            kind, index, version = self.entry(position)
+            if kind == "removed":
+                removed.append(
+                    {
+                        "transaction_id": self.synthetic.transaction_id(index),
+                        "account_id": self.synthetic.account_id(index % max(self.synthetic.accounts, 1)),
+                    }
+                )
+            elif kind == "modified":
+                modified.append(self.synthetic.transaction(index, version=version))
+            else:
+                added.append(self.synthetic.transaction(index, version=version))
+        return {
+            "added": added,
+            "modified": modified,
+            "removed": removed,
+            "next_cursor": encode_cursor(stop),
+            "has_more": stop < self.stream_length,
+        }
+
+
+def encode_cursor(position: int) -> str:
+    return base64.urlsafe_b64encode(f"fake:{position}".encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+    try:
+        prefix, position = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        if prefix != "fake":
+            raise ValueError(prefix)
+        return int(position)
+    except ValueError as exc:
+        raise FakePlaidError(400, "INVALID_INPUT", "INVALID_FIELD", "cursor is malformed") from exc
+
+
+class FakePlaidState:
+    def __init__(self, settings: FakePlaidSettings | None = None) -> None:
+        self.settings = settings or FakePlaidSettings()
+        self.institutions: Dict[str, FakeInstitution] = {}
+        self._rng = random.Random(self.settings.seed)
+        self._request_counter = 0
+
+    def institution(self, access_token: str) -> FakeInstitution:
+        """Resolve ``access-fake-<seed>[-<transactions>]`` tokens to a deterministic institution."""
+        existing = self.institutions.get(access_token)
+        if existing:
+            return existing
+        parts = access_token.split("-")
+        if len(parts) < 3 or parts[:2] != ["access", "fake"] or not parts[2].isdigit():
+            raise FakePlaidError(400, "INVALID_INPUT", "INVALID_ACCESS_TOKEN", "unknown access token")
+        transactions = int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else self.settings.transactions
+        institution = FakeInstitution(
+            synthetic=SyntheticInstitution(
+                seed=int(parts[2]),
+                accounts=self.settings.accounts,
+                transactions=transactions,
+                securities=self.settings.securities,
+                holdings_per_account=self.settings.holdings_per_account,
+                history_days=self.settings.history_days,
+                prefix="fake",
+            ),
+            added_per_generation=self.settings.added_per_generation,
+            modified_per_generation=self.settings.modified_per_generation,
+            removed_per_generation=self.settings.removed_per_generation,
+        )
+        self.institutions[access_token] = institution
+        return institution
+
+    def next_request_id(self) -> str:
+        self._request_counter += 1
+        return f"fake-req-{self._request_counter:08d}"
+
+    async def simulate_network(self, *, mid_pagination: bool = False) -> None:
+        settings = self.settings
+        delay = settings.latency_ms + self._rng.uniform(0, settings.latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        roll = self._rng.random()
+        if roll < settings.rate_limit_rate:
+            raise FakePlaidError(
+                429, "RATE_LIMIT_EXCEEDED", "TRANSACTIONS_SYNC_LIMIT", "rate limit exceeded"
+            )
+        roll -= settings.rate_limit_rate
+        if roll < settings.error_rate:
+            raise FakePlaidError(500, "API_ERROR", "INTERNAL_SERVER_ERROR", "an unexpected error occurred")
+        if mid_pagination and self._rng.random() < settings.mutation_rate:
+            raise FakePlaidError(
+                400,
+                "TRANSACTIONS_ERROR",
+                "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION",
+                "underlying transaction data changed during pagination",
+            )
+
+    def item_payload(self, access_token: str) -> Dict[str, Any]:
+        return {
+            "item_id": access_token.replace("access-", "item-", 1),
+            "webhook": None,
+            "error": None,
+            "available_products": ["transactions", "investments"],
+            "billed_products": ["transactions", "investments"],
+            "consent_expiration_time": None,
+            "update_type": "background",
+            "institution_id": "ins_fake",
+        }
+
+
+def create_app(settings: FakePlaidSettings | None = None) -> FastAPI:
+    state = FakePlaidState(settings)
+    app = FastAPI(title="Fake Plaid", version="0.1.0")
+    app.state.fake_plaid = state
+
+    @app.exception_handler(FakePlaidError)
+    async def plaid_error_handler(request, exc: FakePlaidError):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "error_type": exc.error_type,
+                "error_code": exc.error_code,
+                "error_message": exc.message,
+                "display_message": None,
+                "request_id": state.next_request_id(),
+            },
+        )
+
+    @app.post("/transactions/sync")
+    async def transactions_sync(payload: Dict[str, Any] = Body(...)):
+        institution = state.institution(payload.get("access_token", ""))
+        start = decode_cursor(payload.get("cursor"))
+        await state.simulate_network(mid_pagination=0 < start < institution.stream_length)
+        count = max(1, min(int(payload.get("count") or 100), MAX_SYNC_COUNT))
+        page = institution.transactions_page(start, count)
+        return {
+            **page,
+            "accounts": institution.synthetic.account_payloads(),
+            "transactions_update_status": "HISTORICAL_UPDATE_COMPLETE",
+            "request_id": state.next_request_id(),
+        }
+
+    @app.post("/accounts/balance/get")
+    async def accounts_balance_get(payload: Dict[str, Any] = Body(...)):
+        access_token = payload.get("access_token", "")
+        institution = state.institution(access_token)
+        await state.simulate_network()
+        return {
+            "accounts": institution.synthetic.account_payloads(),
+            "item": state.item_payload(access_token),
+            "request_id": state.next_request_id(),
+        }
+
+    @app.post("/investments/holdings/get")
+    async def investments_holdings_get(payload: Dict[str, Any] = Body(...)):
+        access_token = payload.get("access_token", "")
+        institution = state.institution(access_token)
+        await state.simulate_network()
+        accounts = institution.synthetic.account_payloads()
+        for account in accounts:
+            # The holdings response types every account as an InvestmentAccount.
+            account["balances"].setdefault("margin_loan_amount", None)
+        return {
+            "accounts": accounts,
+            "holdings": institution.synthetic.holding_payloads(),
+            "securities": institution.synthetic.security_payloads(),
+            "item": state.item_payload(access_token),
+            "request_id": state.next_request_id(),
+        }
+
+    @app.post("/link/token/create")
+    async def link_token_create(payload: Dict[str, Any] = Body(...)):
+        user = (payload.get("user") or {}).get("client_user_id", "user")
+        return {
+            "link_token": f"link-fake-{user}",
+            "expiration": "2099-01-01T00:00:00Z",
+            "request_id": state.next_request_id(),
+        }
+
+    @app.post("/sandbox/public_token/create")
+    async def sandbox_public_token_create(payload: Dict[str, Any] = Body(...)):
+        options = dict(payload.get("options") or {})
+        # The SDK only forwards typed options, so sizes can also ride in override_username,
+        # e.g. {"override_username": "seed=3,transactions=100000"}.
+        for pair in str(options.get("override_username") or "").split(","):
+            key, _, value = pair.partition("=")
+            if key.strip() in {"seed", "transactions"} and value.strip().isdigit():
+                options[key.strip()] = int(value)
+        seed = options.get("seed")
+        if seed is None:
+            seed = zlib.crc32(str(payload.get("institution_id", "")).encode()) % 1_000_000
+        token = f"public-fake-{int(seed)}"
+        if options.get("transactions"):
+            token += f"-{int(options['transactions'])}"
+        return {"public_token": token, "request_id": state.next_request_id()}
+
+    @app.post("/item/public_token/exchange")
+    async def item_public_token_exchange(payload: Dict[str, Any] = Body(...)):
+        public_token = str(payload.get("public_token", ""))
+        if not public_token.startswith("public-fake-"):
+            raise FakePlaidError(400, "INVALID_INPUT", "INVALID_PUBLIC_TOKEN", "unknown public token")
+        access_token = public_token.replace("public-", "access-", 1)
+        return {
+            "access_token": access_token,
+            "item_id": state.item_payload(access_token)["item_id"],
+            "request_id": state.next_request_id(),
+        }
+
+    @app.post("/fake/advance")
+    async def advance(payload: Dict[str, Any] = Body(...)):
+        """Append ``generations`` of added/modified/removed deltas to an item's stream."""
+        institution = state.institution(payload.get("access_token", ""))
+        institution.advance(int(payload.get("generations", 1)))
+        return {"generation": len(institution.generations), "stream_length": institution.stream_length}
+
+    @app.get("/fake/config")
+    async def get_config():
+        return state.settings.model_dump()
+
+    @app.post("/fake/config")
+    async def update_config(payload: Dict[str, Any] = Body(...)):
+        """Adjust latency and error injection at runtime; institution sizes apply to new tokens."""
+        state.settings = state.settings.model_copy(update=payload)
+        return state.settings.model_dump()
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the fake Plaid server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+    uvicorn.run(create_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+MERCHANTS: tuple[tuple[str, str, str], ...] = (
+    ("Amazon", "AMZN Mktp US*{code}", "GENERAL_MERCHANDISE"),
+    ("Starbucks", "STARBUCKS STORE {num}", "FOOD_AND_DRINK"),
+    ("Uber", "UBER   *TRIP {code}", "TRANSPORTATION"),
+    ("Netflix", "NETFLIX.COM", "ENTERTAINMENT"),
+    ("Spotify", "Spotify USA", "ENTERTAINMENT"),
+    ("Whole Foods", "WHOLEFDS {num}", "FOOD_AND_DRINK"),
+    ("Shell", "SHELL OIL {num}", "TRANSPORTATION"),
+    ("Target", "TARGET T-{num}", "GENERAL_MERCHANDISE"),
+    ("Comcast", "COMCAST CABLE COMM", "RENT_AND_UTILITIES"),
+    ("Delta", "DELTA AIR {code}", "TRAVEL"),
+)
+ACCOUNT_TYPES: tuple[tuple[str, str], ...] = (
+    ("depository", "checking"),
+    ("depository", "savings"),
+    ("credit", "credit card"),
+    ("investment", "brokerage"),
+    ("loan", "mortgage"),
+)
+SECURITY_TYPES: tuple[str, ...] = ("equity", "etf", "mutual fund", "fixed income", "cash")
+
+
+@dataclass
+class SyntheticInstitution:
+    """Deterministic generator of Plaid-shaped payloads for a single item.
+
+    Payloads use the wire (JSON) representation: dates are ISO strings and amounts are floats.
+    The same ``seed`` and sizes always produce the same ids and values, so runs are comparable.
+    """
+
+    seed: int = 0
+    accounts: int = 5
+    transactions: int = 1_000
+    securities: int = 50
+    holdings_per_account: int = 20
+    history_days: int = 730
+    prefix: str = "syn"
+    end_date: date = field(default_factory=date.today)
+
+    def account_payloads(self) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:accounts")
+        payloads: List[Dict[str, Any]] = []
+        for index in range(self.accounts):
+            account_type, subtype = ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)]
+            current = round(rng.uniform(100, 250_000), 2)
+            balances: Dict[str, Any] = {
+                "current": current,
+                "available": current if account_type == "depository" else None,
+                "limit": 10_000.0 if account_type == "credit" else None,
+                "iso_currency_code": "USD",
+                "unofficial_currency_code": None,
+            }
+            if account_type == "investment":
+                balances["margin_loan_amount"] = None
+            payloads.append(
+                {
+                    "account_id": self.account_id(index),
+                    "name": f"{subtype.title()} {index}",
+                    "official_name": f"Synthetic {subtype.title()} Account {index}",
+                    "mask": f"{index:04d}"[-4:],
+                    "type": account_type,
+                    "subtype": subtype,
+                    "balances": balances,
+                }
+            )
+        return payloads
+
+    def account_id(self, index: int) -> str:
+        return f"{self.prefix}-{self.seed}-acct-{index}"
+
+    def transaction_id(self, index: int) -> str:
+        return f"{self.prefix}-{self.seed}-txn-{index}"
+
+    def security_id(self, index: int) -> str:
+        return f"{self.prefix}-sec-{index}"
+
+    def transaction(self, index: int, *, version: int = 0) -> Dict[str, Any]:
+        """Return transaction ``index``; ``version`` perturbs mutable fields for modified deltas."""
+        rng = random.Random(f"{self.seed}:txn:{index}:{version}")
+        canonical, raw_name, category = MERCHANTS[rng.randrange(len(MERCHANTS))]
+        name = raw_name.format(code=f"{rng.randrange(36 ** 4):04X}", num=rng.randrange(1, 9999))
+        txn_date = self.end_date - timedelta(days=(index * 7919) % max(self.history_days, 1))
+        is_income = rng.random() < 0.08
+        # Plaid convention: positive amounts are outflows, negative amounts are inflows.
+        amount = round(-rng.uniform(1, 3_000) if is_income else rng.uniform(0.5, 400), 2)
+        pending = version == 0 and txn_date >= self.end_date - timedelta(days=2)
+        primary = "INCOME" if is_income else category
+        timestamp = (
+            datetime.combine(txn_date, time(12, 0), tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+        )
+        return {
+            "transaction_id": self.transaction_id(index),
+            "account_id": self.account_id(index % max(self.accounts, 1)),
+            "amount": amount,
+            "iso_currency_code": "USD",
+            "unofficial_currency_code": None,
+            "date": txn_date.isoformat(),
+            "authorized_date": (txn_date - timedelta(days=rng.randrange(0, 3))).isoformat(),
+            "authorized_datetime": None,
+            "datetime": timestamp,
+            "name": name,
+            "merchant_name": canonical,
+            "pending": pending,
+            "pending_transaction_id": None,
+            "account_owner": None,
+            "payment_channel": "online" if rng.random() < 0.4 else "in store",
+            "transaction_type": "special" if is_income else "place",
+            "transaction_code": None,
+            "category": [category.replace("_", " ").title()],
+            "personal_finance_category": {
+                "primary": primary,
+                "detailed": f"{primary}_OTHER",
+                "confidence_level": "HIGH",
+            },
+            "counterparties": [
+                {"name": canonical, "type": "merchant", "website": None, "logo_url": None}
+            ],
+            "location": {
+                "address": None,
+                "city": None,
+                "region": None,
+                "postal_code": None,
+                "country": None,
+                "lat": None,
+                "lon": None,
+                "store_number": None,
+            },
+            "payment_meta": {
+                "reference_number": None,
+                "ppd_id": None,
+                "payee": None,
+                "by_order_of": None,
+                "payer": None,
+                "payment_method": None,
+                "payment_processor": None,
+                "reason": None,
+            },
+        }
+
+    def iter_transactions(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self.transactions):
+            yield self.transaction(index)
+
+    def transaction_pages(self, page_size: int = 500) -> Iterator[List[Dict[str, Any]]]:
+        page: List[Dict[str, Any]] = []
+        for txn in self.iter_transactions():
+            page.append(txn)
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    def security_payloads(self) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:securities")
+        payloads: List[Dict[str, Any]] = []
+        for index in range(self.securities):
+            payloads.append(
+                {
+                    "security_id": self.security_id(index),
+                    "name": f"Synthetic Security {index}",
+                    "ticker_symbol": f"S{index:04d}",
+                    "isin": f"US{index:010d}",
+                    "cusip": f"{index:09d}",
+                    "type": SECURITY_TYPES[index % len(SECURITY_TYPES)],
+                    "close_price": round(rng.uniform(1, 900), 4),
+                    "close_price_as_of": self.end_date.isoformat(),
+                    "iso_currency_code": "USD",
+                    "unofficial_currency_code": None,
+                    "sedol": None,
+                    "institution_security_id": None,
+                    "institution_id": None,
+                    "proxy_security_id": None,
+                    "is_cash_equivalent": SECURITY_TYPES[index % len(SECURITY_TYPES)] == "cash",
+                    "market_identifier_code": None,
+                    "sector": None,
+                    "industry": None,
+                    "cfi_code": None,
+                    "figi": None,
+                    "option_contract": None,
+                    "fixed_income": None,
+                }
+            )
+        return payloads
+
+    def holding_payloads(self) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:holdings")
+        payloads: List[Dict[str, Any]] = []
+        investment_accounts = [
+            index
+            for index in range(self.accounts)
+            if ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)][0] == "investment"
+        ]
+        for account_index in investment_accounts:
+            count = min(self.holdings_per_account, self.securities)
+            for security_index in rng.sample(range(self.securities), count):
+                quantity = round(rng.uniform(0.5, 500), 4)
+                price = round(rng.uniform(1, 900), 4)
+                payloads.append(
+                    {
+                        "account_id": self.account_id(account_index),
+                        "security_id": self.security_id(security_index),
+                        "quantity": quantity,
+                        "institution_price": price,
+                        "institution_price_as_of": self.end_date.isoformat(),
+                        "institution_value": round(quantity * price, 2),
+                        "cost_basis": round(quantity * price * rng.uniform(0.6, 1.2), 2),
+                        "iso_currency_code": "USD",
+                        "unofficial_currency_code": None,
+                    }
+                )
+        return payloads
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from loguru import logger
+
+from app.core.database import async_session_factory
+from app.core.settings import settings
+from app.services.fx import FxService
+
+
+async def run_fx_rates_load() -> int:
+    """Reload ``FX_RATES_PATH`` into ``fx_rates``; a no-op when no rate file is configured."""
+    path = settings.scheduler.fx_rates_path
+    if not path:
+        return 0
+    async with async_session_factory() as session:
+        written = await FxService(session).load_csv(path)
+        await session.commit()
+    logger.info("Loaded {count} FX rate(s) from {path}", count=written, path=path)
+    return written
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import List
+
+from loguru import logger
+
+from app.core.database import engine
+from app.core.partitions import default_window, ensure_monthly_partitions
+from app.models.transaction import Transaction
+
+
+async def run_partition_maintenance() -> List[str]:
+    """Create the monthly ``transactions`` partitions the next few months will need."""
+    async with engine.begin() as conn:
+        created = await ensure_monthly_partitions(conn, Transaction.__tablename__, default_window())
+    logger.info("Partition maintenance created {count} partition(s)", count=len(created))
+    return created
@@ -0,0 +1 @@
+"""Throughput benchmarks for repositories and the sync pipeline (``python -m benchmarks``)."""
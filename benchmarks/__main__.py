@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+from benchmarks.harness import BenchmarkResult, build_report, compare_reports
+from benchmarks.runner import SUITES, run_suite
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Repository and sync throughput benchmarks against a local Postgres.",
+    )
+    parser.add_argument("--suite", action="append", choices=SUITES, help="Suite to run (repeatable)")
+    parser.add_argument("--transactions", type=int, default=1_000, help="Synthetic transactions (1k-1M)")
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--securities", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--database-url", default=None, help="Defaults to BENCH_DATABASE_URL or DATABASE_URL")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, default=None, help="Previous JSON report to compare")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed throughput drop")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    options = {
+        "transactions": args.transactions,
+        "accounts": args.accounts,
+        "securities": args.securities,
+        "page_size": args.page_size,
+        "database_url": args.database_url,
+        "reset": args.reset,
+    }
+
+    results: List[BenchmarkResult] = []
+    # Each suite runs in a fresh interpreter so peak RSS reflects that suite alone.
+    context = multiprocessing.get_context("spawn")
+    for index, suite in enumerate(args.suite or SUITES):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            suite_options = dict(options, reset=options["reset"] and index == 0)
+            results.extend(pool.submit(run_suite, suite, suite_options).result())
+
+    report = build_report(results, **{k: v for k, v in options.items() if k != "database_url"})
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    print(rendered)
+
+    if args.baseline:
+        regressions = compare_reports(
+            json.loads(args.baseline.read_text()),
+            report,
+            tolerance=args.tolerance,
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
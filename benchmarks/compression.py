@@ -0,0 +1,89 @@
+"""CPU cost against bytes saved for each response encoding and level.
+
+Bodies are ``GET /v1/transactions`` pages (``TransactionSummary`` JSON built from synthetic Plaid
+transactions), the largest responses the API serves. Each result is one encoding/level:
+``p50_ms``/``p99_ms`` are the time to compress one page, ``ratio`` is compressed/identity bytes
+and ``saved_kib_per_cpu_ms`` is what each millisecond of CPU buys on the wire. The dynamic
+defaults (gzip 6, brotli 4) and the levels used for stored bodies (gzip 9, brotli 11) are in the
+sweep; brotli is skipped when the optional package is not installed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Tuple
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.compression import brotli
+from app.schemas.transaction import TransactionSummary
+from app.services.repositories import TransactionRepository
+from benchmarks.harness import BenchmarkResult, LatencyRecorder
+from benchmarks.ingest import _page_bodies
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 5, 9, 11)
+# Quality 11 is ~100x slower than the others; a few pages are enough to measure it.
+SLOW_PAGES = 5
+
+
+def _response_bodies(transactions: int, page_size: int) -> List[bytes]:
+    plaid_bodies, account_map = _page_bodies(transactions, page_size)
+    adapter = TypeAdapter(List[TransactionSummary])
+    now = datetime.now(timezone.utc)
+    bodies = []
+    for body in plaid_bodies:
+        rows = [
+            dict(row, id=uuid.uuid4(), created_at=now, updated_at=now)
+            for row in TransactionRepository._rows(orjson.loads(body)["added"], account_map)
+        ]
+        if rows:
+            bodies.append(adapter.dump_json(adapter.validate_python(rows)))
+    return bodies
+
+
+def _codecs() -> List[Tuple[str, int, Callable[[bytes], bytes]]]:
+    codecs: List[Tuple[str, int, Callable[[bytes], bytes]]] = [
+        ("gzip", level, lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0))
+        for level in GZIP_LEVELS
+    ]
+    if brotli is not None:
+        codecs += [
+            ("br", quality, lambda body, quality=quality: brotli.compress(body, quality=quality))
+            for quality in BROTLI_QUALITIES
+        ]
+    return codecs
+
+
+async def bench_compression(
+    *, transactions: int, page_size: int = 500, **_: Any
+) -> List[BenchmarkResult]:
+    bodies = _response_bodies(transactions, page_size)
+    results = []
+    for encoding, level, codec in _codecs():
+        sample = bodies[:SLOW_PAGES] if encoding == "br" and level >= 10 else bodies
+        recorder = LatencyRecorder()
+        identity = compressed = 0
+        for body in sample:
+            started = time.perf_counter()
+            out = codec(body)
+            recorder.record((time.perf_counter() - started) * 1000, 1)
+            identity += len(body)
+            compressed += len(out)
+        cpu_ms = sum(recorder.samples_ms)
+        saved_kib = (identity - compressed) / 1024
+        results.append(
+            recorder.result(
+                f"compression.{encoding}[{level}]",
+                transactions=transactions,
+                page_size=page_size,
+                identity_kib=round(identity / 1024, 1),
+                ratio=round(compressed / identity, 4) if identity else 0.0,
+                saved_kib_per_cpu_ms=round(saved_kib / cpu_ms, 1) if cpu_ms else 0.0,
+            )
+        )
+    return results
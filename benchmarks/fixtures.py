@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import uuid
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app import models  # noqa: F401  Ensures model metadata is registered
+from app.core.database import Base
+from app.core.security import encrypt_string
+from app.core.settings import settings
+from app.models.item import Item
+from app.services.repositories import ItemRepository, UserRepository
+
+
+def database_url() -> str:
+    return os.environ.get("BENCH_DATABASE_URL", settings.database_url)
+
+
+@contextlib.asynccontextmanager
+async def bench_engine(url: str, *, reset: bool = False) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(url, pool_pre_ping=True)
+    try:
+        async with engine.begin() as conn:
+            if reset:
+                await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def create_item(session: AsyncSession, *, run_id: str | None = None) -> Item:
+    """Create an isolated user + item so repeated runs never collide on unique keys."""
+    run_id = run_id or uuid.uuid4().hex[:12]
+    user = await UserRepository(session).get_or_create(f"bench-{run_id}@example.com")
+    item = await ItemRepository(session).upsert(
+        user_id=str(user.id),
+        plaid_item_id=f"bench-item-{run_id}",
+        access_token_encrypted=encrypt_string(f"access-bench-{run_id}"),
+        institution_id="ins_bench",
+        institution_name="Benchmark Bank",
+    )
+    await session.commit()
+    return item
+
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import contextlib
+import math
+import platform
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def peak_rss_mb() -> float:
+    """Process high-water mark RSS in MiB (``ru_maxrss`` is KiB on Linux, bytes on macOS)."""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return usage / (1024 * 1024)
+    return usage / 1024
+
+
+class LatencyRecorder:
+    def __init__(self) -> None:
+        self.samples_ms: List[float] = []
+        self.rows = 0
+        self._started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def page(self, rows: int) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        self.samples_ms.append((time.perf_counter() - start) * 1000)
+        self.rows += rows
+
+    def record(self, elapsed_ms: float, rows: int) -> None:
+        self.samples_ms.append(elapsed_ms)
+        self.rows += rows
+
+    def result(self, name: str, **params: Any) -> "BenchmarkResult":
+        return BenchmarkResult.from_samples(
+            name,
+            rows=self.rows,
+            seconds=time.perf_counter() - self._started,
+            samples_ms=self.samples_ms,
+            params=params,
+        )
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    pages: int
+    p50_ms: float
+    p99_ms: float
+    peak_rss_mb: float
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(
+        cls,
+        name: str,
+        *,
+        rows: int,
+        seconds: float,
+        samples_ms: List[float],
+        params: Dict[str, Any],
+    ) -> "BenchmarkResult":
+        return cls(
+            name=name,
+            rows=rows,
+            seconds=round(seconds, 4),
+            rows_per_sec=round(rows / seconds, 1) if seconds > 0 else 0.0,
+            pages=len(samples_ms),
+            p50_ms=round(percentile(samples_ms, 50), 3),
+            p99_ms=round(percentile(samples_ms, 99), 3),
+            peak_rss_mb=round(peak_rss_mb(), 1),
+            params=params,
+        )
+
+
+def git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def build_report(results: List[BenchmarkResult], **params: Any) -> Dict[str, Any]:
+    return {
+        "commit": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "results": [result.__dict__ for result in results],
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    *,
+    tolerance: float = 0.10,
+) -> List[str]:
+    """Return human-readable regressions where throughput dropped by more than ``tolerance``."""
+    previous = {entry["name"]: entry for entry in baseline.get("results", [])}
+    regressions: List[str] = []
+    for entry in current.get("results", []):
+        before = previous.get(entry["name"])
+        if not before or not before.get("rows_per_sec"):
+            continue
+        change = entry["rows_per_sec"] / before["rows_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append(
+                f"{entry['name']}: {before['rows_per_sec']:.0f} -> {entry['rows_per_sec']:.0f} rows/s "
+                f"({change:+.1%})"
+            )
+    return regressions
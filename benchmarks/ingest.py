@@ -0,0 +1,144 @@
+"""Per-page cost of turning a raw ``/transactions/sync`` body into rows ready to write.
+
+``streaming`` is the production path (orjson decode, generator normalisation, bounded write
+batches). ``sdk`` replays the previous path for comparison: SDK model deserialisation, a
+``sanitize_for_serialization`` copy of added/modified, synthesised removed dicts and a fully
+materialised row list. ``classify`` times only the merchant classifier over each page's
+decoded rows, starting from a cold memo. Python heap high-water per page comes from ``tracemalloc`` in a separate
+pass so it does not distort the timings.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict, List
+
+import orjson
+import plaid
+from plaid.model.transactions_sync_response import TransactionsSyncResponse
+
+from app.services.merchants import MerchantClassifier
+from app.services.repositories import WRITE_BATCH, TransactionRepository, _batched_by_key
+from app.testing.fake_plaid import FakePlaidSettings, FakePlaidState
+from benchmarks.harness import BenchmarkResult, LatencyRecorder, percentile
+
+
+class _RawResponse:
+    """The slice of ``RESTResponse`` that ``ApiClient.deserialize`` reads."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def getheader(self, name: str, default: Any = None) -> Any:
+        return default
+
+
+def _page_bodies(transactions: int, page_size: int) -> tuple[List[bytes], Dict[str, str]]:
+    state = FakePlaidState(FakePlaidSettings())
+    institution = state.institution(f"access-fake-1-{transactions}")
+    accounts = institution.synthetic.account_payloads()
+    account_map = {account["account_id"]: str(uuid.uuid4()) for account in accounts}
+    bodies = []
+    for start in range(0, institution.stream_length, page_size):
+        page = institution.transactions_page(start, page_size)
+        page.update(
+            accounts=accounts,
+            transactions_update_status="HISTORICAL_UPDATE_COMPLETE",
+            request_id="bench",
+        )
+        bodies.append(orjson.dumps(page))
+    return bodies, account_map
+
+
+def _streaming(body: bytes, account_map: Dict[str, str]) -> int:
+    response = orjson.loads(body)
+    rows = TransactionRepository._rows(
+        itertools.chain(response["added"], response["modified"]),
+        account_map,
+    )
+    written = 0
+    for batch in _batched_by_key(rows, "plaid_transaction_id", WRITE_BATCH):
+        written += len(batch)
+    return written + len(response["removed"])
+
+
+def _classify(
+    pages: Dict[bytes, List[Dict[str, Any]]],
+    classifier: MerchantClassifier,
+) -> Callable[[bytes, Dict[str, str]], int]:
+    def run(body: bytes, account_map: Dict[str, str]) -> int:
+        rows = pages[body]
+        classifier.apply(rows)
+        return len(rows)
+
+    return run
+
+
+def _sdk(api_client: plaid.ApiClient) -> Callable[[bytes, Dict[str, str]], int]:
+    def run(body: bytes, account_map: Dict[str, str]) -> int:
+        response = api_client.deserialize(_RawResponse(body), (TransactionsSyncResponse,), True)
+        transactions: List[Dict[str, Any]] = []
+        transactions.extend(plaid.ApiClient.sanitize_for_serialization(response["added"]))
+        transactions.extend(plaid.ApiClient.sanitize_for_serialization(response["modified"]))
+        for removed in response["removed"]:
+            transactions.append({"transaction_id": removed["transaction_id"], "removed": True})
+        rows = list(
+            TransactionRepository._rows(
+                (txn for txn in transactions if not txn.get("removed")),
+                account_map,
+            )
+        )
+        return len(rows) + len(response["removed"])
+
+    return run
+
+
+def _measure(
+    name: str,
+    step: Callable[[bytes, Dict[str, str]], int],
+    bodies: List[bytes],
+    account_map: Dict[str, str],
+    params: Dict[str, Any],
+) -> BenchmarkResult:
+    recorder = LatencyRecorder()
+    for body in bodies:
+        started = time.perf_counter()
+        rows = step(body, account_map)
+        recorder.record((time.perf_counter() - started) * 1000, rows)
+
+    peaks_kib: List[float] = []
+    tracemalloc.start()
+    try:
+        for body in bodies:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            step(body, account_map)
+            peaks_kib.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    return recorder.result(
+        name,
+        **params,
+        page_peak_kib_p50=round(percentile(peaks_kib, 50), 1),
+        page_peak_kib_max=round(max(peaks_kib, default=0.0), 1),
+    )
+
+
+async def bench_ingest(*, transactions: int, page_size: int = 500, **_: Any) -> List[BenchmarkResult]:
+    bodies, account_map = _page_bodies(transactions, page_size)
+    params = {"transactions": transactions, "page_size": page_size}
+    api_client = plaid.ApiClient(plaid.Configuration(host=plaid.Environment.Sandbox))
+    # Streaming first: ru_maxrss only ever grows, so the SDK path's RSS includes both runs.
+    results = [_measure("ingest.streaming", _streaming, bodies, account_map, params)]
+    pages = {
+        body: list(TransactionRepository._rows(orjson.loads(body)["added"], account_map))
+        for body in bodies
+    }
+    results.append(_measure("ingest.classify", _classify(pages, MerchantClassifier()), bodies, account_map, params))
+    del pages
+    results.append(_measure("ingest.sdk", _sdk(api_client), bodies, account_map, params))
+    return results
@@ -0,0 +1,198 @@
+"""Replay a weighted request mix against the API and report per-route latency.
+
+    python -m benchmarks.load --user-id <uuid> --mix transactions=5,net_worth=2,cashflow=2,holdings=1
+
+Without ``--base-url`` requests go through the ASGI app in-process (no network hop); with it
+they go to a running server, e.g. ``uvicorn app.main:app --workers 4``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+
+from app.core.security import create_access_token
+from benchmarks.harness import build_report, percentile
+
+ParamsFactory = Callable[[random.Random], Dict[str, Any]]
+
+
+def _transactions_params(rng: random.Random) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"limit": 100, "offset": rng.choice((0, 0, 0, 100, 500, 2_000))}
+    if rng.random() < 0.5:
+        end = date.today() - timedelta(days=rng.randrange(0, 365))
+        params.update(start_date=(end - timedelta(days=30)).isoformat(), end_date=end.isoformat())
+    return params
+
+
+def _cashflow_params(rng: random.Random) -> Dict[str, Any]:
+    end = date.today() - timedelta(days=rng.randrange(0, 180))
+    return {"start_date": (end - timedelta(days=rng.choice((7, 30, 90)))).isoformat(), "end_date": end.isoformat()}
+
+
+ROUTES: Dict[str, Tuple[str, ParamsFactory]] = {
+    "transactions": ("/v1/transactions/", _transactions_params),
+    "net_worth": ("/v1/net-worth/", lambda rng: {}),
+    "cashflow": ("/v1/cashflow/summary", _cashflow_params),
+    "holdings": ("/v1/holdings/", lambda rng: {}),
+    "accounts": ("/v1/accounts/", lambda rng: {}),
+}
+
+
+@dataclass
+class RouteStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    response_bytes: int = 0
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        requests = len(self.latencies_ms)
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "rps": round(requests / elapsed, 1) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(self.latencies_ms, 50), 2),
+            "p95_ms": round(percentile(self.latencies_ms, 95), 2),
+            "p99_ms": round(percentile(self.latencies_ms, 99), 2),
+            "max_ms": round(max(self.latencies_ms, default=0.0), 2),
+            "avg_bytes": round(self.response_bytes / requests) if requests else 0,
+        }
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix: Dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ROUTES:
+            raise argparse.ArgumentTypeError(f"unknown route {name!r}; choose from {sorted(ROUTES)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    *,
+    token: str,
+    mix: Dict[str, int],
+    requests: int,
+    concurrency: int,
+    seed: int = 0,
+) -> Tuple[Dict[str, RouteStats], float]:
+    rng = random.Random(seed)
+    names = list(mix)
+    schedule = rng.choices(names, weights=[mix[name] for name in names], k=requests)
+    stats = {name: RouteStats() for name in names}
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for name in schedule:
+        queue.put_nowait(name)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def worker(worker_id: int) -> None:
+        worker_rng = random.Random(f"{seed}:{worker_id}")
+        while True:
+            try:
+                name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            path, params_factory = ROUTES[name]
+            route_stats = stats[name]
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params=params_factory(worker_rng), headers=headers)
+            except httpx.HTTPError:
+                route_stats.errors += 1
+                continue
+            route_stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+            route_stats.statuses[response.status_code] = route_stats.statuses.get(response.status_code, 0) + 1
+            route_stats.response_bytes += len(response.content)
+            if response.status_code >= 400:
+                route_stats.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    token = create_access_token(args.user_id)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+    else:
+        from app.main import app
+
+        if not args.keep_rate_limits:
+            # Both limiters would otherwise throttle a single-user, single-origin load test.
+            app.state.limiter.enabled = False
+            app.state.user_limiter.enabled = False
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://loadtest",
+            timeout=args.timeout,
+        )
+
+    async with client:
+        if args.warmup:
+            await run_load(client, token=token, mix=args.mix, requests=args.warmup, concurrency=args.concurrency)
+        stats, elapsed = await run_load(
+            client,
+            token=token,
+            mix=args.mix,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            seed=args.seed,
+        )
+
+    total = sum(len(route.latencies_ms) for route in stats.values())
+    report = build_report([], requests=args.requests, concurrency=args.concurrency, mix=args.mix)
+    report.pop("results")
+    report.update(
+        seconds=round(elapsed, 3),
+        throughput_rps=round(total / elapsed, 1) if elapsed > 0 else 0.0,
+        routes={name: route.summary(elapsed) for name, route in stats.items()},
+    )
+    return report
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", required=True, help="User to authenticate as (see benchmarks.seed)")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix("transactions=4,net_worth=2,cashflow=2,holdings=2"),
+        help=f"Weighted routes, e.g. transactions=5,holdings=1 (routes: {', '.join(sorted(ROUTES))})",
+    )
+    parser.add_argument("--requests", type=int, default=1_000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--base-url", default=None, help="Target a running server instead of in-process")
+    parser.add_argument("--keep-rate-limits", action="store_true", help="Leave IP and per-user limits enabled")
+    parser.add_argument("--output", default=None, help="Write the JSON report here")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(rendered + "\n")
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
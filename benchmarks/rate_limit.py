@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import uuid
+from typing import List
+
+from app.core.rate_limit import (
+    BucketConfig,
+    InMemoryRateLimitStorage,
+    RateLimiter,
+    RateLimitStorage,
+    RedisRateLimitStorage,
+)
+from benchmarks.harness import BenchmarkResult, LatencyRecorder
+
+# Each recorded "page" is this many acquisitions, so p50_ms/p99_ms read directly as µs per hit.
+HITS_PER_PAGE = 1_000
+
+
+async def _bench_storage(
+    name: str,
+    storage: RateLimitStorage,
+    *,
+    hits: int,
+    users: int,
+) -> BenchmarkResult:
+    # A bucket that never runs dry keeps every hit on the "allowed" path real requests take.
+    limiter = RateLimiter({"read": BucketConfig(capacity=1e12, refill_per_sec=1e9)}, storage)
+    subjects = [str(uuid.uuid4()) for _ in range(users)]
+    recorder = LatencyRecorder()
+    for start in range(0, hits, HITS_PER_PAGE):
+        count = min(HITS_PER_PAGE, hits - start)
+        with recorder.page(count):
+            for offset in range(count):
+                await limiter.hit("read", subjects[(start + offset) % users])
+    return recorder.result(name, hits=hits, users=users, hits_per_page=HITS_PER_PAGE)
+
+
+async def bench_rate_limiter(*, hits: int = 200_000, users: int = 10_000) -> List[BenchmarkResult]:
+    results = [
+        await _bench_storage("RateLimiter.hit[memory]", InMemoryRateLimitStorage(), hits=hits, users=users)
+    ]
+    redis_url = os.environ.get("BENCH_REDIS_URL")
+    if redis_url:
+        # Network round trips dominate here; fewer hits keep the suite quick.
+        results.append(
+            await _bench_storage(
+                "RateLimiter.hit[redis]",
+                RedisRateLimitStorage(redis_url, prefix=f"bench-{uuid.uuid4().hex[:8]}:"),
+                hits=min(hits, 20_000),
+                users=users,
+            )
+        )
+    return results
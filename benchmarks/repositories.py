@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import uuid
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.account import Account
+from app.services.repositories import (
+    AccountRepository,
+    HoldingRepository,
+    SecurityRepository,
+    TransactionRepository,
+)
+from app.testing.synthetic import SyntheticInstitution
+from benchmarks.fixtures import create_item
+from benchmarks.harness import BenchmarkResult, LatencyRecorder
+
+
+def _chunks(rows: list, size: int) -> List[list]:
+    return [rows[start : start + size] for start in range(0, len(rows), size)]
+
+
+async def bench_repositories(
+    sessions: async_sessionmaker[AsyncSession],
+    *,
+    transactions: int,
+    accounts: int,
+    securities: int,
+    page_size: int = 500,
+) -> List[BenchmarkResult]:
+    run_id = uuid.uuid4().hex[:12]
+    institution = SyntheticInstitution(
+        seed=1,
+        accounts=accounts,
+        transactions=transactions,
+        securities=securities,
+        holdings_per_account=securities,
+        prefix=f"bench-{run_id}",
+    )
+    params = {"transactions": transactions, "accounts": accounts, "securities": securities}
+    results: List[BenchmarkResult] = []
+
+    async with sessions() as session:
+        item = await create_item(session, run_id=run_id)
+        item_id = str(item.id)
+
+        recorder = LatencyRecorder()
+        account_repo = AccountRepository(session)
+        account_payloads = institution.account_payloads()
+        for page in _chunks(account_payloads, page_size):
+            with recorder.page(len(page)):
+                await account_repo.bulk_upsert(page, item_id)
+                await session.commit()
+        results.append(recorder.result("AccountRepository.bulk_upsert", **params))
+
+        rows = await session.execute(
+            select(Account.plaid_account_id, Account.id).where(Account.item_id == item_id)
+        )
+        account_map = {row.plaid_account_id: str(row.id) for row in rows}
+
+        recorder = LatencyRecorder()
+        transaction_repo = TransactionRepository(session)
+        for page in institution.transaction_pages(page_size):
+            with recorder.page(len(page)):
+                await transaction_repo.bulk_upsert(page, plaid_account_id_map=account_map)
+                await session.commit()
+        results.append(recorder.result("TransactionRepository.bulk_upsert", **params))
+
+        recorder = LatencyRecorder()
+        security_repo = SecurityRepository(session)
+        security_map: dict[str, str] = {}
+        for page in _chunks(institution.security_payloads(), page_size):
+            with recorder.page(len(page)):
+                security_map.update(await security_repo.bulk_upsert(page))
+                await session.commit()
+        results.append(recorder.result("SecurityRepository.bulk_upsert", **params))
+
+        # A holdings sync reconciles whole accounts, so it runs as one call rather than per page.
+        holding_repo = HoldingRepository(session)
+        holding_payloads = institution.holding_payloads()
+        for name in ("HoldingRepository.sync", "HoldingRepository.sync_unchanged"):
+            recorder = LatencyRecorder()
+            with recorder.page(len(holding_payloads)):
+                await holding_repo.sync(
+                    holding_payloads,
+                    account_ids=account_map.values(),
+                    plaid_account_id_map=account_map,
+                    plaid_security_id_map=security_map,
+                )
+                await session.commit()
+            results.append(recorder.result(name, **params))
+
+    return results
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+from benchmarks.harness import BenchmarkResult
+
+SUITES = ("repositories", "sync", "ingest", "rate_limit", "compression")
+
+
+def run_suite(name: str, options: Dict[str, Any]) -> List[BenchmarkResult]:
+    if name == "rate_limit":
+        # Pure in-process microbenchmark; no database needed.
+        from benchmarks.rate_limit import bench_rate_limiter
+
+        return asyncio.run(bench_rate_limiter())
+    if name == "compression":
+        from benchmarks.compression import bench_compression
+
+        return asyncio.run(bench_compression(transactions=options["transactions"], page_size=options["page_size"]))
+    if name == "ingest":
+        from benchmarks.ingest import bench_ingest
+
+        return asyncio.run(bench_ingest(transactions=options["transactions"], page_size=options["page_size"]))
+
+    from benchmarks.fixtures import bench_engine, database_url, session_factory
+    from benchmarks.repositories import bench_repositories
+    from benchmarks.sync import bench_item_sync
+
+    runners = {"repositories": bench_repositories, "sync": bench_item_sync}
+
+    async def _run() -> List[BenchmarkResult]:
+        async with bench_engine(options["database_url"] or database_url(), reset=options["reset"]) as engine:
+            return await runners[name](
+                session_factory(engine),
+                transactions=options["transactions"],
+                accounts=options["accounts"],
+                securities=options["securities"],
+                page_size=options["page_size"],
+            )
+
+    return asyncio.run(_run())
@@ -0,0 +1,350 @@
+"""Bulk-seed large tenants for API load testing.
+
+    python -m benchmarks.seed --users 1 --items 10 --accounts-per-item 5 --transactions 1000000
+
+Rows are generated with :class:`app.testing.synthetic.SyntheticInstitution` and streamed into
+Postgres with ``COPY`` in batches, so a million-transaction tenant seeds in well under a minute
+without holding the whole dataset in memory. Transactions get the canonical merchant and category
+ingest would give them, and each tenant's ``category_spend`` counters are rebuilt in the same
+transaction, so budget and recurring routes see realistic data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.security import encrypt_string
+from app.services.merchants import classifier_for
+from app.services.repositories import CategorySpendRepository
+from app.testing.synthetic import SyntheticInstitution
+from benchmarks.fixtures import bench_engine, database_url
+
+COPY_BATCH = 50_000
+
+TRANSACTION_COLUMNS = (
+    "id",
+    "account_id",
+    "plaid_transaction_id",
+    "transaction_id",
+    "name",
+    "merchant_name",
+    "transaction_type",
+    "amount",
+    "iso_currency_code",
+    "date",
+    "authorized_date",
+    "pending",
+    "payment_channel",
+    "personal_finance_category",
+    "category",
+    "canonical_merchant",
+    "canonical_category",
+)
+
+
+def _decimal(value: float | None) -> Decimal | None:
+    return None if value is None else Decimal(str(value))
+
+
+def _batched(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _copy(
+    conn: AsyncConnection,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Tuple[Any, ...]],
+) -> int:
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    total = 0
+    for batch in _batched(rows, COPY_BATCH):
+        await driver.copy_records_to_table(table, records=batch, columns=list(columns))
+        total += len(batch)
+    return total
+
+
+def _transaction_rows(
+    institution: SyntheticInstitution,
+    account_ids: Dict[str, uuid.UUID],
+) -> Iterator[Tuple[Any, ...]]:
+    classifier = classifier_for()
+    for batch in _batched(institution.iter_transactions(), COPY_BATCH):
+        classifier.apply(batch)
+        yield from (_transaction_row(txn, account_ids) for txn in batch)
+
+
+def _transaction_row(txn: Dict[str, Any], account_ids: Dict[str, uuid.UUID]) -> Tuple[Any, ...]:
+    return (
+        uuid.uuid4(),
+        account_ids[txn["account_id"]],
+        txn["transaction_id"],
+        txn["transaction_id"],
+        txn["name"],
+        txn["merchant_name"],
+        txn["transaction_type"],
+        _decimal(txn["amount"]),
+        txn["iso_currency_code"],
+        date.fromisoformat(txn["date"]),
+        date.fromisoformat(txn["authorized_date"]),
+        txn["pending"],
+        txn["payment_channel"],
+        json.dumps(txn["personal_finance_category"]),
+        json.dumps(txn["category"]),
+        txn["canonical_merchant"],
+        txn["canonical_category"],
+    )
+
+
+async def seed_tenant(
+    conn: AsyncConnection,
+    *,
+    tenant: int,
+    run_id: str,
+    items: int,
+    accounts_per_item: int,
+    transactions: int,
+    securities: Dict[str, uuid.UUID],
+    holdings_per_account: int,
+    history_days: int,
+) -> Dict[str, Any]:
+    user_id = uuid.uuid4()
+    email = f"load-{run_id}-{tenant}@example.com"
+    counts = {
+        "items": 0,
+        "accounts": 0,
+        "transactions": 0,
+        "holdings": 0,
+        "balance_snapshots": 0,
+        "category_spend": 0,
+    }
+    await _copy(conn, "users", ("id", "email", "external_id"), [(user_id, email, f"load-{tenant}")])
+
+    per_item = [transactions // items + (1 if index < transactions % items else 0) for index in range(items)]
+    balances: List[float] = []
+    for item_index, item_transactions in enumerate(per_item):
+        item_id = uuid.uuid4()
+        institution = SyntheticInstitution(
+            seed=tenant * 1_000 + item_index,
+            accounts=accounts_per_item,
+            transactions=item_transactions,
+            securities=len(securities),
+            holdings_per_account=holdings_per_account,
+            history_days=history_days,
+            prefix=f"load-{run_id}",
+        )
+        await _copy(
+            conn,
+            "items",
+            ("id", "user_id", "plaid_item_id", "institution_id", "institution_name", "access_token_encrypted"),
+            [
+                (
+                    item_id,
+                    user_id,
+                    f"load-{run_id}-item-{tenant}-{item_index}",
+                    f"ins_load_{item_index}",
+                    f"Load Test Bank {item_index}",
+                    encrypt_string(f"access-fake-{institution.seed}-{item_transactions}"),
+                )
+            ],
+        )
+        counts["items"] += 1
+
+        account_ids: Dict[str, uuid.UUID] = {}
+        account_rows = []
+        for account in institution.account_payloads():
+            account_id = uuid.uuid4()
+            account_ids[account["account_id"]] = account_id
+            account_balances = account["balances"]
+            signed = account_balances["current"] * (-1 if account["type"] in ("credit", "loan") else 1)
+            balances.append(signed)
+            account_rows.append(
+                (
+                    account_id,
+                    item_id,
+                    account["account_id"],
+                    account["name"],
+                    account["official_name"],
+                    account["mask"],
+                    account["type"],
+                    account["subtype"],
+                    account_balances["iso_currency_code"],
+                    _decimal(account_balances["current"]),
+                    _decimal(account_balances["available"]),
+                    _decimal(account_balances["limit"]),
+                )
+            )
+        counts["accounts"] += await _copy(
+            conn,
+            "accounts",
+            (
+                "id",
+                "item_id",
+                "plaid_account_id",
+                "name",
+                "official_name",
+                "mask",
+                "type",
+                "subtype",
+                "iso_currency_code",
+                "current_balance",
+                "available_balance",
+                "limit",
+            ),
+            account_rows,
+        )
+
+        counts["transactions"] += await _copy(
+            conn,
+            "transactions",
+            TRANSACTION_COLUMNS,
+            _transaction_rows(institution, account_ids),
+        )
+
+        holding_rows = [
+            (
+                uuid.uuid4(),
+                account_ids[holding["account_id"]],
+                securities[holding["security_id"]],
+                _decimal(holding["quantity"]),
+                _decimal(holding["institution_value"]),
+                _decimal(holding["institution_price"]),
+                date.fromisoformat(holding["institution_price_as_of"]),
+                _decimal(holding["cost_basis"]),
+            )
+            for holding in institution.holding_payloads()
+        ]
+        counts["holdings"] += await _copy(
+            conn,
+            "holdings",
+            (
+                "id",
+                "account_id",
+                "security_id",
+                "quantity",
+                "institution_value",
+                "institution_price",
+                "institution_price_as_of",
+                "cost_basis",
+            ),
+            holding_rows,
+        )
+
+    today = date.today()
+    current = sum(balances)
+    assets = sum(value for value in balances if value > 0)
+    snapshot_rows = []
+    for offset in range(history_days):
+        # A gentle upward drift so history charts have shape.
+        drift = 1 - offset / (history_days * 4)
+        snapshot_rows.append(
+            (
+                uuid.uuid4(),
+                user_id,
+                today - timedelta(days=offset),
+                _decimal(round(current * drift, 2)),
+                _decimal(round(assets * drift, 2)),
+                _decimal(round((assets - current) * drift, 2)),
+            )
+        )
+    counts["balance_snapshots"] += await _copy(
+        conn,
+        "balance_snapshots",
+        ("id", "user_id", "as_of_date", "net_worth", "liquid_assets", "liabilities"),
+        snapshot_rows,
+    )
+    # Bound to ``conn``, the session joins the tenant's transaction instead of committing.
+    session = AsyncSession(bind=conn)
+    try:
+        counts["category_spend"] = await CategorySpendRepository(session).rebuild(str(user_id))
+    finally:
+        await session.close()
+    return {"user_id": str(user_id), "email": email, **counts}
+
+
+async def seed(args: argparse.Namespace) -> Dict[str, Any]:
+    run_id = uuid.uuid4().hex[:8]
+    started = time.perf_counter()
+    async with bench_engine(args.database_url or database_url(), reset=args.reset) as engine:
+        async with engine.begin() as conn:
+            catalog = SyntheticInstitution(securities=args.securities, prefix=f"load-{run_id}")
+            securities = {payload["security_id"]: uuid.uuid4() for payload in catalog.security_payloads()}
+            await _copy(
+                conn,
+                "securities",
+                ("id", "plaid_security_id", "name", "ticker_symbol", "type", "close_price", "close_price_date", "currency"),
+                [
+                    (
+                        securities[payload["security_id"]],
+                        payload["security_id"],
+                        payload["name"],
+                        payload["ticker_symbol"],
+                        payload["type"],
+                        _decimal(payload["close_price"]),
+                        date.fromisoformat(payload["close_price_as_of"]),
+                        payload["iso_currency_code"],
+                    )
+                    for payload in catalog.security_payloads()
+                ],
+            )
+
+        tenants = []
+        for tenant in range(args.users):
+            # One transaction per tenant keeps a failed run from leaving half-seeded users behind.
+            async with engine.begin() as conn:
+                tenants.append(
+                    await seed_tenant(
+                        conn,
+                        tenant=tenant,
+                        run_id=run_id,
+                        items=args.items,
+                        accounts_per_item=args.accounts_per_item,
+                        transactions=args.transactions,
+                        securities=securities,
+                        holdings_per_account=args.holdings_per_account,
+                        history_days=args.history_days,
+                    )
+                )
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("ANALYZE")
+
+    return {"run_id": run_id, "seconds": round(time.perf_counter() - started, 2), "tenants": tenants}
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.seed", description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--items", type=int, default=10, help="Items per user")
+    parser.add_argument("--accounts-per-item", type=int, default=5)
+    parser.add_argument("--transactions", type=int, default=1_000_000, help="Transactions per user")
+    parser.add_argument("--securities", type=int, default=500)
+    parser.add_argument("--holdings-per-account", type=int, default=30)
+    parser.add_argument("--history-days", type=int, default=730)
+    parser.add_argument("--database-url", default=None, help="Defaults to BENCH_DATABASE_URL or DATABASE_URL")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    print(json.dumps(asyncio.run(seed(parse_args(argv))), indent=2))
+
+
+if __name__ == "__main__":
+    main()
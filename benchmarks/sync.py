@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services.plaid import SyncResult
+from app.services.sync import SyncOrchestrator
+from app.testing.synthetic import SyntheticInstitution
+from benchmarks.fixtures import create_item
+from benchmarks.harness import BenchmarkResult, LatencyRecorder
+
+
+class SyntheticPlaid:
+    """In-process stand-in for ``PlaidService`` that pages through a synthetic institution.
+
+    Page latency is measured between consecutive ``transactions_sync`` calls, so it covers the
+    orchestrator's persistence of the previous page rather than payload generation.
+    """
+
+    def __init__(self, institution: SyntheticInstitution, *, page_size: int = 500) -> None:
+        self.institution = institution
+        self.page_size = page_size
+        self.recorder = LatencyRecorder()
+        self._last_call: float | None = None
+        self._last_rows = 0
+
+    async def accounts_balance(self, access_token: str) -> Dict[str, Any]:
+        return {"accounts": self.institution.account_payloads()}
+
+    async def transactions_sync(
+        self,
+        access_token: str,
+        cursor: Optional[str] = None,
+        count: int = 500,
+    ) -> SyncResult:
+        now = time.perf_counter()
+        if self._last_call is not None:
+            self.recorder.record((now - self._last_call) * 1000, self._last_rows)
+
+        start = int(cursor or 0)
+        stop = min(start + self.page_size, self.institution.transactions)
+        page = [self.institution.transaction(index) for index in range(start, stop)]
+        self._last_rows = len(page)
+        self._last_call = time.perf_counter()
+        return SyncResult(
+            added=page,
+            modified=[],
+            removed=[],
+            accounts=[],
+            next_cursor=str(stop),
+            has_more=stop < self.institution.transactions,
+        )
+
+    async def investments_holdings(self, access_token: str) -> Dict[str, Any]:
+        self.finish()
+        return {
+            "accounts": self.institution.account_payloads(),
+            "securities": self.institution.security_payloads(),
+            "holdings": self.institution.holding_payloads(),
+        }
+
+    def finish(self) -> None:
+        if self._last_call is not None:
+            self.recorder.record((time.perf_counter() - self._last_call) * 1000, self._last_rows)
+            self._last_call = None
+
+
+async def bench_item_sync(
+    sessions: async_sessionmaker[AsyncSession],
+    *,
+    transactions: int,
+    accounts: int,
+    securities: int,
+    page_size: int = 500,
+) -> List[BenchmarkResult]:
+    run_id = uuid.uuid4().hex[:12]
+    institution = SyntheticInstitution(
+        seed=2,
+        accounts=accounts,
+        transactions=transactions,
+        securities=securities,
+        prefix=f"bench-{run_id}",
+    )
+    plaid = SyntheticPlaid(institution, page_size=page_size)
+
+    async with sessions() as session:
+        item = await create_item(session, run_id=run_id)
+        orchestrator = SyncOrchestrator(session, plaid=plaid)  # type: ignore[arg-type]
+        started = time.perf_counter()
+        outcome = await orchestrator.run_item_sync(item)
+        await session.commit()
+        elapsed = time.perf_counter() - started
+
+    return [
+        BenchmarkResult.from_samples(
+            "SyncOrchestrator.run_item_sync",
+            rows=outcome.transactions_synced,
+            seconds=elapsed,
+            samples_ms=plaid.recorder.samples_ms,
+            params={
+                "transactions": transactions,
+                "accounts": accounts,
+                "securities": securities,
+                "page_size": page_size,
+                "holdings_synced": outcome.holdings_synced,
+            },
+        )
+    ]
@@ -1,12 +1,25 @@
 import asyncio
 
-from app.core.database import Base, engine
+from sqlalchemy import exists, select
+
+from app.core.database import Base, async_session_factory, engine
 from app import models  # noqa: F401  Ensures model metadata is registered
+from app.models.category_spend import CategorySpend
+from app.services.repositories import CategorySpendRepository
+from app.workers.fx_rates import run_fx_rates_load
+from app.workers.partition_maintenance import run_partition_maintenance
 
 
 async def init_models() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await run_partition_maintenance()
+    await run_fx_rates_load()
+    # Budget counters are maintained incrementally; seed them once for pre-existing transactions.
+    async with async_session_factory() as session:
+        if not (await session.execute(select(exists().select_from(CategorySpend)))).scalar():
+            await CategorySpendRepository(session).rebuild()
+            await session.commit()
 
 
 if __name__ == "__main__":
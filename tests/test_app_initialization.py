@@ -1,5 +1,6 @@
 from fastapi.testclient import TestClient
 
+from app.api.deps import get_current_user
 from app.main import app
 
 
@@ -8,3 +9,16 @@ def test_healthcheck():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_plaid_governor_metrics_require_authentication():
+    client = TestClient(app)
+    assert client.get("/health/plaid").status_code == 401
+
+    app.dependency_overrides[get_current_user] = lambda: object()
+    try:
+        response = client.get("/health/plaid")
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200
+    assert "concurrency_limit" in response.json()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_user, rate_limit
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate, precompressed_json
+from app.core.rate_limit import BucketConfig, InMemoryRateLimitStorage, RateLimiter
+from app.schemas.base import APIModel
+
+ROWS = [{"id": index, "merchant": "Coffee Shop", "amount": "4.50"} for index in range(200)]
+
+
+class Rows(APIModel):
+    rows: list
+
+
+def test_negotiate_honours_q_values_and_prefers_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+    assert negotiate(None) is None
+    assert negotiate("identity") is None
+    assert negotiate("gzip, deflate, br") == "br"
+    assert negotiate("gzip, br;q=0.5") == "gzip"
+    assert negotiate("br;q=0, gzip") == "gzip"
+    assert negotiate("*;q=0.2, gzip;q=0") == "br"
+    assert negotiate("gzip;q=0, br;q=0") is None
+
+    monkeypatch.setattr(compression, "brotli", None)
+    assert negotiate("br") is None
+    assert negotiate("br, gzip;q=0.1") == "gzip"
+
+
+def test_middleware_compresses_large_bodies_only():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1_024)
+
+    @app.middleware("http")
+    async def passthrough(request, call_next):
+        # BaseHTTPMiddleware re-sends the body in chunks, as slowapi's middleware does.
+        return await call_next(request)
+
+    @app.get("/large")
+    async def large():
+        return ROWS
+
+    @app.get("/small")
+    async def small():
+        return ROWS[:2]
+
+    client = TestClient(app)
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(response.content) // 5
+    assert response.json() == ROWS
+
+    small_response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small_response.headers
+    assert small_response.json() == ROWS[:2]
+    identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in identity.headers
+
+
+def test_precompressed_json_renders_once_per_key_and_keeps_dependency_headers(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    compression._stored_bodies.clear()
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1_024)
+    app.state.user_limiter = RateLimiter(
+        {"read": BucketConfig(capacity=100, refill_per_sec=1.0)}, InMemoryRateLimitStorage()
+    )
+    user = SimpleNamespace(id=uuid.uuid4())
+    app.dependency_overrides[get_current_user] = lambda: user
+    renders = []
+
+    @app.get("/rows", dependencies=[Depends(rate_limit("read"))])
+    async def rows(request: Request, response: Response, version: int):
+        async def render() -> Rows:
+            renders.append(version)
+            return Rows(rows=ROWS)
+
+        return await precompressed_json(request, response, ("user", version), render)
+
+    client = TestClient(app)
+    first = client.get("/rows", params={"version": 1}, headers={"Accept-Encoding": "gzip"})
+    second = client.get("/rows", params={"version": 1}, headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/rows", params={"version": 1}, headers={"Accept-Encoding": "identity"})
+    assert renders == [1]
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert first.headers["Vary"] == "Accept-Encoding"
+    assert second.headers["X-RateLimit-Remaining"] == "98"
+    assert "Content-Encoding" not in plain.headers
+    assert first.json() == second.json() == plain.json() == {"rows": ROWS}
+
+    client.get("/rows", params={"version": 2}, headers={"Accept-Encoding": "gzip"})
+    assert renders == [1, 2]
+
+
+def test_stored_bodies_compress_once_per_encoding_off_the_event_loop(monkeypatch):
+    body = Rows(rows=ROWS).model_dump_json().encode()
+    stored = compression._StoredBody(body)
+    offloaded = []
+
+    async def run_in_threadpool(func, *args, **kwargs):
+        offloaded.append(func)
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(compression, "run_in_threadpool", run_in_threadpool)
+
+    async def encode_twice():
+        return await stored.encode("gzip"), await stored.encode("gzip")
+
+    first, second = asyncio.run(encode_twice())
+    assert first is second and gzip.decompress(first) == body
+    assert offloaded == [compression.compress]
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli extra not installed")
+def test_brotli_round_trip():
+    body = Rows(rows=ROWS).model_dump_json().encode()
+    assert compression.brotli.decompress(compression.compress(body, "br")) == body
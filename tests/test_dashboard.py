@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import dashboard
+from app.services.dashboard import DashboardService
+
+
+class FakeSessionFactory:
+    def __init__(self) -> None:
+        self.opened = []
+        self.closed = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        session = SimpleNamespace(name=f"pooled-{len(self.opened)}")
+        self.opened.append(session)
+        try:
+            yield session
+        finally:
+            self.closed.append(session)
+
+
+def _fake_reads(monkeypatch, *, failing=None):
+    """Replace the four reads with fakes that record which session served them."""
+    served = {}
+    finished = []
+
+    async def read(name, session):
+        served[name] = session
+        if name == failing:
+            raise RuntimeError(f"{name} failed")
+        # Yield a few times so a read that raises first cannot be the last to finish.
+        for _ in range(3):
+            await asyncio.sleep(0)
+        finished.append(name)
+        return name
+
+    class FakeAnalytics:
+        def __init__(self, session) -> None:
+            self.session = session
+
+        async def net_worth(self, user_id, *, base_currency=None):
+            return await read("net_worth", self.session)
+
+        async def cashflow_summary(self, user_id, *, base_currency=None):
+            return await read("cashflow", self.session)
+
+        async def holdings_summary(self, user_id):
+            return await read("holdings", self.session)
+
+    class FakeAccounts:
+        def __init__(self, session) -> None:
+            self.session = session
+
+        async def list_for_user(self, user_id):
+            return await read("accounts", self.session)
+
+    monkeypatch.setattr(dashboard, "AnalyticsService", FakeAnalytics)
+    monkeypatch.setattr(dashboard, "AccountRepository", FakeAccounts)
+    return served, finished
+
+
+def test_dashboard_reads_analytics_on_pooled_sessions(monkeypatch):
+    served, _ = _fake_reads(monkeypatch)
+    factory = FakeSessionFactory()
+    request_session = SimpleNamespace(name="request")
+
+    result = asyncio.run(
+        DashboardService(request_session, session_factory=factory).dashboard("user-1")
+    )
+
+    assert (result.accounts, result.net_worth, result.cashflow, result.holdings) == (
+        "accounts",
+        "net_worth",
+        "cashflow",
+        "holdings",
+    )
+    assert served["accounts"] is request_session
+    pooled = [served["net_worth"], served["cashflow"], served["holdings"]]
+    assert {id(session) for session in pooled} == {id(session) for session in factory.opened}
+    assert len(factory.opened) == 3
+    assert len(factory.closed) == 3
+
+
+def test_dashboard_lets_every_read_finish_before_raising(monkeypatch):
+    served, finished = _fake_reads(monkeypatch, failing="cashflow")
+    factory = FakeSessionFactory()
+
+    service = DashboardService(SimpleNamespace(), session_factory=factory)
+
+    async def load():
+        with pytest.raises(RuntimeError, match="cashflow failed"):
+            await service.dashboard("user-1")
+        # Checked before asyncio.run cancels stragglers: the error arrives only after the rest.
+        return sorted(finished), len(factory.closed)
+
+    assert asyncio.run(load()) == (["accounts", "holdings", "net_worth"], 3)
+    assert served["cashflow"] in factory.opened
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.testing.fake_plaid import FakePlaidSettings, create_app
+
+
+def _sync_all(client: TestClient, access_token: str, cursor: str | None = None, count: int = 100):
+    added, modified, removed = [], [], []
+    while True:
+        response = client.post(
+            "/transactions/sync",
+            json={"access_token": access_token, "cursor": cursor, "count": count},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        added.extend(body["added"])
+        modified.extend(body["modified"])
+        removed.extend(body["removed"])
+        cursor = body["next_cursor"]
+        if not body["has_more"]:
+            return added, modified, removed, cursor
+
+
+def test_transactions_sync_pages_through_full_history_then_deltas():
+    client = TestClient(create_app(FakePlaidSettings(modified_per_generation=3, removed_per_generation=2)))
+
+    added, modified, removed, cursor = _sync_all(client, "access-fake-1-250", count=100)
+    assert len(added) == 250
+    assert len({txn["transaction_id"] for txn in added}) == 250
+    assert not modified and not removed
+
+    # Nothing new until the institution advances.
+    assert _sync_all(client, "access-fake-1-250", cursor)[:3] == ([], [], [])
+
+    client.post("/fake/advance", json={"access_token": "access-fake-1-250", "generations": 2})
+    added, modified, removed, _ = _sync_all(client, "access-fake-1-250", cursor, count=7)
+    assert len(added) == 50
+    assert len(modified) == 6
+    assert len(removed) == 4
+
+
+def test_cursor_is_deterministic_across_servers():
+    first = TestClient(create_app()).post("/transactions/sync", json={"access_token": "access-fake-5"})
+    second = TestClient(create_app()).post("/transactions/sync", json={"access_token": "access-fake-5"})
+    assert first.json()["added"] == second.json()["added"]
+    assert first.json()["next_cursor"] == second.json()["next_cursor"]
+
+
+def test_error_injection_returns_plaid_error_shape():
+    client = TestClient(create_app(FakePlaidSettings(rate_limit_rate=1.0)))
+    response = client.post("/accounts/balance/get", json={"access_token": "access-fake-2"})
+    assert response.status_code == 429
+    assert response.json()["error_type"] == "RATE_LIMIT_EXCEEDED"
+
+    client.post("/fake/config", json={"rate_limit_rate": 0.0})
+    response = client.post("/accounts/balance/get", json={"access_token": "access-fake-2"})
+    assert response.status_code == 200
+    assert len(response.json()["accounts"]) == 5
+
+
+def test_public_token_exchange_round_trip():
+    client = TestClient(create_app())
+    public = client.post(
+        "/sandbox/public_token/create",
+        json={"institution_id": "ins_1", "options": {"override_username": "seed=8,transactions=40"}},
+    ).json()["public_token"]
+    exchange = client.post("/item/public_token/exchange", json={"public_token": public}).json()
+    assert exchange["access_token"] == "access-fake-8-40"
+    added, *_ = _sync_all(client, exchange["access_token"])
+    assert len(added) == 40
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.fields import columns_for, parse_fields, partial_response
+from app.models.holding import Holding
+from app.schemas.holding import HoldingSummary
+from app.schemas.transaction import TransactionSummary
+
+
+def test_parse_fields_keeps_order_drops_duplicates_and_rejects_unknown_names():
+    assert parse_fields(None, TransactionSummary) is None
+    assert parse_fields("date, amount,date", TransactionSummary) == ("date", "amount")
+    with pytest.raises(HTTPException) as exc:
+        parse_fields("amount,balance", TransactionSummary)
+    assert exc.value.status_code == 400 and "balance" in exc.value.detail
+
+
+def test_columns_for_selects_only_requested_columns():
+    stmt = select(*columns_for(Holding, ("quantity", "security")))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT holdings.quantity \nFROM holdings")
+
+
+def test_partial_response_serialises_like_the_full_schema():
+    txn_id = uuid.uuid4()
+    row = SimpleNamespace(id=txn_id, date=date(2026, 10, 19), amount=Decimal("12.50"))
+
+    response = partial_response(TransactionSummary, ("id", "amount", "date"), [row])
+
+    assert orjson.loads(response.body) == [{"id": str(txn_id), "amount": "12.50", "date": "2026-10-19"}]
+    empty = partial_response(HoldingSummary, ("quantity",), [])
+    assert empty.body == b"[]"
+
+
+def test_partial_response_rejects_rows_that_do_not_match_the_schema():
+    with pytest.raises(ValueError):
+        partial_response(TransactionSummary, ("amount",), [{"amount": "not a number"}])
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.forecast import ForecastService, project
+
+
+def test_project_expands_series_and_spreads_discretionary_spend():
+    balance, inflow, outflow = project(
+        days=30,
+        starting_balance=1_000.0,
+        # Payroll every 14 days from day 3; a subscription that was due yesterday.
+        next_offsets=np.array([3, -1]),
+        intervals=np.array([14.0, 30.4]),
+        amounts=np.array([2_000.0, -15.0]),
+        daily_discretionary=10.0,
+    )
+
+    assert np.flatnonzero(inflow).tolist() == [2, 16]  # days 3 and 17
+    assert outflow[0] == 25.0  # the late subscription lands tomorrow
+    assert outflow[1] == 10.0
+    assert balance[-1] == 1_000.0 + 4_000.0 - 15.0 - 30 * 10.0
+
+
+def test_forecast_is_cached_until_the_data_version_changes():
+    service = ForecastService(AsyncMock(spec=AsyncSession))
+    versions = iter(["1:a", "1:a", "1:b"])
+    service.analytics.data_version = AsyncMock(side_effect=lambda user_id: next(versions))
+    service._build = AsyncMock(side_effect=lambda user_id, **kwargs: object())
+
+    async def run():
+        today = date(2026, 10, 19)
+        first = await service.forecast("user-1", days=30, today=today)
+        again = await service.forecast("user-1", days=30, today=today)
+        synced = await service.forecast("user-1", days=30, today=today)
+        return first, again, synced
+
+    first, again, synced = asyncio.run(run())
+    assert first is again
+    assert synced is not first
+    assert service._build.await_count == 2
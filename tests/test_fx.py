@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.analytics import AnalyticsService
+from app.services.fx import FxService, RateTable, epoch_days, read_rates_csv
+
+
+def _days(*days: date) -> np.ndarray:
+    return np.array([epoch_days(day) for day in days], dtype=np.int64)
+
+
+RATES = [
+    ("EUR", date(2026, 1, 1), 1.10),
+    ("EUR", date(2026, 1, 5), 1.20),
+    ("GBP", date(2026, 1, 1), 1.25),
+]
+
+
+def test_rates_are_looked_up_as_of_each_day():
+    table = RateTable(RATES)
+
+    rates = table.rates("EUR", _days(date(2025, 12, 1), date(2026, 1, 3), date(2026, 1, 5), date(2026, 3, 1)))
+
+    # Before the first rate the earliest applies; weekends carry the last published rate.
+    assert rates.tolist() == [1.10, 1.10, 1.20, 1.20]
+    assert np.isnan(table.rates("JPY", _days(date(2026, 1, 3)))).all()
+
+
+def test_factors_convert_through_the_quote_currency():
+    table = RateTable(RATES)
+    day = date(2026, 1, 6)
+
+    factors = table.factors(["EUR", "USD", None, "GBP", "XXX"], _days(*[day] * 5), "GBP")
+
+    assert factors[:4] == pytest.approx([1.20 / 1.25, 1 / 1.25, 1.0, 1.0])
+    assert np.isnan(factors[4])
+
+
+def test_convert_sums_in_decimal_and_reports_currencies_without_a_rate(monkeypatch):
+    async def rate_table(self):
+        return RateTable(RATES)
+
+    monkeypatch.setattr(FxService, "rate_table", rate_table)
+    analytics = AnalyticsService(AsyncMock(spec=AsyncSession))
+
+    totals, unconverted = asyncio.run(
+        analytics._convert(
+            ["USD", "EUR", "JPY"],
+            _days(*[date(2026, 1, 6)] * 3),
+            [[Decimal("100.10"), Decimal("10.00"), Decimal("5000")]],
+            "USD",
+        )
+    )
+
+    # JPY has no rate: it is reported, not summed 1:1.
+    assert totals == [Decimal("112.10")]
+    assert unconverted == ["JPY"]
+
+
+def test_read_rates_csv(tmp_path):
+    path = tmp_path / "rates.csv"
+    path.write_text("date,currency,rate\n2026-01-02,eur,1.0950\n")
+
+    assert read_rates_csv(path) == [
+        {"currency": "EUR", "as_of_date": date(2026, 1, 2), "rate": Decimal("1.0950")}
+    ]
+
+    path.write_text("date,currency,rate\n2026-01-02,EUR,-1\n")
+    with pytest.raises(ValueError, match="rates.csv:2"):
+        read_rates_csv(path)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.holdings import _group_summary
+from app.services.analytics import AnalyticsService
+
+
+def _row(grouping, market_value, cost_basis, positions, **labels):
+    return SimpleNamespace(
+        grouping=grouping,
+        type=labels.get("type"),
+        id=labels.get("id"),
+        ticker_symbol=labels.get("ticker_symbol"),
+        name=labels.get("name"),
+        account_id=labels.get("account_id"),
+        market_value=Decimal(market_value),
+        cost_basis=Decimal(cost_basis),
+        unrealized_gain=Decimal(market_value) - Decimal(cost_basis),
+        positions=positions,
+    )
+
+
+def test_holdings_summary_splits_grouping_sets_and_caches_per_data_version():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = [
+        _row(0b001, "600", "500", 2, type="etf", id="sec-1", ticker_symbol="VTI", name="Total Market"),
+        _row(0b011, "600", "500", 2, type="etf"),
+        _row(0b110, "600", "500", 2, account_id="acct-1"),
+        _row(0b111, "600", "500", 2),
+    ]
+    analytics = AnalyticsService(session)
+    analytics.data_version = AsyncMock(return_value="1:2026-10-19T00:00:00")
+
+    summary = asyncio.run(analytics.holdings_summary("user-holdings"))
+    again = asyncio.run(analytics.holdings_summary("user-holdings"))
+
+    assert again is summary
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "GROUPING SETS" in sql
+    assert summary.total.market_value == Decimal("600")
+    assert [group.ticker_symbol for group in summary.by_security] == ["VTI"]
+    assert summary.by_type[0].security_type == "etf" and summary.by_type[0].security_id is None
+    assert summary.by_account[0].account_id == "acct-1"
+
+    payload = _group_summary(summary.by_security[0], summary.total.market_value)
+    assert (payload.unrealized_gain_percent, payload.allocation_percent) == (20.0, 100.0)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.budget import BudgetCreate
+from app.services.merchants import (
+    MatchRule,
+    MerchantClassifier,
+    MerchantMatcher,
+    classifier_for,
+    normalize_category,
+)
+from app.services.repositories import BudgetRepository
+
+
+def _row(merchant_name, name, primary=None):
+    return {
+        "merchant_name": merchant_name,
+        "name": name,
+        "personal_finance_category": {"primary": primary} if primary else None,
+    }
+
+
+def test_longest_pattern_wins_and_matches_start_on_word_boundaries():
+    classifier = MerchantClassifier()
+
+    assert classifier.classify(None, "UBER   *EATS PENDING") == ("Uber Eats", "FOOD_AND_DRINK")
+    assert classifier.classify(None, "UBER *TRIP HELP.UBER.COM") == ("Uber", "TRANSPORTATION")
+    assert classifier.classify("AMZN Mktp US*2K4", "AMZN Mktp US*2K4") == ("Amazon", "GENERAL_MERCHANDISE")
+    assert classifier.classify("Amazon.com", None) == ("Amazon", "GENERAL_MERCHANDISE")
+    # "uber" inside a word is not a match.
+    assert classifier.classify("Tuberville Farms", "TUBERVILLE FARMS") == ("Tuberville Farms", None)
+
+
+def test_user_rules_beat_builtin_rules_regardless_of_length():
+    matcher = MerchantMatcher(
+        [MatchRule("uber", "Work Travel", "TRAVEL"), MatchRule("uber eats", "Uber Eats", "FOOD_AND_DRINK")],
+        user_rule_count=1,
+    )
+    assert matcher.match("uber eats 123").merchant == "Work Travel"
+
+    classifier = classifier_for([MatchRule("acme", "Acme Corp", "GENERAL_SERVICES")])
+    assert classifier.classify(None, "ACME*SUBSCRIPTION") == ("Acme Corp", "GENERAL_SERVICES")
+    assert classifier_for([MatchRule("acme", "Acme Corp", "GENERAL_SERVICES")]) is classifier
+
+
+def test_apply_falls_back_to_plaid_merchant_and_primary_category():
+    rows = [
+        _row("Starbucks", "STARBUCKS STORE 00123", "FOOD_AND_DRINK"),
+        _row("Corner Deli", "CORNER DELI NYC", "FOOD_AND_DRINK"),
+        _row(None, "CHECK 1042"),
+    ]
+    MerchantClassifier().apply(rows)
+
+    assert [(row["canonical_merchant"], row["canonical_category"]) for row in rows] == [
+        ("Starbucks", "FOOD_AND_DRINK"),
+        ("Corner Deli", "FOOD_AND_DRINK"),
+        (None, None),
+    ]
+
+
+def test_user_categories_normalise_to_plaid_primary_form():
+    assert normalize_category("Food & drink") == "FOOD_AND_DRINK"
+    assert normalize_category(" rent-and-utilities ") == "RENT_AND_UTILITIES"
+    assert normalize_category("GENERAL_MERCHANDISE") == "GENERAL_MERCHANDISE"
+    with pytest.raises(ValidationError):
+        BudgetCreate(category="!!", monthly_limit=Decimal("10"))
+
+
+def test_budget_upsert_stores_the_normalised_category():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = SimpleNamespace(scalar_one=lambda: None)
+
+    repo = BudgetRepository(session)
+    asyncio.run(repo.upsert("user-1", category="Food and Drink", monthly_limit=Decimal("400")))
+
+    params = session.execute.await_args.args[0].compile(dialect=postgresql.dialect()).params
+    assert params["category"] == "FOOD_AND_DRINK"
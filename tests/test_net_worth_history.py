@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.analytics import AnalyticsService, BalanceBreakdown
+
+
+def test_net_worth_history_buckets_in_sql_and_carries_values_forward():
+    session = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    # Last snapshot per bucket; buckets 1 and 3 had no sync.
+    result.tuples.return_value.all.return_value = [(0, Decimal("100")), (2, Decimal("120"))]
+    session.execute.return_value = result
+
+    history = asyncio.run(
+        AnalyticsService(session).net_worth_history(
+            "user-history",
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            points=4,
+        )
+    )
+
+    assert history == [
+        (date(2026, 1, 1), Decimal("100")),
+        (date(2026, 1, 11), Decimal("100")),
+        (date(2026, 1, 21), Decimal("120")),
+        (date(2026, 1, 31), Decimal("120")),
+    ]
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "GROUP BY width_bucket(" in sql
+    assert stmt.compile().params["thresholds"] == [date(2026, 1, 2), date(2026, 1, 12), date(2026, 1, 22)]
+
+
+def test_balance_breakdown_history_classifies_accounts_and_filters_after_carry_forward():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = [
+        SimpleNamespace(
+            as_of_date=date(2026, 1, 5),
+            liquid_assets=Decimal("900"),
+            investments=Decimal("5000"),
+            liabilities=Decimal("300"),
+        )
+    ]
+
+    history = asyncio.run(
+        AnalyticsService(session).balance_breakdown_history(
+            "user-history", start_date=date(2026, 1, 1), end_date=date(2026, 3, 31)
+        )
+    )
+
+    assert history == [
+        BalanceBreakdown(date(2026, 1, 5), Decimal("900"), Decimal("5000"), Decimal("300"))
+    ]
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    params = compiled.params
+    assert params["type_1"] == ["loan", "credit"] and params["param_1"] == "liabilities"
+    assert params["type_2"] == ["investment", "brokerage"] and params["param_2"] == "investments"
+    assert params["param_3"] == "liquid_assets"
+    # Snapshots before ``start`` feed the running totals; only the finished series is filtered.
+    per_account, series = str(compiled).split("AS series")
+    assert "as_of_date <= %(as_of_date_1)s" in per_account and ">=" not in per_account
+    assert "WHERE series.as_of_date >= %(as_of_date_2)s" in series
+    assert params["as_of_date_1"] == date(2026, 3, 31)
+    assert params["as_of_date_2"] == date(2026, 1, 1)
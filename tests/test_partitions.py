@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import date
+
+from app.core.partitions import (
+    add_months,
+    partition_name,
+    partition_window,
+    spilled_partition_statements,
+)
+
+
+def test_partition_window_spans_year_boundaries():
+    months = partition_window(date(2026, 11, 19), months_back=1, months_ahead=2)
+
+    assert months == [date(2026, 10, 1), date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1)]
+    assert add_months(date(2026, 1, 1), -13) == date(2024, 12, 1)
+    assert partition_name("transactions", months[-1]) == "transactions_p2027_01"
+
+
+def test_spilled_partition_keeps_generated_columns_and_skips_them_when_moving_rows():
+    statements = spilled_partition_statements(
+        "transactions",
+        "transactions_p2026_10",
+        date(2026, 10, 1),
+        "\"date\" >= '2026-10-01' AND \"date\" < '2026-11-01'",
+        ["id", "date", "amount"],
+    )
+
+    create, move, attach = statements
+    assert "INCLUDING GENERATED" in create
+    assert move == (
+        'WITH moved AS (DELETE FROM "transactions_default" '
+        "WHERE \"date\" >= '2026-10-01' AND \"date\" < '2026-11-01' "
+        'RETURNING "id", "date", "amount") '
+        'INSERT INTO "transactions_p2026_10" ("id", "date", "amount") '
+        'SELECT "id", "date", "amount" FROM moved'
+    )
+    assert attach == (
+        'ALTER TABLE "transactions" ATTACH PARTITION "transactions_p2026_10" '
+        "FOR VALUES FROM ('2026-10-01') TO ('2026-11-01')"
+    )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from plaid.exceptions import ApiException
+
+from app.core.rate_limit import BucketConfig
+from app.services.plaid_governor import PlaidGovernor
+
+
+def _plaid_error(status: int, error_type: str, error_code: str) -> ApiException:
+    error = ApiException(status=status, reason=error_code)
+    error.body = json.dumps({"error_type": error_type, "error_code": error_code})
+    return error
+
+
+def _governor(**kwargs) -> PlaidGovernor:
+    governor = PlaidGovernor(endpoint_limits={}, max_concurrency=8, **kwargs)
+    governor.backoff = lambda attempt: 0.0  # type: ignore[method-assign]
+    return governor
+
+
+def test_retries_rate_limits_and_halves_concurrency():
+    governor = _governor()
+    failures = [_plaid_error(429, "RATE_LIMIT_EXCEEDED", "TRANSACTIONS_LIMIT")]
+
+    async def call():
+        if failures:
+            raise failures.pop()
+        return {"ok": True}
+
+    assert asyncio.run(governor.run("transactions_sync", call)) == {"ok": True}
+    metrics = governor.metrics()
+    assert metrics["concurrency_limit"] < 8
+    assert metrics["endpoints"]["transactions_sync"] == {
+        "calls": 2,
+        "retries": 1,
+        "rate_limited": 1,
+        "failures": 0,
+        "rate_per_sec": None,
+    }
+
+
+def test_non_retryable_errors_and_exhausted_retries_propagate():
+    governor = _governor(max_retries=2)
+    calls = []
+
+    async def invalid_token():
+        calls.append("invalid")
+        raise _plaid_error(400, "INVALID_INPUT", "INVALID_ACCESS_TOKEN")
+
+    with pytest.raises(ApiException):
+        asyncio.run(governor.run("accounts_balance_get", invalid_token))
+    assert calls == ["invalid"]
+
+    async def down():
+        calls.append("down")
+        raise _plaid_error(500, "API_ERROR", "INTERNAL_SERVER_ERROR")
+
+    with pytest.raises(ApiException):
+        asyncio.run(governor.run("accounts_balance_get", down))
+    assert calls.count("down") == 3
+    assert governor.stats["accounts_balance_get"].failures == 2
+
+
+def test_endpoint_bucket_paces_calls():
+    governor = PlaidGovernor(
+        endpoint_limits={"transactions_sync": BucketConfig(capacity=1, refill_per_sec=50)},
+        max_concurrency=4,
+    )
+
+    async def call():
+        return None
+
+    async def burst():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(governor.run("transactions_sync", call) for _ in range(3)))
+        return loop.time() - started
+
+    # One token up front, then two more at 50/s.
+    assert asyncio.run(burst()) >= 0.035
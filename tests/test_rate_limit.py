@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_user, rate_limit
+from app.core import rate_limit as rate_limit_module
+from app.core.rate_limit import BucketConfig, InMemoryRateLimitStorage, RateLimiter
+
+
+def test_bucket_config_parsing():
+    assert BucketConfig.parse("120/minute") == BucketConfig(capacity=120, refill_per_sec=2.0)
+    assert BucketConfig.parse("36/hours; burst=3") == BucketConfig(capacity=3, refill_per_sec=0.01)
+    with pytest.raises(ValueError):
+        BucketConfig.parse("10/fortnight")
+
+
+def test_in_memory_bucket_refills(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: clock[0])
+    storage = InMemoryRateLimitStorage()
+    bucket = BucketConfig(capacity=2, refill_per_sec=0.5)
+
+    assert storage.acquire_nowait("u", bucket).allowed
+    assert storage.acquire_nowait("u", bucket).remaining == 0
+    denied = storage.acquire_nowait("u", bucket)
+    assert not denied.allowed and denied.retry_after == pytest.approx(2.0)
+    assert storage.acquire_nowait("other", bucket).allowed
+
+    clock[0] += 2.0
+    assert storage.acquire_nowait("u", bucket).allowed
+
+
+def test_rate_limit_dependency_is_per_user_and_per_bucket():
+    app = FastAPI()
+    app.state.user_limiter = RateLimiter(
+        {
+            "read": BucketConfig(capacity=3, refill_per_sec=1e-6),
+            "expensive": BucketConfig(capacity=1, refill_per_sec=1e-6),
+        },
+        InMemoryRateLimitStorage(),
+    )
+    users = {"alice": SimpleNamespace(id=uuid.uuid4()), "bob": SimpleNamespace(id=uuid.uuid4())}
+    app.dependency_overrides[get_current_user] = lambda user: users[user]
+
+    @app.get("/read", dependencies=[Depends(rate_limit("read"))])
+    async def read():
+        return {}
+
+    @app.post("/sync", dependencies=[Depends(rate_limit("expensive"))])
+    async def sync():
+        return {}
+
+    client = TestClient(app)
+    assert client.post("/sync", params={"user": "alice"}).status_code == 200
+    blocked = client.post("/sync", params={"user": "alice"})
+    assert blocked.status_code == 429
+    assert int(blocked.headers["Retry-After"]) > 0
+
+    # Spending the expensive bucket leaves reads (and other users) untouched.
+    statuses = [client.get("/read", params={"user": "alice"}).status_code for _ in range(4)]
+    assert statuses == [200, 200, 200, 429]
+    response = client.post("/sync", params={"user": "bob"})
+    assert response.status_code == 200
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+
+
+def test_in_memory_eviction_never_resets_a_throttled_bucket(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", lambda: clock[0])
+    storage = InMemoryRateLimitStorage(max_keys=2)
+    bucket = BucketConfig(capacity=1, refill_per_sec=0.01)
+
+    storage.acquire_nowait("throttled", bucket)
+    assert not storage.acquire_nowait("throttled", bucket).allowed
+    storage.acquire_nowait("idle", bucket)
+    clock[0] += 60.0
+    storage.acquire_nowait("idle", bucket)
+
+    # Nothing has refilled, so a new key grows the map instead of evicting anyone.
+    storage.acquire_nowait("new", bucket)
+    assert not storage.acquire_nowait("throttled", bucket).allowed
+    assert len(storage._buckets) == 3
+
+    # Once buckets refill completely they are evicted; the throttled one is still limited.
+    clock[0] += 100.0
+    storage.acquire_nowait("throttled", bucket)
+    clock[0] += 99.0
+    storage.acquire_nowait("another", bucket)
+    assert "idle" not in storage._buckets and "new" not in storage._buckets
+    assert not storage.acquire_nowait("throttled", bucket).allowed
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+from app.services.recurring import detect_series
+
+EPOCH = date(1970, 1, 1)
+
+
+def _rows(*series):
+    """Flatten (merchant, outflow, [(date, amount), ...]) into detector inputs, sorted as SQL would."""
+    rows = sorted(
+        (merchant, outflow, (day - EPOCH).days, amount)
+        for merchant, outflow, points in series
+        for day, amount in points
+    )
+    merchants, outflows, days, amounts = zip(*rows)
+    return (
+        list(merchants),
+        np.array(outflows, dtype=bool),
+        np.array(days, dtype=np.int64),
+        np.array(amounts, dtype=np.float64),
+        [None] * len(rows),
+    )
+
+
+def test_detects_monthly_subscription_and_biweekly_payroll():
+    monthly = [(date(2026, month, 3 + month % 3), 15.99) for month in range(1, 10)]
+    payroll = [(date(2026, 1, 2) + timedelta(days=14 * n), 2500.0 + n) for n in range(18)]
+    # Daily coffee with varying amounts is not a series.
+    coffee = [(date(2026, 1, 1) + timedelta(days=n), 3.5 + (n % 7)) for n in range(200)]
+
+    found = detect_series(
+        *_rows(("Netflix", True, monthly), ("Acme Payroll", False, payroll), ("Starbucks", True, coffee)),
+        today=date(2026, 9, 20),
+    )
+
+    by_merchant = {series.merchant: series for series in found}
+    assert set(by_merchant) == {"Netflix", "Acme Payroll"}
+    netflix = by_merchant["Netflix"]
+    assert (netflix.direction, netflix.frequency, netflix.occurrences) == ("outflow", "monthly", 9)
+    assert netflix.average_amount == Decimal("15.99")
+    assert netflix.is_active
+    payroll_series = by_merchant["Acme Payroll"]
+    assert (payroll_series.direction, payroll_series.frequency) == ("inflow", "biweekly")
+    assert payroll_series.next_expected_date == payroll[-1][0] + timedelta(days=14)
+
+
+def test_irregular_or_lapsed_series():
+    irregular = [(date(2026, 1, 1) + timedelta(days=offset), 9.99) for offset in (0, 30, 45, 90, 95, 150)]
+    lapsed = [(date(2025, month, 10), 12.0) for month in range(1, 7)]
+
+    found = detect_series(
+        *_rows(("Gym", True, irregular), ("Hulu", True, lapsed)),
+        today=date(2026, 1, 1),
+    )
+
+    assert [(series.merchant, series.is_active) for series in found] == [("Hulu", False)]
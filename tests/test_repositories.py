@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.services.repositories import (
+    AccountBalanceSnapshotRepository,
+    HoldingRepository,
+    HoldingSnapshotRepository,
+    HoldingsDiff,
+    SecurityRepository,
+    TransactionRepository,
+    _batched_by_key,
+)
+from app.testing.synthetic import SyntheticInstitution
+
+
+def test_transaction_rows_normalize_and_skip_unknown_accounts():
+    institution = SyntheticInstitution(seed=4, accounts=2, transactions=10)
+    account_map = {institution.account_id(0): "account-0"}
+
+    rows = list(TransactionRepository._rows(institution.iter_transactions(), account_map))
+
+    assert rows and all(row["account_id"] == "account-0" for row in rows)
+    assert all(isinstance(row["amount"], Decimal) for row in rows)
+    assert len(rows) < 10
+
+
+def test_batched_by_key_keeps_last_duplicate_within_a_batch():
+    rows = [{"id": key, "version": version} for version, key in enumerate("abcab")]
+
+    batches = list(_batched_by_key(rows, "id", 3))
+
+    assert batches == [
+        [{"id": "a", "version": 0}, {"id": "b", "version": 1}, {"id": "c", "version": 2}],
+        [{"id": "a", "version": 3}, {"id": "b", "version": 4}],
+    ]
+
+
+def test_spend_deltas_reverse_the_previous_state_of_modified_rows():
+    def row(plaid_id, category, day, amount, account="account-1"):
+        return {
+            "plaid_transaction_id": plaid_id,
+            "account_id": account,
+            "canonical_category": category,
+            "date": day,
+            "amount": Decimal(amount),
+        }
+
+    batch = [
+        row("new", "FOOD_AND_DRINK", date(2026, 3, 4), "12.50"),
+        # Re-dated into the previous month and re-priced.
+        row("moved", "FOOD_AND_DRINK", date(2026, 2, 28), "30.00"),
+        # Previously removed: only the new state counts.
+        row("revived", "TRAVEL", date(2026, 3, 9), "200.00"),
+    ]
+    previous = {
+        "moved": SimpleNamespace(
+            account_id="account-1",
+            canonical_category="FOOD_AND_DRINK",
+            date=date(2026, 3, 1),
+            amount=Decimal("25.00"),
+            removed_at=None,
+        ),
+        "revived": SimpleNamespace(
+            account_id="account-1",
+            canonical_category="TRAVEL",
+            date=date(2026, 3, 9),
+            amount=Decimal("200.00"),
+            removed_at=date(2026, 3, 10),
+        ),
+    }
+
+    deltas = TransactionRepository._spend_deltas(batch, previous)
+
+    assert deltas == {
+        ("account-1", "FOOD_AND_DRINK", date(2026, 3, 1)): [Decimal("-12.50"), 0],
+        ("account-1", "FOOD_AND_DRINK", date(2026, 2, 1)): [Decimal("30.00"), 1],
+        ("account-1", "TRAVEL", date(2026, 3, 1)): [Decimal("200.00"), 1],
+    }
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    cache.invalidate(["a"])
+    assert cache.get("a") is None
+
+
+def test_security_upsert_skips_cached_unchanged_securities():
+    session = AsyncMock(spec=AsyncSession)
+    cache = LRUCache(maxsize=10)
+    cache.put("sec-1", ("uuid-1", Decimal("101.2500"), date(2026, 1, 2)))
+    repo = SecurityRepository(session, cache=cache)
+
+    mapping = asyncio.run(
+        repo.bulk_upsert(
+            [{"security_id": "sec-1", "close_price": 101.25, "close_price_as_of": "2026-01-02"}]
+        )
+    )
+
+    assert mapping == {"sec-1": "uuid-1"}
+    session.execute.assert_not_awaited()
+
+
+def test_holdings_sync_skips_unchanged_and_deletes_sold_positions():
+    account, held, sold, bought = (str(uuid.uuid4()) for _ in range(4))
+    current = {
+        "quantity": Decimal("10.00000000"),
+        "institution_value": Decimal("1000.0000"),
+        "institution_price": Decimal("100.00000000"),
+        "cost_basis": None,
+        "institution_price_as_of": date(2026, 1, 2),
+        "last_updated": None,
+    }
+    stale_id = uuid.uuid4()
+    rows = [
+        SimpleNamespace(id=uuid.uuid4(), account_id=account, security_id=held, _mapping=current),
+        SimpleNamespace(id=stale_id, account_id=account, security_id=sold, _mapping=current),
+    ]
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.side_effect = [rows, None, None]
+    payload = [
+        {
+            "account_id": "plaid-acct",
+            "security_id": security,
+            "quantity": 10,
+            "institution_value": 1000.0,
+            "institution_price": 100,
+            "institution_price_as_of": "2026-01-02",
+        }
+        for security in ("plaid-held", "plaid-bought")
+    ]
+
+    diff = asyncio.run(
+        HoldingRepository(session).sync(
+            payload,
+            account_ids=[account],
+            plaid_account_id_map={"plaid-acct": account},
+            plaid_security_id_map={"plaid-held": held, "plaid-bought": bought},
+        )
+    )
+
+    assert diff == HoldingsDiff(inserted=1, updated=0, deleted=1, unchanged=1)
+    upsert, delete = (call.args[0] for call in session.execute.await_args_list[1:])
+    written = upsert.compile(dialect=postgresql.dialect()).params
+    assert bought in written.values() and held not in written.values()
+    assert delete.compile().params["ids"] == [stale_id]
+
+
+def test_holding_snapshot_capture_zeroes_accounts_with_nothing_left():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = SimpleNamespace(rowcount=1)
+    account = str(uuid.uuid4())
+
+    repo = HoldingSnapshotRepository(session)
+    asyncio.run(repo.capture(account_ids=[account], as_of_date=date(2026, 10, 19)))
+
+    delete, capture = (call.args[0] for call in session.execute.await_args_list)
+    compiled = capture.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "UNION ALL" in sql and "NOT (EXISTS" in sql
+    # Sold-out accounts get one row with no security and a zero value.
+    assert "NULL" in sql.split("UNION ALL")[1]
+    assert compiled.params["param_1"] == compiled.params["param_2"] == 0
+    assert compiled.params["account_ids"] == [account]
+
+
+def test_account_balance_snapshot_capture_is_one_upsert_over_the_items_accounts():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = SimpleNamespace(rowcount=3)
+    item = str(uuid.uuid4())
+
+    repo = AccountBalanceSnapshotRepository(session)
+    assert asyncio.run(repo.capture(item_id=item, as_of_date=date(2026, 10, 19))) == 3
+
+    session.execute.assert_awaited_once()
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert sql.startswith("INSERT INTO account_balance_snapshots")
+    assert "SELECT gen_random_uuid()" in sql and "FROM accounts" in sql
+    assert "WHERE accounts.item_id = " in sql
+    assert "ON CONFLICT (account_id, as_of_date) DO UPDATE" in sql
+    assert compiled.params == {"as_of_date": date(2026, 10, 19), "item_id_1": item}
+
+
+def test_mark_removed_soft_deletes_a_page_and_reverses_its_spend():
+    session = AsyncMock(spec=AsyncSession)
+    repo = TransactionRepository(session)
+    repo.spend = AsyncMock()
+
+    asyncio.run(repo.mark_removed([]))
+    session.execute.assert_not_awaited()
+    repo.spend.apply.assert_not_awaited()
+
+    def removed(category, day, amount):
+        return SimpleNamespace(
+            account_id="account-1", canonical_category=category, date=day, amount=Decimal(amount)
+        )
+
+    session.execute.return_value = [
+        removed("TRAVEL", date(2026, 3, 9), "200.00"),
+        removed("TRAVEL", date(2026, 3, 20), "50.00"),
+        # Uncategorised rows have no spend counter to adjust.
+        removed(None, date(2026, 3, 1), "9.00"),
+    ]
+    asyncio.run(repo.mark_removed(["txn-1", "txn-2", "txn-3"]))
+
+    stmt = session.execute.await_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert session.execute.await_count == 1
+    assert sql.startswith("UPDATE transactions SET")
+    assert "transactions.plaid_transaction_id = ANY (%(ids)s::VARCHAR[])" in sql
+    assert "transactions.removed_at IS NULL" in sql
+    assert compiled.params["ids"] == ["txn-1", "txn-2", "txn-3"]
+    repo.spend.apply.assert_awaited_once_with(
+        {("account-1", "TRAVEL", date(2026, 3, 1)): [Decimal("-250.00"), -2]}
+    )
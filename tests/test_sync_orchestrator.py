@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import encrypt_string
+from app.core.settings import settings
+from app.services.plaid import SyncResult
 from app.services.sync import SyncOrchestrator
 from plaid.exceptions import ApiException
 
@@ -50,3 +54,60 @@ def test_fetch_investments_holdings_raises_for_unexpected_error():
 
     with pytest.raises(ApiException):
         asyncio.run(orchestrator._fetch_investments_holdings("item-123", "token"))
+
+
+def _page(cursor: str, has_more: bool = True) -> SyncResult:
+    return SyncResult(
+        added=[{"transaction_id": f"txn-{cursor}"}],
+        modified=[],
+        removed=[],
+        accounts=[],
+        next_cursor=cursor,
+        has_more=has_more,
+    )
+
+
+def test_run_item_sync_commits_chunks_and_resumes_after_mutation(monkeypatch):
+    monkeypatch.setattr(settings.scheduler, "sync_commit_every_pages", 2)
+    session = AsyncMock(spec=AsyncSession)
+    plaid_service = AsyncMock()
+    orchestrator = SyncOrchestrator(session, plaid=plaid_service)
+    for name in ("accounts", "items", "transactions", "securities", "holdings", "balance_snapshots"):
+        setattr(orchestrator, name, AsyncMock())
+    orchestrator.merchant_rules = AsyncMock()
+    orchestrator.merchant_rules.match_rules.return_value = ()
+    orchestrator.analytics = AsyncMock()
+    orchestrator.recurring = AsyncMock()
+    orchestrator._account_map = AsyncMock(return_value={})
+
+    mutation = ApiException(status=400, reason="TRANSACTIONS_ERROR")
+    mutation.body = json.dumps({"error_code": "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION"})
+    plaid_service.accounts_balance = AsyncMock(return_value={"accounts": []})
+    plaid_service.transactions_sync = AsyncMock(
+        side_effect=[_page("c1"), _page("c2"), _page("c3"), mutation, _page("c3"), _page("c4", False)]
+    )
+    plaid_service.investments_holdings = AsyncMock(return_value={"securities": [], "holdings": []})
+
+    item = SimpleNamespace(
+        id="item-1",
+        user_id="user-1",
+        cursor=None,
+        access_token_encrypted=encrypt_string("access-token"),
+    )
+    outcome = asyncio.run(orchestrator.run_item_sync(item))
+
+    # The chunk holding c3 is rolled back and refetched from the c2 checkpoint.
+    assert [call.args[1] for call in plaid_service.transactions_sync.await_args_list] == [
+        None,
+        "c1",
+        "c2",
+        "c3",
+        "c2",
+        "c3",
+    ]
+    assert [call.kwargs["cursor"] for call in orchestrator.items.save_cursor.await_args_list] == ["c2", "c4"]
+    assert outcome.transactions_synced == 4
+    session.rollback.assert_awaited_once()
+    assert session.expunge_all.call_count >= 3
+    # Every committed chunk moves the data version, so cached analytics never outlive it.
+    assert orchestrator.items.bump_data_version.await_count == session.commit.await_count == 3
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from app.testing.synthetic import SyntheticInstitution
+from benchmarks.harness import compare_reports, percentile
+from benchmarks.load import parse_mix
+
+
+def test_synthetic_institution_is_deterministic():
+    first = SyntheticInstitution(seed=7, accounts=3, transactions=25)
+    second = SyntheticInstitution(seed=7, accounts=3, transactions=25, end_date=first.end_date)
+
+    assert first.account_payloads() == second.account_payloads()
+    assert list(first.iter_transactions()) == list(second.iter_transactions())
+    assert [len(page) for page in first.transaction_pages(10)] == [10, 10, 5]
+
+
+def test_synthetic_transactions_reference_generated_accounts():
+    institution = SyntheticInstitution(seed=3, accounts=4, transactions=40)
+    account_ids = {account["account_id"] for account in institution.account_payloads()}
+
+    assert {txn["account_id"] for txn in institution.iter_transactions()} <= account_ids
+    assert institution.transaction(5, version=1)["transaction_id"] == institution.transaction_id(5)
+
+
+def test_percentile_and_regression_report():
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+    baseline = {"results": [{"name": "sync", "rows_per_sec": 1000.0}]}
+    current = {"results": [{"name": "sync", "rows_per_sec": 800.0}]}
+    assert compare_reports(baseline, current, tolerance=0.1)
+    assert not compare_reports(baseline, current, tolerance=0.25)
+
+
+def test_load_mix_parsing():
+    mix = parse_mix("transactions=5, holdings")
+    assert mix == {"transactions": 5, "holdings": 1}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("nope=1")
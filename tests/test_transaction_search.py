@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.transactions import _decode_cursor, _encode_cursor, _prefix_query
+
+
+def test_prefix_query_keeps_only_word_tokens():
+    assert _prefix_query("Whole  Fo") == "whole:* & fo:*"
+    assert _prefix_query("amazon's & (prime)") == "amazon:* & s:* & prime:*"
+    assert _prefix_query("!!") == ""
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    txn_id = uuid.uuid4()
+    cursor = _encode_cursor([0.6079, "2026-03-01", str(txn_id)])
+
+    assert _decode_cursor(cursor, "relevance") == [0.6079, date(2026, 3, 1), txn_id]
+    with pytest.raises(HTTPException):
+        _decode_cursor(cursor, "date")
+    with pytest.raises(HTTPException):
+        _decode_cursor("not-a-cursor", "date")